@@ -0,0 +1,103 @@
+"""
+Local Anthropic API Stub
+
+Minimal stand-in for POST /v1/messages so recommenders can be exercised
+without network access or an API key:
+
+    with AnthropicStub(delay=0.2) as stub:
+        recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url)
+
+Every request gets the same canned Claude response after ``delay`` seconds.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_TEXT = json.dumps({
+    "summary": "Stub: pause new initiatives and consolidate open threads",
+    "immediate_actions": ["Pause new initiatives for 48 hours"],
+    "this_week": ["Run a synthesis session"],
+    "avoid": ["Starting new projects"],
+    "success_criteria": ["Zc below 0.7 within a week"],
+    "context": "Canned response from the local Anthropic stub"
+})
+
+
+class AnthropicStub:
+    """Threaded HTTP server answering /v1/messages with a canned response"""
+
+    def __init__(self, text: str = DEFAULT_TEXT, delay: float = 0.0):
+        self.text = text
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+
+                with stub._lock:
+                    stub.requests += 1
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.delay)
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+                if self.path.rstrip("/") != "/v1/messages":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                body = json.dumps({
+                    "id": f"msg_stub_{stub.requests}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": request.get("model", "stub"),
+                    "content": [{"type": "text", "text": stub.text}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": 10, "output_tokens": 50}
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> "AnthropicStub":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "AnthropicStub":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
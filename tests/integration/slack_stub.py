@@ -0,0 +1,170 @@
+"""
+Local Slack Web API Stub
+
+Serves conversations.history from in-memory channels with real cursor
+pagination and optional rate limiting, so Slack collectors can be tested
+with a slack_sdk WebClient and no network access:
+
+    with SlackStub({"C1": timestamps}, rate_limit_first=1) as stub:
+        client = WebClient(token="xoxb-test", base_url=stub.url)
+
+Also usable without slack_sdk through ``FakeSlackClient``, which calls the
+same handler in-process.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+class SlackWorkspace:
+    """In-memory channel histories plus request bookkeeping"""
+
+    def __init__(self,
+                 channels: Dict[str, List[float]],
+                 rate_limit_first: int = 0,
+                 retry_after: int = 0,
+                 delay: float = 0.0):
+        """
+        Args:
+            channels: Message timestamps per channel ID
+            rate_limit_first: Answer this many first requests per channel with 429
+            retry_after: Retry-After value sent with 429 responses
+            delay: Seconds to sleep per request
+        """
+        self.channels = {cid: sorted(ts, reverse=True) for cid, ts in channels.items()}
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.delay = delay
+        self.requests: List[Dict] = []
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._seen: Dict[str, int] = {}
+
+    def history(self, params: Dict) -> Tuple[int, Dict, Dict]:
+        """Handle conversations.history; returns (status, headers, body)"""
+        channel = params.get("channel")
+        with self._lock:
+            self.requests.append(dict(params))
+            self._seen[channel] = self._seen.get(channel, 0) + 1
+            limited = self._seen[channel] <= self.rate_limit_first
+            if limited:
+                self.rate_limited += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        if limited:
+            return 429, {"Retry-After": str(self.retry_after)}, {"ok": False, "error": "ratelimited"}
+        if channel not in self.channels:
+            return 200, {}, {"ok": False, "error": "channel_not_found"}
+
+        oldest = float(params.get("oldest", 0))
+        latest = float(params.get("latest", "inf"))
+        limit = int(params.get("limit", 100))
+        offset = int(params.get("cursor") or 0)
+
+        # Slack timestamps have microsecond precision
+        matching = [ts for ts in (round(t, 6) for t in self.channels[channel])
+                    if oldest < ts < latest]
+        page = matching[offset:offset + limit]
+        has_more = offset + limit < len(matching)
+        body = {
+            "ok": True,
+            "messages": [{"type": "message", "ts": f"{ts:.6f}", "text": "..."} for ts in page],
+            "has_more": has_more,
+            "response_metadata": {"next_cursor": str(offset + limit) if has_more else ""},
+        }
+        return 200, {}, body
+
+
+class SlackStub:
+    """Threaded HTTP server exposing a SlackWorkspace at /api/"""
+
+    def __init__(self, channels: Dict[str, List[float]], **kwargs):
+        self.workspace = SlackWorkspace(channels, **kwargs)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def _handler(self):
+        workspace = self.workspace
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _respond(self, params: Dict):
+                if not self.path.startswith("/api/conversations.history"):
+                    status, headers, body = 200, {}, {"ok": False, "error": "unknown_method"}
+                else:
+                    status, headers, body = workspace.history(params)
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                self._respond({k: v[0] for k, v in query.items()})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode())
+                query = parse_qs(urlparse(self.path).query)
+                self._respond({k: v[0] for k, v in {**query, **form}.items()})
+
+        return Handler
+
+    def start(self) -> "SlackStub":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "SlackStub":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, headers: Dict):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class FakeSlackClient:
+    """In-process stand-in for WebClient.conversations_history"""
+
+    def __init__(self, workspace: SlackWorkspace, error_class):
+        self.workspace = workspace
+        self.error_class = error_class
+
+    def conversations_history(self, **kwargs) -> Dict:
+        params = {k: str(v) for k, v in kwargs.items() if v is not None}
+        status, headers, body = self.workspace.history(params)
+        if status != 200 or not body.get("ok"):
+            raise self.error_class(body.get("error", "error"), _FakeResponse(status, headers))
+        return body
@@ -0,0 +1,186 @@
+"""
+Integration Tests for the Async Recommender
+
+Runs AsyncCuratorRecommender against a local Anthropic stub server.
+
+Run with: pytest tests/integration/test_async_recommender.py
+"""
+
+import pytest
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import sys
+import os
+
+pytest.importorskip("anthropic")
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from anthropic_stub import AnthropicStub
+from cache import RecommendationCache
+from monitor import CuratorMonitor, TeamMetrics
+from recommender import AsyncCuratorRecommender, CuratorRecommender
+
+
+def red_result():
+    monitor = CuratorMonitor(team_size=5)
+    return monitor.calculate_zc(TeamMetrics(
+        timestamp=datetime.now().isoformat(),
+        slack_messages=400,
+        ai_outputs=100
+    ))
+
+
+def run_requests(recommender: AsyncCuratorRecommender, count: int, distinct: bool = False):
+    async def main():
+        try:
+            return await asyncio.gather(*[
+                recommender.generate_recommendation(
+                    red_result(), team_context=f"team {i}" if distinct else None
+                ) for i in range(count)
+            ])
+        finally:
+            await recommender.close()
+    return asyncio.run(main())
+
+
+class TestAsyncCuratorRecommender:
+    """Test the non-blocking recommender"""
+
+    def test_parses_stub_response(self):
+        """Test a full round trip through the async client"""
+        with AnthropicStub() as stub:
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url)
+            [rec] = run_requests(recommender, 1)
+
+        assert rec.summary.startswith("Stub:")
+        assert stub.requests == 1
+
+    def test_concurrency_is_bounded(self):
+        """Test that at most max_concurrency calls are in flight"""
+        with AnthropicStub(delay=0.2) as stub:
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url,
+                                                  max_concurrency=2)
+            start = time.monotonic()
+            recs = run_requests(recommender, 6, distinct=True)
+            elapsed = time.monotonic() - start
+
+        assert all(rec.summary.startswith("Stub:") for rec in recs)
+        assert stub.max_in_flight == 2
+        assert elapsed >= 0.6  # 6 requests, 2 at a time, 0.2s each
+
+    def test_timeout_returns_fallback(self):
+        """Test that slow calls are cut off and the rule-based advice is used"""
+        with AnthropicStub(delay=2.0) as stub:
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url,
+                                                  timeout_seconds=0.2)
+            start = time.monotonic()
+            [rec] = run_requests(recommender, 1)
+            elapsed = time.monotonic() - start
+
+        assert not rec.summary.startswith("Stub:")
+        assert rec.immediate_actions
+        assert elapsed < 1.5
+
+    def test_event_loop_not_blocked(self):
+        """Test that other coroutines run while a recommendation is pending"""
+        with AnthropicStub(delay=0.3) as stub:
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url)
+            ticks = []
+
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.02)
+
+            async def main():
+                try:
+                    await asyncio.gather(recommender.generate_recommendation(red_result()),
+                                         ticker())
+                finally:
+                    await recommender.close()
+
+            start = time.monotonic()
+            asyncio.run(main())
+
+        assert len(ticks) == 5
+        assert ticks[-1] - start < 0.3
+
+    def test_cache_skips_repeat_calls(self):
+        """Test that unchanged inputs are answered from the cache"""
+        with AnthropicStub() as stub:
+            cache = RecommendationCache()
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url,
+                                                  cache=cache)
+            first = run_requests(recommender, 1)[0]
+
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url,
+                                                  cache=cache)
+            second = run_requests(recommender, 1)[0]
+
+        assert stub.requests == 1
+        assert second == first
+        assert cache.stats()["hits"] == 1
+
+    def test_fallback_not_cached(self):
+        """Test that a timed-out call is retried next time"""
+        with AnthropicStub(delay=1.0) as stub:
+            cache = RecommendationCache()
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url,
+                                                  cache=cache, timeout_seconds=0.1)
+            run_requests(recommender, 1)
+
+        assert len(cache) == 0
+
+    def test_identical_requests_coalesced(self):
+        """Test that concurrent identical requests share one Claude call"""
+        with AnthropicStub(delay=0.2) as stub:
+            recommender = AsyncCuratorRecommender(api_key="test", base_url=stub.url)
+            recs = run_requests(recommender, 5)
+
+        assert stub.requests == 1
+        assert all(rec == recs[0] for rec in recs)
+        assert recommender.stats()["calls"]["coalesced"] == 4
+
+    def test_invalid_concurrency(self):
+        """Test that max_concurrency must be positive"""
+        with pytest.raises(ValueError):
+            AsyncCuratorRecommender(api_key="test", max_concurrency=0)
+
+
+class TestCuratorRecommender:
+    """Test caching and coalescing on the synchronous recommender"""
+
+    def test_cache_skips_repeat_calls(self):
+        """Test that repeated requests reuse the cached recommendation"""
+        with AnthropicStub() as stub:
+            recommender = CuratorRecommender(api_key="test", base_url=stub.url,
+                                             cache=RecommendationCache())
+            result = red_result()
+            first = recommender.generate_recommendation(result, team_context="startup")
+            second = recommender.generate_recommendation(result, team_context="startup")
+            recommender.generate_recommendation(result, team_context="agency")
+
+        assert first == second
+        assert stub.requests == 2
+
+    def test_identical_threads_coalesced(self):
+        """Test that concurrent identical requests from threads share one call"""
+        with AnthropicStub(delay=0.2) as stub:
+            recommender = CuratorRecommender(api_key="test", base_url=stub.url)
+            result = red_result()
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                recs = list(pool.map(lambda _: recommender.generate_recommendation(result),
+                                     range(4)))
+
+        assert stub.requests == 1
+        assert all(rec.summary.startswith("Stub:") for rec in recs)
+        assert recommender.stats()["calls"]["coalesced"] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,155 @@
+"""
+Integration Tests for the Discord Message Counter
+
+Drives DiscordMessageCounter with fake channels/messages shaped like
+discord.py objects (no Discord connection needed).
+
+Run with: pytest tests/integration/test_discord_counter.py
+"""
+
+import pytest
+import asyncio
+import itertools
+import time
+from datetime import datetime, timezone
+import sys
+import os
+
+# Add discord integration to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/integrations/discord'))
+
+from counter import DiscordMessageCounter
+
+_ids = itertools.count(1)
+
+
+class FakeMessage:
+    def __init__(self, channel, ts: float):
+        self.id = next(_ids)
+        self.channel = channel
+        self.created_at = datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+class FakeChannel:
+    """Channel with a message list and history() like discord.py"""
+
+    def __init__(self, channel_id: int):
+        self.id = channel_id
+        self.messages = []
+        self.history_calls = []
+
+    def post(self, ts: float) -> FakeMessage:
+        message = FakeMessage(self, ts)
+        self.messages.append(message)
+        return message
+
+    async def history(self, after=None, before=None, limit=None):
+        self.history_calls.append((after, before))
+        for message in sorted(self.messages, key=lambda m: m.created_at):
+            if after and message.created_at <= after:
+                continue
+            if before and message.created_at >= before:
+                continue
+            await asyncio.sleep(0)
+            yield message
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestDiscordMessageCounter:
+    """Test live counting, backfill and gap repair"""
+
+    def test_backfill_then_live(self):
+        """Test that history is read once and live messages are counted"""
+        now = time.time()
+        channel = FakeChannel(1)
+        for i in range(200):
+            channel.post(now - 600 - i * 60)       # 200 messages in the last ~4h
+        channel.post(now - 30 * 3600)              # Outside the 24h window
+
+        counter = DiscordMessageCounter()
+        counter.mark_connected()
+        assert run(counter.backfill(channel)) == 200
+
+        for _ in range(5):
+            counter.record(channel.post(time.time()))
+
+        assert counter.count(1) == 205
+        assert run(counter.backfill(channel)) == 0
+        assert len(channel.history_calls) == 1
+
+    def test_live_messages_before_backfill_not_double_counted(self):
+        """Test that backfill stops where live counting started"""
+        counter = DiscordMessageCounter()
+        channel = FakeChannel(1)
+        channel.post(time.time() - 3600)
+        counter.mark_connected()
+
+        counter.record(channel.post(time.time()))
+        run(counter.backfill(channel))
+
+        assert counter.count(1) == 2
+        _, before = channel.history_calls[0]
+        assert before is not None
+
+    def test_duplicate_delivery_ignored(self):
+        """Test that the same message is only counted once"""
+        counter = DiscordMessageCounter()
+        counter.mark_connected()
+        message = FakeChannel(1).post(time.time())
+
+        assert counter.record(message)
+        assert not counter.record(message)
+        assert counter.count(1) == 1
+
+    def test_gap_repair_after_reconnect(self):
+        """Test that messages sent while disconnected are recovered"""
+        counter = DiscordMessageCounter()
+        channel = FakeChannel(1)
+        counter.mark_connected()
+        run(counter.backfill(channel))
+        counter.record(channel.post(time.time() - 10))
+
+        counter.mark_disconnected()
+        for _ in range(3):
+            channel.post(time.time() - 5)              # Missed while offline
+        counter.record(channel.post(time.time()))      # Live again before repair
+
+        assert counter.count(1) == 2
+        assert run(counter.repair({1: channel}.get)) == 3
+        assert counter.count(1) == 5
+        assert run(counter.repair({1: channel}.get)) == 0
+
+    def test_channels_counted_separately(self):
+        """Test per-channel counts"""
+        counter = DiscordMessageCounter()
+        counter.mark_connected()
+        a, b = FakeChannel(1), FakeChannel(2)
+        for _ in range(3):
+            counter.record(a.post(time.time()))
+        counter.record(b.post(time.time()))
+
+        assert counter.count(1) == 3
+        assert counter.count(2) == 1
+
+    def test_wider_window_backfills_older_part_only(self):
+        """Test that a larger window reads only the uncovered history"""
+        now = time.time()
+        channel = FakeChannel(1)
+        channel.post(now - 2 * 3600)
+        channel.post(now - 30 * 3600)
+        counter = DiscordMessageCounter()
+        counter.mark_connected()
+
+        run(counter.backfill(channel, hours=24))
+        assert counter.count(1, hours=48) == 1
+        assert not counter.covers(1, hours=48)
+
+        assert run(counter.backfill(channel, hours=48)) == 1
+        assert counter.count(1, hours=48) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,183 @@
+"""
+Integration Tests for the Slack Channel Collector
+
+Runs SlackChannelCollector against an in-process fake client and, when
+slack_sdk is installed, a real WebClient talking to a local Slack stub.
+
+Run with: pytest tests/integration/test_slack_collector.py
+"""
+
+import pytest
+import time
+import sys
+import os
+
+# Add slack integration to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/integrations/slack'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import collector
+from collector import IncrementalSlackCollector, SlackApiError, SlackChannelCollector
+from slack_stub import FakeSlackClient, SlackStub, SlackWorkspace
+
+
+def recent(count: int, spacing: float = 10.0):
+    """Message timestamps over the last few hours"""
+    now = time.time()
+    return [now - 60 - i * spacing for i in range(count)]
+
+
+def fake_collector(channels, cls=SlackChannelCollector, **kwargs):
+    workspace = SlackWorkspace(channels, **{k: kwargs.pop(k) for k in list(kwargs)
+                                            if k in ("rate_limit_first", "retry_after", "delay")})
+    sleeps = []
+    return cls(FakeSlackClient(workspace, SlackApiError),
+               sleep=sleeps.append, **kwargs), workspace, sleeps
+
+
+class TestSlackChannelCollector:
+    """Test pagination, concurrency and rate limiting"""
+
+    def test_follows_pagination(self):
+        """Test that every page is counted, not just the first"""
+        coll, workspace, _ = fake_collector({"C1": recent(2500)})
+
+        assert coll.count_messages("C1", oldest=time.time() - 86400) == 2500
+        assert len(workspace.requests) == 3  # 999 + 999 + 502
+
+    def test_window_respected(self):
+        """Test that messages older than the window are excluded"""
+        now = time.time()
+        coll, _, _ = fake_collector({"C1": [now - 3600, now - 7200, now - 90000]})
+
+        assert coll.collect(["C1"], hours=24) == {"C1": 2}
+
+    def test_rate_limit_retry_after(self):
+        """Test that 429 responses are retried after Retry-After seconds"""
+        coll, workspace, sleeps = fake_collector({"C1": recent(10)},
+                                                 rate_limit_first=2, retry_after=3)
+
+        assert coll.collect(["C1"]) == {"C1": 10}
+        assert sleeps == [3.0, 3.0]
+        assert workspace.rate_limited == 2
+
+    def test_rate_limit_gives_up(self):
+        """Test that a channel is skipped after max_retries"""
+        coll, _, _ = fake_collector({"C1": recent(10), "C2": recent(5)},
+                                    rate_limit_first=10, max_retries=2)
+
+        assert coll.collect(["C1", "C2"]) == {}
+
+    def test_failed_channel_skipped(self):
+        """Test that one bad channel doesn't fail the collection"""
+        coll, _, _ = fake_collector({"C1": recent(10)})
+
+        assert coll.collect(["C1", "C404"]) == {"C1": 10}
+
+    def test_channels_fetched_concurrently(self):
+        """Test that channels are fetched in parallel, bounded by max_workers"""
+        channels = {f"C{i}": recent(5) for i in range(12)}
+        coll, workspace, _ = fake_collector(channels, delay=0.05, max_workers=4)
+
+        start = time.monotonic()
+        counts = coll.collect(list(channels))
+        elapsed = time.monotonic() - start
+
+        assert counts == {cid: 5 for cid in channels}
+        assert workspace.max_in_flight == 4
+        assert elapsed < 12 * 0.05
+
+    def test_requests_large_pages_without_metadata(self):
+        """Test the request parameters sent to Slack"""
+        coll, workspace, _ = fake_collector({"C1": recent(1)})
+        coll.collect(["C1"])
+
+        request = workspace.requests[0]
+        assert request["limit"] == str(collector.PAGE_LIMIT)
+        assert request["include_all_metadata"] == "False"
+
+
+class TestIncrementalSlackCollector:
+    """Test high-water-mark polling"""
+
+    def test_second_poll_fetches_only_new_messages(self):
+        """Test that a poll after the first one transfers only new messages"""
+        coll, workspace, _ = fake_collector({"C1": recent(2500)}, cls=IncrementalSlackCollector)
+
+        assert coll.collect(["C1"]) == {"C1": 2500}
+        first_poll = len(workspace.requests)
+
+        workspace.channels["C1"].insert(0, time.time() - 1)
+        assert coll.collect(["C1"]) == {"C1": 2501}
+
+        assert len(workspace.requests) == first_poll + 1
+        assert float(workspace.requests[-1]["oldest"]) == pytest.approx(
+            max(workspace.channels["C1"][1:]))
+
+    def test_matches_full_collector(self):
+        """Test that incremental counts equal a full re-count"""
+        channels = {f"C{i}": recent(300 * (i + 1), spacing=15) for i in range(4)}  # All within 6h
+        incremental, workspace, _ = fake_collector(channels, cls=IncrementalSlackCollector,
+                                                   bucket_seconds=1)
+        full = SlackChannelCollector(FakeSlackClient(workspace, SlackApiError))
+
+        incremental.collect(list(channels), hours=6)
+        for cid in channels:
+            workspace.channels[cid].insert(0, time.time() - 0.5)
+
+        assert incremental.collect(list(channels), hours=6) == full.collect(list(channels), hours=6)
+
+    def test_wider_window_refetches(self):
+        """Test that a window larger than the covered range triggers a backfill"""
+        now = time.time()
+        coll, _, _ = fake_collector({"C1": [now - 3600, now - 30 * 3600]},
+                                    cls=IncrementalSlackCollector)
+
+        assert coll.collect(["C1"], hours=24) == {"C1": 1}
+        assert coll.collect(["C1"], hours=48) == {"C1": 2}
+
+    def test_state_persisted(self, tmp_path):
+        """Test that a restarted collector resumes from the saved high-water mark"""
+        path = str(tmp_path / "slack_counts.json")
+        channels = {"C1": recent(1200)}
+        coll, _, _ = fake_collector(channels, cls=IncrementalSlackCollector, state_path=path)
+        coll.collect(["C1"])
+
+        restarted, workspace, _ = fake_collector(channels, cls=IncrementalSlackCollector,
+                                                 state_path=path)
+
+        assert restarted.collect(["C1"]) == {"C1": 1200}
+        assert len(workspace.requests) == 1
+        assert workspace.requests[0]["oldest"] != ""
+
+    def test_failed_refresh_keeps_state(self):
+        """Test that a rate-limited poll doesn't lose existing counts"""
+        coll, workspace, _ = fake_collector({"C1": recent(10)}, cls=IncrementalSlackCollector,
+                                            max_retries=0)
+        coll.collect(["C1"])
+
+        workspace.rate_limit_first = 10
+        assert coll.collect(["C1"]) == {}
+        workspace.rate_limit_first = 0
+        workspace._seen.clear()
+        assert coll.collect(["C1"]) == {"C1": 10}
+
+
+class TestWebClientAgainstStub:
+    """Test the collector with a real slack_sdk WebClient"""
+
+    def test_paginated_rate_limited_collection(self):
+        """Test a full round trip over HTTP"""
+        slack_sdk = pytest.importorskip("slack_sdk")
+
+        channels = {"C1": recent(1500), "C2": recent(20)}
+        with SlackStub(channels, rate_limit_first=1, retry_after=0) as stub:
+            client = slack_sdk.WebClient(token="xoxb-test", base_url=stub.url)
+            counts = SlackChannelCollector(client, max_workers=2).collect(["C1", "C2"])
+
+        assert counts == {"C1": 1500, "C2": 20}
+        assert stub.workspace.rate_limited == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+Unit Tests for Curator AI Streaming Aggregates
+
+Run with: pytest tests/unit/test_aggregates.py
+"""
+
+import pytest
+import random
+from datetime import datetime
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from aggregates import ZcAggregates
+from monitor import CuratorMonitor, TeamMetrics
+
+
+def zone_for(zc: float) -> str:
+    if zc < 0.7:
+        return "GREEN"
+    elif zc < 1.0:
+        return "YELLOW"
+    return "RED"
+
+
+class TestZcAggregates:
+    """Test bucketed running totals"""
+
+    def test_matches_full_scan(self):
+        """Test that windowed summaries equal a brute-force scan"""
+        rng = random.Random(7)
+        agg = ZcAggregates(bucket_seconds=60, retention_hours=None)
+        now = 1_700_000_000
+        samples = []
+
+        for i in range(2000):
+            ts = now - (2000 - i) * 300  # One sample every 5 minutes
+            zc = round(rng.uniform(0.2, 1.4), 2)
+            samples.append((ts, zc, zone_for(zc)))
+            agg.add(ts, zc, zone_for(zc))
+
+        for hours in (1, 24, 72, 168):
+            cutoff_bucket = (now - hours * 3600) // 60
+            window = [s for s in samples if s[0] // 60 >= cutoff_bucket]
+            summary = agg.summary(hours=hours, now=now)
+
+            assert summary["count"] == len(window)
+            assert summary["avg_zc"] == pytest.approx(sum(s[1] for s in window) / len(window))
+            for zone in ("GREEN", "YELLOW", "RED"):
+                assert summary["zone_distribution"][zone] == sum(1 for s in window if s[2] == zone)
+
+    def test_retention_evicts_old_buckets(self):
+        """Test that evicted buckets no longer count toward any window"""
+        agg = ZcAggregates(bucket_seconds=3600, retention_hours=24)
+        now = 1_700_000_000
+
+        for i in range(100):
+            agg.add(now - (100 - i) * 3600, 0.5, "GREEN")
+
+        assert agg.summary(hours=1000, now=now)["count"] == 25
+
+    def test_out_of_order_sample(self):
+        """Test that late samples land in the right bucket"""
+        agg = ZcAggregates(bucket_seconds=60, retention_hours=None)
+        now = 1_700_000_000
+
+        agg.add(now - 60, 0.5, "GREEN")
+        agg.add(now, 1.2, "RED")
+        agg.add(now - 3600, 0.8, "YELLOW")
+
+        assert agg.summary(hours=0.5, now=now)["count"] == 2
+        assert agg.summary(hours=2, now=now)["zone_distribution"]["YELLOW"] == 1
+
+    def test_empty_window(self):
+        """Test summaries when nothing was recorded"""
+        summary = ZcAggregates().summary(hours=168)
+
+        assert summary["count"] == 0
+        assert summary["avg_zc"] == 0.0
+
+
+class TestMonitorSummary:
+    """Test CuratorMonitor.get_summary"""
+
+    def test_summary_tracks_calculations(self):
+        """Test that each calculation updates the summary"""
+        monitor = CuratorMonitor(team_size=10)
+
+        for messages in (100, 300, 1000):
+            monitor.calculate_zc(TeamMetrics(
+                timestamp=datetime.now().isoformat(),
+                slack_messages=messages
+            ), timeframe_hours=24)
+
+        summary = monitor.get_summary(hours=168)
+        history = monitor.get_history(hours=168)
+
+        assert summary["count"] == 3
+        assert summary["avg_zc"] == pytest.approx(sum(r.zc for r in history) / 3)
+        assert summary["zone_distribution"]["RED"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""
+Unit Tests for Curator AI Batch Zc Computation
+
+Run with: pytest tests/unit/test_batch.py
+"""
+
+import pytest
+import random
+from datetime import datetime
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+import batch
+from batch import calculate_zc_batch
+from history import to_epoch
+from monitor import CuratorMonitor, TeamMetrics
+
+
+def random_rows(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    return {
+        "slack_messages": [rng.randint(0, 400) for _ in range(n)],
+        "notion_updates": [rng.randint(0, 60) for _ in range(n)],
+        "ai_outputs": [rng.randint(0, 80) for _ in range(n)],
+    }
+
+
+def scalar_results(columns, team_size=10, timeframe_hours=24):
+    """Run the same rows through CuratorMonitor one at a time"""
+    monitor = CuratorMonitor(team_size=team_size)
+    results = []
+    for i in range(len(columns["slack_messages"])):
+        results.append(monitor.calculate_zc(TeamMetrics(
+            timestamp=datetime.now().isoformat(),
+            **{name: values[i] for name, values in columns.items()}
+        ), timeframe_hours=timeframe_hours))
+    return results
+
+
+class TestBatchCalculation:
+    """Test calculate_zc_batch"""
+
+    def test_matches_scalar_path(self):
+        """Test that every column equals the scalar CuratorMonitor output"""
+        columns = random_rows(300)
+        expected = scalar_results(columns)
+
+        result = calculate_zc_batch(columns, team_sizes=10, timeframe_hours=24,
+                                    timestamps=[to_epoch(r.timestamp) for r in expected])
+
+        assert len(result) == 300
+        for row, exp in zip(result.rows(), expected):
+            assert row["zc"] == exp.zc
+            assert row["v_generation"] == exp.v_generation
+            assert row["b_social"] == exp.b_social
+            assert row["zone"] == exp.zone
+            assert row["mode"] == exp.mode
+            assert row["trend"] == exp.trend
+            assert row["confidence"] == exp.confidence
+
+    def test_trend_is_per_team(self):
+        """Test that trend never looks across team boundaries"""
+        columns = {"total_items": [100, 200, 300, 400, 100, 200, 300, 400]}
+        team_ids = ["a"] * 4 + ["b"] * 4
+
+        result = calculate_zc_batch(columns, team_sizes=10, team_ids=team_ids)
+
+        assert list(result.trend) == ["STABLE"] * 2 + ["INCREASING"] * 2 + ["STABLE"] * 2 + ["INCREASING"] * 2
+
+    def test_per_row_team_size_and_timeframe(self):
+        """Test column-valued team sizes and timeframes"""
+        result = calculate_zc_batch({"total_items": [240, 240]},
+                                    team_sizes=[10, 5], timeframe_hours=[24, 12])
+
+        # 240/24 / 30 = 0.33 and 240/12 / (5*3*24/12) = 0.67
+        assert list(result.zc) == [0.33, 0.67]
+
+    def test_zero_b_social_raises_error(self):
+        """Test that B_social <= 0 raises ValueError like the scalar path"""
+        with pytest.raises(ValueError):
+            calculate_zc_batch({"slack_messages": [100]}, team_sizes=0)
+
+    def test_unknown_column_rejected(self):
+        """Test that typos in column names are not silently ignored"""
+        with pytest.raises(ValueError):
+            calculate_zc_batch({"slack_msgs": [100]}, team_sizes=10)
+
+    def test_monitor_batch_uses_monitor_settings(self):
+        """Test CuratorMonitor.calculate_zc_batch defaults"""
+        monitor = CuratorMonitor(team_size=5, processing_hours_per_person=2.0)
+
+        result = monitor.calculate_zc_batch({"slack_messages": [300], "ai_outputs": [50]})
+
+        assert result.zone[0] == "RED"
+        assert len(monitor.history) == 0
+
+    @pytest.mark.skipif(not batch.NUMPY_AVAILABLE, reason="NumPy not installed")
+    def test_numpy_and_python_paths_agree(self, monkeypatch):
+        """Test that the fallback path produces identical columns"""
+        columns = random_rows(500, seed=11)
+        team_ids = [i // 50 for i in range(500)]
+        vectorized = calculate_zc_batch(columns, team_sizes=8, team_ids=team_ids)
+
+        monkeypatch.setattr(batch, "NUMPY_AVAILABLE", False)
+        fallback = calculate_zc_batch(columns, team_sizes=8, team_ids=team_ids)
+
+        assert list(vectorized.rows()) == list(fallback.rows())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,165 @@
+"""
+Unit Tests for Curator AI Recommendation Cache
+
+Run with: pytest tests/unit/test_cache.py
+"""
+
+import pytest
+from datetime import datetime
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+import cache as cache_module
+from cache import RecommendationCache, recommendation_key
+from monitor import CuratorMonitor, TeamMetrics
+
+
+def results(*messages):
+    monitor = CuratorMonitor(team_size=10)
+    return [monitor.calculate_zc(TeamMetrics(
+        timestamp=datetime.now().isoformat(),
+        slack_messages=m
+    )) for m in messages]
+
+
+VALUE = {"summary": "Hold a GUSH session", "immediate_actions": ["Schedule it"]}
+
+
+class TestRecommendationKey:
+    """Test key normalization"""
+
+    def test_nearby_zc_shares_key(self):
+        """Test that small Zc changes within the same zone reuse the entry"""
+        a, b = results(300, 301)  # Zc 1.0 and 1.0033
+
+        assert recommendation_key(a) == recommendation_key(b)
+
+    def test_zone_change_changes_key(self):
+        """Test that crossing a zone boundary is never served from cache"""
+        [a] = results(300)
+        [b] = results(300)
+        b.zone = "YELLOW"
+
+        assert recommendation_key(a) != recommendation_key(b)
+
+    def test_context_whitespace_normalized(self):
+        """Test that reformatted team context hits the same entry"""
+        [a] = results(300)
+
+        assert recommendation_key(a, "10-person  startup\n remote") == \
+            recommendation_key(a, "10-person startup remote")
+        assert recommendation_key(a, "startup") != recommendation_key(a, "agency")
+
+    def test_history_digest(self):
+        """Test that only the last 7 history entries matter"""
+        history = results(*range(100, 1000, 100))
+        [current] = results(300)
+
+        assert recommendation_key(current, history=history) == \
+            recommendation_key(current, history=history[-7:])
+        assert recommendation_key(current, history=history) != \
+            recommendation_key(current, history=history[:-1])
+
+
+class TestRecommendationCache:
+    """Test TTL, LRU and disk tier"""
+
+    def test_hit_and_miss(self):
+        """Test basic lookups and counters"""
+        cache = RecommendationCache()
+
+        assert cache.get("k") is None
+        cache.put("k", VALUE)
+
+        assert cache.get("k") == VALUE
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_values_are_copied(self):
+        """Test that mutating a returned value doesn't corrupt the cache"""
+        cache = RecommendationCache()
+        cache.put("k", VALUE)
+
+        cache.get("k")["immediate_actions"].append("Oops")
+
+        assert cache.get("k") == VALUE
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test that entries expire after ttl_seconds"""
+        clock = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: clock[0])
+        cache = RecommendationCache(ttl_seconds=60)
+        cache.put("k", VALUE)
+
+        clock[0] += 59
+        assert cache.get("k") == VALUE
+        clock[0] += 2
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted"""
+        cache = RecommendationCache(max_entries=2)
+        cache.put("a", VALUE)
+        cache.put("b", VALUE)
+        cache.get("a")
+        cache.put("c", VALUE)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == VALUE
+        assert cache.stats()["evictions"] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test that a new cache instance reads entries written to disk"""
+        RecommendationCache(disk_dir=str(tmp_path)).put("k", VALUE)
+
+        restarted = RecommendationCache(disk_dir=str(tmp_path))
+
+        assert restarted.get("k") == VALUE
+        assert restarted.stats()["disk_hits"] == 1
+        assert len(restarted) == 1
+
+    def test_disk_tier_respects_ttl(self, tmp_path, monkeypatch):
+        """Test that expired disk entries are ignored and removed"""
+        clock = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: clock[0])
+        RecommendationCache(ttl_seconds=60, disk_dir=str(tmp_path)).put("k", VALUE)
+
+        clock[0] += 120
+        assert RecommendationCache(ttl_seconds=60, disk_dir=str(tmp_path)).get("k") is None
+        assert not list(tmp_path.iterdir())
+
+    def test_disk_hits_are_copied(self, tmp_path):
+        """Test that a value read from disk can't be mutated inside the cache"""
+        RecommendationCache(disk_dir=str(tmp_path)).put("k", VALUE)
+        restarted = RecommendationCache(disk_dir=str(tmp_path))
+
+        restarted.get("k")["immediate_actions"].append("Oops")
+
+        assert restarted.get("k") == VALUE
+
+    def test_disk_tier_is_pruned(self, tmp_path, monkeypatch):
+        """Test that expired and excess files are deleted without being read"""
+        clock = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: clock[0])
+        cache = RecommendationCache(ttl_seconds=60, disk_dir=str(tmp_path),
+                                    max_disk_entries=3, prune_interval=10)
+        for i in range(5):
+            cache.put(f"old{i}", VALUE)
+            clock[0] += 1
+
+        clock[0] += 100
+        cache.put("new", VALUE)
+        assert [p.name for p in tmp_path.iterdir()] == ["new.json"]
+
+        for i in range(5):
+            clock[0] += 11
+            cache.put(f"k{i}", VALUE)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["k2.json", "k3.json", "k4.json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,149 @@
+"""
+Unit Tests for Curator AI Contribution Log
+
+Run with: pytest tests/unit/test_contribution_log.py
+"""
+
+import pytest
+import os
+import sys
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from contribution_log import HEADER, ContributionLog, rebuild_ideas
+
+
+def fill(log, n, start=0):
+    for i in range(start, start + n):
+        log.append(f"user{i % 3}", f"idea-{i % 7}", {"i": i}, timestamp=1000.0 + i)
+
+
+def segment_files(path, suffix=".log"):
+    return sorted(name for name in os.listdir(path) if name.endswith(suffix))
+
+
+class TestAppendReplay:
+    """Test the write and read paths"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that replay returns what was appended, in order"""
+        with ContributionLog(str(tmp_path)) as log:
+            assert log.append("alice", "Use SQL", {"channel": "db"}, timestamp=5.0) == 0
+            assert log.append("bob", "Use NoSQL ✓") == 1
+
+            first, second = list(log.replay())
+            assert (first.seq, first.author, first.idea, first.context, first.timestamp) == \
+                (0, "alice", "Use SQL", {"channel": "db"}, 5.0)
+            assert (second.seq, second.idea, second.context) == (1, "Use NoSQL ✓", {})
+
+    def test_segments_roll_and_survive_reopen(self, tmp_path):
+        """Test rotation, sealed indexes and sequence numbers across segments"""
+        with ContributionLog(str(tmp_path), segment_bytes=2000) as log:
+            fill(log, 200)
+        assert len(segment_files(tmp_path)) > 5
+        assert len(segment_files(tmp_path, ".idx")) == len(segment_files(tmp_path)) - 1
+
+        with ContributionLog(str(tmp_path), segment_bytes=2000) as log:
+            assert len(log) == 200
+            fill(log, 10, start=200)
+            replayed = list(log.replay())
+        assert [c.seq for c in replayed] == list(range(210))
+        assert [c.context["i"] for c in replayed] == list(range(210))
+
+    def test_raw_replay_is_zero_copy(self, tmp_path):
+        """Test that raw payloads are views into the mapped segment"""
+        with ContributionLog(str(tmp_path)) as log:
+            fill(log, 3)
+            views = [(seq, payload) for seq, _, payload in log.replay_raw()]
+
+        assert [seq for seq, _ in views] == [0, 1, 2]
+        assert all(isinstance(payload, memoryview) for _, payload in views)
+        # Released once the iteration moved on
+        with pytest.raises(ValueError):
+            bytes(views[0][1])
+
+    def test_abandoned_replay_releases_map(self, tmp_path):
+        """Test that breaking out of a replay doesn't leak exported buffers"""
+        with ContributionLog(str(tmp_path)) as log:
+            fill(log, 10)
+            for _ in log.replay_raw():
+                break
+            assert len(list(log.replay())) == 10
+
+
+class TestSeek:
+    """Test timestamp seeks through the sparse index"""
+
+    def test_since_matches_full_scan(self, tmp_path):
+        """Test that indexed replay gives the filtered full replay"""
+        with ContributionLog(str(tmp_path), segment_bytes=5000, index_interval=200) as log:
+            fill(log, 500)
+            for since in [0.0, 1000.0, 1123.5, 1250.0, 1499.0, 2000.0]:
+                expected = [c.seq for c in log.replay() if c.timestamp >= since]
+                assert [c.seq for c in log.replay(since=since)] == expected
+
+    def test_out_of_order_timestamps(self, tmp_path):
+        """Test that late records behind a newer one are not skipped"""
+        with ContributionLog(str(tmp_path), index_interval=1) as log:
+            for ts in [1.0, 5.0, 2.0, 3.0, 6.0, 4.0]:
+                log.append("a", f"t{ts}", timestamp=ts)
+            assert [c.timestamp for c in log.replay(since=3.0)] == [5.0, 3.0, 6.0, 4.0]
+
+
+class TestDurability:
+    """Test syncing and crash recovery"""
+
+    def test_sync_batching(self, tmp_path):
+        """Test that appends are fsync'd every sync_every records"""
+        log = ContributionLog(str(tmp_path), sync_every=4, sync_interval=3600)
+        fill(log, 6)
+        assert log._pending == 2
+        log.sync()
+        assert log._pending == 0
+        log.close()
+
+    def test_torn_tail_truncated(self, tmp_path):
+        """Test that a partial last record is dropped on open"""
+        with ContributionLog(str(tmp_path)) as log:
+            fill(log, 5)
+        path = tmp_path / segment_files(tmp_path)[-1]
+        size = path.stat().st_size
+        with open(path, "ab") as f:
+            f.write(HEADER.pack(100, 0, 0.0) + b"{\"author\"")
+
+        with ContributionLog(str(tmp_path)) as log:
+            assert len(log) == 5
+            assert path.stat().st_size == size
+            assert log.append("a", "next") == 5
+            assert len(list(log.replay())) == 6
+
+    def test_corrupt_record_detected(self, tmp_path):
+        """Test that a flipped byte in a sealed segment raises"""
+        with ContributionLog(str(tmp_path), segment_bytes=500) as log:
+            fill(log, 20)
+        path = tmp_path / segment_files(tmp_path)[0]
+        data = bytearray(path.read_bytes())
+        data[HEADER.size + 2] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with ContributionLog(str(tmp_path), segment_bytes=500) as log:
+            with pytest.raises(ValueError, match="Corrupt record"):
+                list(log.replay())
+
+
+class TestRebuild:
+    """Test rebuilding CRDT state"""
+
+    def test_rebuild_ideas(self, tmp_path):
+        """Test that the idea repository holds every distinct idea"""
+        with ContributionLog(str(tmp_path)) as log:
+            fill(log, 50)
+            repository = rebuild_ideas(log, replica_id="curator")
+
+        assert repository.ideas == {f"idea-{i}" for i in range(7)}
+        assert repository.replica_id == "curator"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Unit Tests for Curator AI Convergence Detection
+
+Run with: pytest tests/unit/test_convergence.py
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from convergence import (ConvergenceIndex, HashingEmbedder, UnionFind, cosine,
+                         detect_convergence)
+
+
+def synthetic_ideas(n, seed=1, vocabulary=2000):
+    """Random word ideas, 30% of them one-word edits of an earlier idea"""
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    ideas = []
+    for i in range(n):
+        if ideas and rng.random() < 0.3:
+            base = rng.choice(ideas)[1].split()
+            base[rng.randrange(len(base))] = rng.choice(words)
+            ideas.append((i, " ".join(base)))
+        else:
+            ideas.append((i, " ".join(rng.choice(words) for _ in range(rng.randint(6, 14)))))
+    return ideas
+
+
+class TestHashingEmbedder:
+    """Test the offline embedding"""
+
+    def test_normalized_and_deterministic(self):
+        """Test unit length and identical vectors for identical text"""
+        embedder = HashingEmbedder()
+        a = embedder.embed("Async standups for the remote team")
+
+        assert sum(w * w for w in a.values()) == pytest.approx(1.0)
+        assert cosine(a, embedder.embed("async STANDUPS for the remote team!")) == pytest.approx(1.0)
+
+    def test_stopwords_and_plurals(self):
+        """Test that filler words are ignored and plurals fold"""
+        embedder = HashingEmbedder()
+
+        assert embedder.embed("the of and") == {}
+        assert cosine(embedder.embed("use databases"), embedder.embed("use a database")) \
+            == pytest.approx(1.0)
+
+    def test_idf_downweights_common_words(self):
+        """Test that words seen in every idea count less"""
+        embedder = HashingEmbedder()
+        for i in range(20):
+            embedder.embed(f"team idea{i}", observe=True)
+
+        vector = embedder.embed("team novel")
+        team, novel = (embedder.features(word) for word in ("team", "novel"))
+        assert vector[next(iter(team))] < vector[next(iter(novel))]
+
+
+class TestUnionFind:
+    """Test the disjoint sets"""
+
+    def test_union_and_groups(self):
+        """Test transitive joins"""
+        sets = UnionFind()
+        for item in "abcde":
+            sets.add(item)
+
+        assert sets.union("a", "b") and sets.union("c", "b")
+        assert not sets.union("a", "c")
+        assert sorted(map(sorted, sets.groups().values())) == [["a", "b", "c"], ["d"], ["e"]]
+
+
+class TestConvergenceIndex:
+    """Test incremental LSH clustering"""
+
+    def test_paraphrases_cluster(self):
+        """Test that rewordings converge and unrelated ideas don't"""
+        index = ConvergenceIndex()
+        index.add("a", "Move the weekly planning meeting to async written updates")
+        index.add("b", "Pay down technical debt in the billing service")
+        matches = index.add("c", "move weekly planning meetings to async written updates")
+
+        assert [m[0] for m in matches] == ["a"]
+        assert index.clusters() == [["a", "c"]]
+        assert index.cluster_of("b") == ["b"]
+
+    def test_clusters_are_transitive_and_deduplicated(self):
+        """Test that a chain of edits is one cluster listed once"""
+        index = ConvergenceIndex(threshold=0.6)
+        index.add_many([
+            (1, "ship the onboarding guide for new contributors this sprint"),
+            (2, "ship the onboarding guide for new contributors next sprint"),
+            (3, "publish the onboarding guide for new contributors next sprint"),
+            (4, "quarterly budget review"),
+        ])
+
+        clusters = index.clusters()
+        assert clusters == [[1, 2, 3]]
+        assert index.clusters(min_size=1)[-1] == [4]
+
+    def test_readding_and_empty_ideas(self):
+        """Test that duplicate IDs and wordless ideas are harmless"""
+        index = ConvergenceIndex()
+        index.add("a", "retro every friday")
+
+        assert index.add("a", "retro every friday") == []
+        assert index.add("b", "!!!") == []
+        assert len(index) == 2 and "b" in index
+
+    def test_recall_against_all_pairs(self):
+        """Test that LSH finds the pairs an N×N scan finds with few comparisons"""
+        index = ConvergenceIndex()
+        ideas = synthetic_ideas(800)
+        index.add_many(ideas)
+
+        ids = [i for i, _ in ideas]
+        pairs = [(a, b) for n, a in enumerate(ids) for b in ids[:n]
+                 if index.similarity(a, b) >= index.threshold]
+        roots = {i: index._clusters.find(i) for i in ids}
+        found = sum(roots[a] == roots[b] for a, b in pairs)
+
+        assert len(pairs) > 100
+        assert found / len(pairs) > 0.9
+        assert index.comparisons < len(ids) * 5          # vs ~320,000 pairs
+
+
+def test_detect_convergence():
+    """Test the one-call helper"""
+    clusters = detect_convergence([
+        ("x", "adopt trunk based development"),
+        ("y", "adopt trunk-based development now"),
+        ("z", "hire a designer"),
+    ])
+
+    assert clusters == [["x", "y"]]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,96 @@
+"""
+Unit Tests for Curator AI Event Counters
+
+Run with: pytest tests/unit/test_counters.py
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from counters import BucketCounter
+
+NOW = 1_700_000_000
+
+
+class TestBucketCounter:
+    """Test bucketed window counts"""
+
+    def test_window_totals_match_scan(self):
+        """Test window totals against a brute-force count (bucket-aligned)"""
+        rng = random.Random(5)
+        counter = BucketCounter(bucket_seconds=60, retention_hours=None)
+        events = [(rng.choice("abc"), NOW - rng.uniform(0, 72 * 3600)) for _ in range(5000)]
+        for key, ts in events:
+            counter.add(key, ts)
+
+        for hours in (1, 6, 24, 48):
+            start = (NOW - hours * 3600) // 60
+            expected = sum(1 for _, ts in events if ts // 60 >= start)
+            assert counter.total(hours, now=NOW) == expected
+
+        counts = counter.counts(24, now=NOW, keys=["a", "zzz"])
+        assert counts["zzz"] == 0
+        assert counts["a"] == sum(1 for k, ts in events
+                                  if k == "a" and ts // 60 >= (NOW - 86400) // 60)
+
+    def test_high_water_mark(self):
+        """Test that latest tracks the newest timestamp regardless of order"""
+        counter = BucketCounter()
+        counter.add("c", NOW - 10)
+        counter.add("c", NOW - 100)
+
+        assert counter.latest("c") == NOW - 10
+        assert counter.latest("missing") is None
+
+    def test_coverage(self):
+        """Test covered_since bookkeeping"""
+        counter = BucketCounter()
+        counter.add("c", NOW)
+
+        assert not counter.covers("c", NOW - 3600)
+        counter.reset("c", NOW - 7200)
+        assert counter.covers("c", NOW - 3600)
+        assert counter.total(24, now=NOW) == 0
+
+    def test_retention(self):
+        """Test that expired buckets are dropped and coverage shrinks"""
+        counter = BucketCounter(bucket_seconds=3600, retention_hours=24)
+        counter.reset("c", NOW - 100 * 3600)
+        for i in range(100):
+            counter.add("c", NOW - i * 3600)
+
+        assert counter.total(1000, now=NOW) == 25
+        assert not counter.covers("c", NOW - 48 * 3600)
+        assert counter.covers("c", NOW - 24 * 3600)
+
+    def test_save_and_load(self, tmp_path):
+        """Test that state survives a round trip through JSON"""
+        path = str(tmp_path / "counts.json")
+        counter = BucketCounter(bucket_seconds=300)
+        counter.reset("c", NOW - 86400)
+        for i in range(50):
+            counter.add("c", NOW - i * 600)
+        counter.save(path)
+
+        loaded = BucketCounter.load(path)
+
+        assert loaded.bucket_seconds == 300
+        assert loaded.total(24, now=NOW) == counter.total(24, now=NOW)
+        assert loaded.latest("c") == NOW
+        assert loaded.covered_since("c") == NOW - 86400
+
+    def test_load_missing_file(self, tmp_path):
+        """Test that a missing state file starts an empty counter"""
+        counter = BucketCounter.load(str(tmp_path / "none.json"), bucket_seconds=120)
+
+        assert counter.bucket_seconds == 120
+        assert counter.keys() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
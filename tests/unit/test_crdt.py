@@ -0,0 +1,207 @@
+"""
+Unit Tests for Curator AI Cognitive CRDTs
+
+Property tests use seeded random operation/gossip schedules.
+
+Run with: pytest tests/unit/test_crdt.py
+"""
+
+import pytest
+import json
+import random
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from crdt import (GSet, IdeaRepository, IdeaState, LWWMap, MVRegister,
+                  SynthesisRegister, VersionVector)
+
+REPLICAS = ["alice", "bob", "carol", "dave"]
+TYPES = [GSet, MVRegister, LWWMap]
+
+
+def mutate(state, rng):
+    """One random mutation; returns its delta"""
+    if isinstance(state, GSet):
+        return state.add(f"idea-{rng.randint(0, 40)}")
+    if isinstance(state, MVRegister):
+        return state.write(f"{state.replica_id}-{rng.randint(0, 9)}")
+    return state.set(f"k{rng.randint(0, 8)}", rng.randint(0, 99), timestamp=rng.randint(0, 30))
+
+
+def clone(state):
+    """Copy through the serialized form"""
+    data = json.loads(json.dumps(state.to_dict()))
+    if isinstance(state, MVRegister):
+        data["entries"] = [[d, v] for d, v in data["entries"]]
+    return type(state).from_dict(data, state.replica_id)
+
+
+def random_replicas(cls, seed, ops=60):
+    """Replicas after random mutations and partial, lossy, duplicated gossip"""
+    rng = random.Random(seed)
+    replicas = {r: cls(r) for r in REPLICAS}
+    in_flight = []
+    for _ in range(ops):
+        source = replicas[rng.choice(REPLICAS)]
+        action = rng.random()
+        if action < 0.5:
+            in_flight.append(mutate(source, rng))
+        elif action < 0.8 and in_flight:
+            # Deliver an op delta (possibly again, possibly out of order)
+            replicas[rng.choice(REPLICAS)].merge(rng.choice(in_flight))
+        else:
+            target = replicas[rng.choice(REPLICAS)]
+            target.merge(source.delta_since(target.context))
+    return list(replicas.values())
+
+
+def full_sync(replicas):
+    for _ in range(2):
+        for a in replicas:
+            for b in replicas:
+                b.merge(a.delta_since(b.context))
+
+
+class TestConvergence:
+    """Strong eventual consistency under arbitrary delivery"""
+
+    @pytest.mark.parametrize("cls", TYPES)
+    @pytest.mark.parametrize("seed", range(25))
+    def test_replicas_converge(self, cls, seed):
+        """Test that replicas agree after syncing, whatever happened before"""
+        replicas = random_replicas(cls, seed)
+        full_sync(replicas)
+
+        assert len({r.value if not isinstance(r, LWWMap) else json.dumps(r.value, sort_keys=True)
+                    for r in replicas}) == 1
+        assert all(r.context == replicas[0].context for r in replicas)
+        assert all(not r.context.cloud for r in replicas)
+
+    @pytest.mark.parametrize("cls", TYPES)
+    @pytest.mark.parametrize("seed", range(25))
+    def test_merge_laws(self, cls, seed):
+        """Test commutativity, associativity and idempotence of merge"""
+        x, y, z = random_replicas(cls, seed)[:3]
+
+        def value(s):
+            return (json.dumps(s.value, sort_keys=True) if isinstance(s, LWWMap) else s.value,
+                    s.context.vv, s.context.cloud)
+
+        assert value(clone(x).merge(y)) == value(clone(y).merge(x))
+        assert value(clone(x).merge(y).merge(z)) == value(clone(x).merge(clone(y).merge(z)))
+        assert value(clone(x).merge(x)) == value(x)
+        assert value(clone(x).merge(y).merge(y)) == value(clone(x).merge(y))
+
+    @pytest.mark.parametrize("cls", TYPES)
+    def test_delta_equals_full_state_merge(self, cls):
+        """Test that merging delta_since gives the same state as merging everything"""
+        for seed in range(25):
+            a, b = random_replicas(cls, seed)[:2]
+            via_delta = clone(b).merge(a.delta_since(b.context))
+            via_state = clone(b).merge(a)
+            assert via_delta.value == via_state.value
+            assert via_delta.context == via_state.context
+
+
+class TestDeltaSize:
+    """Sync cost is proportional to what's new"""
+
+    def test_gset_ships_only_new_ideas(self):
+        """Test that a fork merge ships O(new ideas), not the whole repository"""
+        alice, bob = IdeaRepository("alice"), IdeaRepository("bob")
+        for i in range(10000):
+            alice.add(f"idea-{i}")
+        bob.merge(alice.delta_since(bob.context))
+
+        for i in range(5):
+            bob.add(f"fork-{i}")
+        alice.add("main-0")
+
+        to_alice = bob.delta_since(alice.context)
+        to_bob = alice.delta_since(bob.context)
+        assert len(to_alice) == 5
+        assert len(to_bob) == 1
+        assert len(alice.delta_since(alice.context)) == 0
+
+        alice.merge(to_alice)
+        bob.merge(to_bob)
+        assert alice.ideas == bob.ideas
+        assert len(alice) == 10006
+
+    def test_lww_delta_skips_superseded_writes(self):
+        """Test that overwritten values are neither shipped nor kept indexed"""
+        alice, bob = LWWMap("alice"), LWWMap("bob")
+        for t in range(1000):
+            alice.set(f"k{t % 10}", t, timestamp=t)
+
+        delta = alice.delta_since(bob.context)
+        assert len(delta) == 10
+        assert len(alice._index) < 200
+        assert bob.merge(delta).value == alice.value
+
+    def test_mvregister_delta_empty_when_seen(self):
+        """Test that an up-to-date peer gets nothing"""
+        alice, bob = MVRegister("alice"), MVRegister("bob")
+        bob.merge(alice.write("x"))
+
+        assert alice.delta_since(bob.context).values == []
+        assert not alice.delta_since(bob.context).context.vv
+
+
+class TestVersionVector:
+    """Compact causal context"""
+
+    def test_cloud_folds_into_vector(self):
+        """Test that out-of-order dots compact once the gap is filled"""
+        vv = VersionVector()
+        vv.add(("a", 3))
+        vv.add(("a", 2))
+        assert vv.vv == {} and vv.cloud == {("a", 2), ("a", 3)}
+
+        vv.add(("a", 1))
+        assert vv.vv == {"a": 3} and not vv.cloud
+        assert ("a", 2) in vv and ("a", 4) not in vv
+
+    def test_covers(self):
+        """Test context inclusion"""
+        big = VersionVector({"a": 5, "b": 2}, {("c", 4)})
+
+        assert big.covers(VersionVector({"a": 3}, {("c", 4)}))
+        assert not big.covers(VersionVector({"c": 1}))
+        assert VersionVector.from_dict(big.to_dict()) == big
+
+
+class TestCognitiveOperations:
+    """The COGNITIVE-CRDTS.md §2 scenarios"""
+
+    def test_concurrent_syntheses_are_preserved(self):
+        """Test that concurrent syntheses survive until someone resolves them"""
+        alice, bob = SynthesisRegister("alice"), SynthesisRegister("bob")
+        alice.synthesize("alice", "SQL for transactions, NoSQL for analytics", 1)
+        bob.synthesize("bob", "NoSQL everywhere", 2)
+        bob.merge(alice.delta_since(bob.context))
+        alice.merge(bob.delta_since(alice.context))
+
+        assert len(alice.get_all_versions()) == len(bob.get_all_versions()) == 2
+
+        # A synthesis written after seeing both replaces them
+        bob.synthesize("bob", "Start with SQL", 3)
+        alice.merge(bob.delta_since(alice.context))
+        assert alice.get_all_versions() == [("bob", "Start with SQL", 3)]
+
+    def test_reprocessing_is_idempotent(self):
+        """Test the Revision operator: replays don't change state"""
+        state = IdeaState("alice")
+
+        assert state.process("proposal", 10)
+        assert not state.process("proposal", 10)
+        assert not state.process("proposal", 5)
+        assert state.process("proposal", 12)
+        assert state.processed == {"proposal": 12}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,171 @@
+"""
+Unit Tests for Curator AI Embedding Store
+
+Run with: pytest tests/unit/test_embedding_store.py
+"""
+
+import pytest
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+import embedding_store
+from embedding_store import EmbeddingStore
+
+DIM = 26
+
+
+class LetterEmbedder:
+    """Letter-count vectors; records which texts it was asked to embed"""
+
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, texts):
+        self.texts.extend(texts)
+        vectors = []
+        for text in texts:
+            vector = [0.0] * DIM
+            for c in text.lower():
+                if "a" <= c <= "z":
+                    vector[ord(c) - ord("a")] += 1
+            vectors.append(vector)
+        return vectors
+
+
+@pytest.fixture
+def embed():
+    return LetterEmbedder()
+
+
+class TestIncrementalEmbedding:
+    """Test that only new or revised ideas are embedded"""
+
+    def test_sync_embeds_only_changes(self, tmp_path, embed):
+        """Test a second synthesis run after one revision and one new idea"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+        ideas = {1: "async standups", 2: "weekly demo", 3: "pair rotation"}
+        store.sync(ideas, embed)
+        assert len(embed.texts) == 3
+
+        embed.texts.clear()
+        ideas[2] = "biweekly demo"
+        ideas[4] = "shared glossary"
+        rows = store.sync(ideas, embed)
+
+        assert embed.texts == ["biweekly demo", "shared glossary"]
+        assert len(store) == 4 and store.rows == 5
+        assert "weekly demo" not in store
+        assert rows[1] == 0
+
+    def test_whitespace_and_duplicates(self, tmp_path, embed):
+        """Test that reformatted and repeated texts share one row"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+        rows = store.ensure(["retro  notes", "retro notes\n", "retro notes"], embed)
+
+        assert rows == [0, 0, 0]
+        assert embed.texts == ["retro  notes"]
+
+    def test_reverted_text_is_revived(self, tmp_path, embed):
+        """Test that a tombstoned text coming back reuses its row"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+        store.sync({1: "draft one"}, embed)
+        store.sync({1: "draft two"}, embed)
+        embed.texts.clear()
+
+        assert store.sync({1: "draft one"}, embed) == {1: 0}
+        assert embed.texts == []
+
+    def test_wrong_vector_size(self, tmp_path):
+        """Test that embeddings of the wrong dimension are rejected"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+
+        with pytest.raises(ValueError, match="26-dimensional"):
+            store.ensure(["x"], lambda texts: [[1.0, 2.0]])
+
+
+class TestPersistence:
+    """Test the on-disk layout"""
+
+    def test_reopen(self, tmp_path, embed):
+        """Test that rows and tombstones survive a restart"""
+        with EmbeddingStore(str(tmp_path), DIM) as store:
+            store.sync({1: "alpha", 2: "beta"}, embed)
+            store.discard("beta")
+
+        embed.texts.clear()
+        with EmbeddingStore(str(tmp_path), DIM) as store:
+            assert len(store) == 1 and store.rows == 2
+            store.sync({1: "alpha", 2: "gamma"}, embed)
+        assert embed.texts == ["gamma"]
+
+        with pytest.raises(ValueError, match="dim"):
+            EmbeddingStore(str(tmp_path), DIM + 1)
+
+    def test_incomplete_row_truncated(self, tmp_path, embed):
+        """Test recovery from a crash between the vector and hash appends"""
+        with EmbeddingStore(str(tmp_path), DIM) as store:
+            store.ensure(["alpha", "beta"], embed)
+        with open(tmp_path / "vectors.f32", "ab") as f:
+            f.write(b"\0" * (4 * DIM))
+
+        with EmbeddingStore(str(tmp_path), DIM) as store:
+            assert store.rows == 2
+            assert (tmp_path / "vectors.f32").stat().st_size == 2 * 4 * DIM
+
+    def test_compact(self, tmp_path, embed):
+        """Test that compaction drops tombstoned rows and keeps vectors"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+        store.sync({1: "one", 2: "two", 3: "three"}, embed)
+        before = store.vector(store.row("three")).tolist()
+        store.sync({1: "one", 3: "three"}, embed)
+
+        assert store.compact() == {0: 0, 2: 1}
+        assert store.rows == 2
+        assert store.vector(store.row("three")).tolist() == before
+
+
+class TestSimilarity:
+    """Test queries on the mapped matrix"""
+
+    def test_similar_skips_tombstoned_rows(self, tmp_path, embed):
+        """Test nearest neighbours by cosine"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+        store.sync({1: "abc", 2: "abd", 3: "xyz", 4: "abcc"}, embed)
+        store.discard("abcc")
+
+        rows = [row for row, _ in store.similar_to("abc", k=2)]
+        assert rows == [store.row("abd"), store.row("xyz")]
+        best, score = store.similar(embed(["aabbcc"])[0], k=1)[0]
+        assert best == store.row("abc") and score == pytest.approx(1.0)
+
+    def test_pure_python_matches(self, tmp_path, embed, monkeypatch):
+        """Test that the fallback ranks like the NumPy path"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+        store.sync({i: text for i, text in enumerate(["curator", "monitor", "mentor", "cure"])},
+                   embed)
+        query = embed(["curate"])[0]
+        expected = store.similar(query, k=3)
+
+        monkeypatch.setattr(embedding_store, "NUMPY_AVAILABLE", False)
+        actual = store.similar(query, k=3)
+        assert [r for r, _ in actual] == [r for r, _ in expected]
+        assert [s for _, s in actual] == pytest.approx([s for _, s in expected], rel=1e-5)
+
+    @pytest.mark.skipif(not embedding_store.NUMPY_AVAILABLE, reason="NumPy not installed")
+    def test_matrix_is_a_view_of_the_file(self, tmp_path, embed):
+        """Test that matrix() maps the file instead of copying it"""
+        store = EmbeddingStore(str(tmp_path), DIM)
+        store.sync({1: "alpha", 2: "beta"}, embed)
+        store.discard("beta")
+
+        matrix = store.matrix()
+        assert matrix.shape == (2, DIM)
+        assert not matrix.flags.owndata and not matrix.flags.writeable
+        assert store.live_mask().tolist() == [True, False]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,141 @@
+"""
+Unit Tests for Curator AI Zc Forecasting
+
+Run with: pytest tests/unit/test_forecast.py
+"""
+
+import pytest
+import math
+import random
+import time
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from forecast import ZcForecaster
+from history import RingBufferHistory
+from monitor import CuratorMonitor, ZcResult
+
+HOUR = 3600
+T0 = 1_699_920_000  # Midnight UTC
+
+
+def daily_pattern(hour: int) -> float:
+    """0.6 ± 0.25 with a peak in the afternoon"""
+    return 0.6 + 0.25 * math.sin(2 * math.pi * (hour - 9) / 24)
+
+
+def feed(forecaster, values, start=T0):
+    for i, zc in enumerate(values):
+        forecaster.update(start + i * HOUR, zc)
+
+
+class TestZcForecaster:
+    """Test the incremental seasonal model"""
+
+    def test_learns_daily_season(self):
+        """Test that three weeks of a daily pattern forecast the next day"""
+        rng = random.Random(4)
+        forecaster = ZcForecaster()
+        feed(forecaster, [daily_pattern(h) + rng.gauss(0, 0.02) for h in range(21 * 24)])
+
+        result = forecaster.forecast(24)
+
+        actual = [daily_pattern(21 * 24 + h) for h in range(24)]
+        mae = sum(abs(p.zc - a) for p, a in zip(result.points, actual)) / 24
+        assert mae < 0.05
+        assert result.observations == 21 * 24 - 1   # The last hour is still open
+
+    def test_rising_load_flags_red_crossing(self):
+        """Test that a steady climb predicts when Zc enters RED"""
+        forecaster = ZcForecaster()
+        feed(forecaster, [0.5 + 0.01 * h for h in range(36)])   # 0.85 now, +0.01/h
+
+        result = forecaster.forecast(48)
+
+        assert result.current_zone == "YELLOW"
+        assert [c.to_zone for c in result.crossings] == ["RED"]
+        # Damping slows the projected climb, so the crossing comes later than 15h
+        crossing = datetime.fromisoformat(result.crossings[0].timestamp)
+        hours_ahead = (crossing - datetime.fromtimestamp(T0 + 35 * HOUR)).total_seconds() / HOUR
+        assert 15 <= hours_ahead <= 48
+
+    def test_sub_hour_samples_are_bucketed(self):
+        """Test that minute samples fit like their hourly means"""
+        hourly, minutely = ZcForecaster(), ZcForecaster()
+        values = [daily_pattern(h) for h in range(72)]
+        feed(hourly, values)
+        for h, zc in enumerate(values):
+            for m in range(60):
+                minutely.update(T0 + h * HOUR + m * 60, zc + (0.1 if m % 2 else -0.1))
+
+        assert [p.zc for p in minutely.forecast(24).points] == \
+            [p.zc for p in hourly.forecast(24).points]
+
+    def test_gap_hours_advance_state(self):
+        """Test that hours without samples don't count as observations"""
+        forecaster = ZcForecaster()
+        feed(forecaster, [0.5] * 10)
+        forecaster.update(T0 + 20 * HOUR, 0.5)
+
+        assert forecaster.observations == 10
+        assert forecaster.forecast(24).points[0].zc == pytest.approx(0.5, abs=0.01)
+
+    def test_projection_cached_per_sample(self):
+        """Test that projections are reused until a new sample arrives"""
+        forecaster = ZcForecaster()
+        feed(forecaster, [0.4, 0.5, 0.6])
+
+        first = forecaster._projection()[0]
+        assert forecaster._projection()[0] is first
+        forecaster.update(T0 + 3 * HOUR, 0.7)
+        assert forecaster._projection()[0] is not first
+
+    def test_horizon_bounds(self):
+        """Test empty forecasters and out-of-range horizons"""
+        forecaster = ZcForecaster()
+        assert forecaster.forecast(24) is None
+
+        forecaster.update(T0, 0.5)
+        assert len(forecaster.forecast(72).points) == 72
+        with pytest.raises(ValueError):
+            forecaster.forecast(73)
+
+
+class TestMonitorForecast:
+    """Test forecasts on CuratorMonitor"""
+
+    def test_forecast_rebuilt_from_history(self):
+        """Test that a restarted monitor forecasts like the one that saw the samples"""
+        now = datetime.now().replace(minute=30, second=0, microsecond=0)
+        stamps = [now - timedelta(hours=48 - h) for h in range(49)]
+        history = [
+            ZcResult(timestamp=ts.isoformat(), zc=round(daily_pattern(h), 2), v_generation=0,
+                     b_social=30, zone="", mode="", confidence=0.8, trend="STABLE",
+                     recommendation="")
+            for h, ts in enumerate(stamps)
+        ]
+        store = RingBufferHistory()
+        store.extend(history)
+        monitor = CuratorMonitor(team_size=10, history_store=store)
+
+        reference = ZcForecaster()
+        for r, ts in zip(history, stamps):
+            reference.update(ts.timestamp(), r.zc)
+
+        assert [p.zc for p in monitor.forecast(24).points] == \
+            [p.zc for p in reference.forecast(24).points]
+
+    def test_update_is_cheap(self):
+        """Test that per-sample updates don't refit history"""
+        forecaster = ZcForecaster()
+        start = time.perf_counter()
+        feed(forecaster, [daily_pattern(h) for h in range(5000)])
+        assert (time.perf_counter() - start) / 5000 < 1e-3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,157 @@
+"""
+Unit Tests for Curator AI Fork Registry
+
+Run with: pytest tests/unit/test_forks.py
+"""
+
+import pytest
+import math
+import random
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from contribution_log import Contribution
+from forks import DAY, Fork, ForkRegistry, merge_cost
+
+T0 = 1_700_000_000.0
+DATABASES = "database schema migration index query postgres transaction".split()
+LEDGERS = "blockchain token ledger consensus wallet decentralized mining".split()
+
+
+def cosine(a, b):
+    dot = sum(x * b.get(i, 0.0) for i, x in a.items())
+    return dot / math.sqrt(sum(x * x for x in a.values()) * sum(x * x for x in b.values()))
+
+
+def seeded_registry(**kwargs):
+    """Registry whose 'general' channel has a week of database talk"""
+    rng = random.Random(0)
+    registry = ForkRegistry(**kwargs)
+    for i in range(30):
+        registry.contribute("general", " ".join(rng.sample(DATABASES, 4)), timestamp=T0 + i)
+    return registry, rng
+
+
+def test_merge_cost():
+    """Test the §4.3 quadratic"""
+    assert merge_cost(0) == pytest.approx(0.5)
+    assert merge_cost(5) == pytest.approx(0.5 + 6.0 + 7.5)
+
+
+class TestDivergence:
+    """Test incremental divergence depth"""
+
+    def test_fork_starts_as_copy(self):
+        """Test D = 0 at fork time"""
+        registry, _ = seeded_registry()
+        fork = registry.open_fork("idea", "general", owner="alice", timestamp=T0 + 100)
+
+        assert fork.depth == 0.0
+        assert registry.forks("general") == [fork]
+
+    def test_diverging_fork_deepens(self):
+        """Test that off-topic fork work raises D more than on-topic work"""
+        registry, rng = seeded_registry()
+        drifting = registry.open_fork("ledger", "general", timestamp=T0 + 100)
+        staying = registry.open_fork("indexes", "general", timestamp=T0 + 100)
+        for h in range(1, 49):
+            t = T0 + 100 + h * 3600
+            registry.contribute(drifting.fork_id, " ".join(rng.sample(LEDGERS, 4)), timestamp=t)
+            registry.contribute(staying.fork_id, " ".join(rng.sample(DATABASES, 4)), timestamp=t)
+
+        assert drifting.depth > 5 * staying.depth
+        assert drifting.depth_per_day > 0
+        assert drifting.merge_cost == pytest.approx(merge_cost(drifting.depth))
+
+    def test_parent_contributions_update_children(self):
+        """Test that work on the parent also moves D, matching an exact recomputation"""
+        registry, rng = seeded_registry()
+        fork = registry.open_fork("ledger", "general", timestamp=T0 + 100)
+        registry.contribute(fork.fork_id, "blockchain ledger", timestamp=T0 + 200)
+        before = fork.depth
+
+        assert registry.contribute("general", "ledger consensus wallet", timestamp=T0 + 300) \
+            == [fork.fork_id]
+        assert fork.depth != before
+
+        state = registry._forks[fork.fork_id]
+        exact = 10.0 * (1 - cosine(state.parent_side.vector, state.fork_side.vector))
+        assert fork.depth == pytest.approx(exact)
+
+    def test_fork_of_fork_and_dense_vectors(self):
+        """Test nested forks and precomputed dense embeddings"""
+        registry = ForkRegistry()
+        registry.contribute("general", vector=[1.0, 0.0, 0.0], timestamp=T0)
+        outer = registry.open_fork("outer", "general", timestamp=T0 + 1)
+        inner = registry.open_fork("inner", outer.fork_id, timestamp=T0 + 2)
+
+        assert registry.contribute(outer.fork_id, vector=[0.0, 1.0, 0.0], timestamp=T0 + 3) \
+            == [outer.fork_id, inner.fork_id]
+        assert outer.depth > 0 and inner.depth > 0
+        with pytest.raises(ValueError):
+            registry.open_fork("again", "general", fork_id=outer.fork_id)
+
+    def test_observe_logged_contributions(self):
+        """Test feeding contribution log records with a branch in their context"""
+        registry, _ = seeded_registry()
+        fork = registry.open_fork("ledger", "general", fork_id="f1", timestamp=T0 + 100)
+
+        changed = registry.observe(Contribution(seq=0, timestamp=T0 + 200, author="bob",
+                                                idea="token wallet", context={"branch": "f1"}))
+        assert changed == ["f1"] and fork.contributions == 1
+        assert registry.observe(Contribution(seq=1, timestamp=T0 + 300, author="bob",
+                                             idea="no branch")) == []
+
+
+class TestMergeTiming:
+    """Test optimal merge time and the due index"""
+
+    def fork(self, depth, per_day, age_days=4.0):
+        return Fork(fork_id="f", name="f", parent="p", owner=None, created_at=T0,
+                    depth=depth, depth_per_day=per_day, updated_at=T0 + age_days * DAY)
+
+    def test_optimal_merge_time(self):
+        """Test D* = (value/s - β1) / 2β2 and the 3-7 day clamp"""
+        registry = ForkRegistry(value_per_day=3.0)
+        now = T0 + 4 * DAY
+
+        # s = 1/day: D* = (3 - 1.2) / 0.6 = 3, one day away from D = 2
+        assert registry.optimal_merge_time(self.fork(2.0, 1.0)) == pytest.approx(now + DAY)
+        assert registry.optimal_merge_time(self.fork(3.5, 1.0)) == pytest.approx(now)
+        assert registry.optimal_merge_time(self.fork(1.0, 0.0)) == T0 + 7 * DAY
+        assert registry.optimal_merge_time(self.fork(1.0, 0.01)) == T0 + 7 * DAY
+        assert registry.optimal_merge_time(self.fork(3.5, 1.0, age_days=1)) == T0 + 3 * DAY
+        assert registry.optimal_merge_time(self.fork(6.0, 1.0, age_days=1)) == T0 + DAY
+
+    def test_merge_now_uses_the_index(self):
+        """Test that only due, open forks come back, until they are merged"""
+        registry = ForkRegistry()
+        forks = [registry.open_fork(f"f{i}", "general", timestamp=T0 + i * DAY) for i in range(300)]
+
+        due = registry.merge_now(now=T0 + 9 * DAY)
+        assert [f.name for f in due] == [f"f{i}" for i in range(3)]
+        assert len(registry.merge_now(now=T0 + 9 * DAY, limit=2)) == 2
+
+        registry.close_fork(forks[0].fork_id)
+        registry.close_fork(forks[1].fork_id, merged=False)
+        assert [f.name for f in registry.merge_now(now=T0 + 9 * DAY)] == ["f2"]
+        assert forks[1].status == "abandoned"
+        assert forks[0] not in registry.forks("general")
+
+    def test_stale_heap_entries_are_dropped(self):
+        """Test that rescheduling many times keeps the heap bounded"""
+        registry, rng = seeded_registry()
+        fork = registry.open_fork("ledger", "general", timestamp=T0 + 100)
+        for h in range(500):
+            registry.contribute(fork.fork_id, " ".join(rng.sample(LEDGERS, 3)),
+                                timestamp=T0 + 100 + h * 600)
+
+        assert len(registry._due) <= 2 * len(registry) + 64
+        assert registry.merge_now(now=fork.merge_due) == [fork]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
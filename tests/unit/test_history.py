@@ -0,0 +1,132 @@
+"""
+Unit Tests for Curator AI History Storage
+
+Run with: pytest tests/unit/test_history.py
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from monitor import CuratorMonitor, TeamMetrics, ZcResult
+from history import RingBufferHistory
+
+
+def make_result(when: datetime, zc: float = 0.5) -> ZcResult:
+    """Build a ZcResult at a given time"""
+    return ZcResult(
+        timestamp=when.isoformat(),
+        zc=zc,
+        v_generation=zc * 30,
+        b_social=30.0,
+        zone="GREEN",
+        mode="STUDY_HALL",
+        confidence=0.8,
+        trend="STABLE",
+        recommendation=""
+    )
+
+
+class TestRingBufferHistory:
+    """Test the in-memory ring buffer backend"""
+
+    def test_append_and_index(self):
+        """Test sequence behaviour of the store"""
+        store = RingBufferHistory()
+        start = datetime.now()
+
+        for i in range(5):
+            store.append(make_result(start + timedelta(minutes=i), zc=i / 10))
+
+        assert len(store) == 5
+        assert store[0].zc == 0.0
+        assert store[-1].zc == 0.4
+        assert [r.zc for r in store[-3:]] == [0.2, 0.3, 0.4]
+
+    def test_bounded_size_evicts_oldest(self):
+        """Test that the buffer never grows beyond max_size"""
+        store = RingBufferHistory(max_size=100)
+        start = datetime.now()
+
+        for i in range(250):
+            store.append(make_result(start + timedelta(minutes=i), zc=i))
+
+        assert len(store) == 100
+        assert store[0].zc == 150
+        assert store[-1].zc == 249
+
+    def test_window_query(self):
+        """Test that since() returns exactly the results inside the window"""
+        store = RingBufferHistory(max_size=50)
+        start = datetime.now() - timedelta(hours=100)
+
+        for i in range(100):
+            store.append(make_result(start + timedelta(hours=i), zc=i))
+
+        cutoff = (start + timedelta(hours=90)).timestamp()
+        window = store.since(cutoff)
+
+        assert [r.zc for r in window] == list(range(90, 100))
+
+    def test_retention_drops_old_results(self):
+        """Test retention relative to the newest result"""
+        store = RingBufferHistory(retention_hours=24)
+        start = datetime.now() - timedelta(hours=48)
+
+        for i in range(49):
+            store.append(make_result(start + timedelta(hours=i)))
+
+        assert len(store) == 25
+
+    def test_out_of_order_append(self):
+        """Test that late results are kept in chronological order"""
+        store = RingBufferHistory()
+        now = datetime.now()
+
+        store.append(make_result(now, zc=0.2))
+        store.append(make_result(now - timedelta(hours=1), zc=0.1))
+
+        assert [r.zc for r in store] == [0.1, 0.2]
+
+
+class TestMonitorHistoryBackend:
+    """Test CuratorMonitor with a custom history backend"""
+
+    def test_custom_store(self):
+        """Test that the monitor writes to the provided store"""
+        store = RingBufferHistory(max_size=3)
+        monitor = CuratorMonitor(team_size=10, history_store=store)
+
+        for _ in range(5):
+            monitor.calculate_zc(TeamMetrics(
+                timestamp=datetime.now().isoformat(),
+                slack_messages=100
+            ))
+
+        assert monitor.history is store
+        assert len(monitor.get_history(hours=1)) == 3
+
+    def test_export_import_roundtrip(self, tmp_path):
+        """Test that exported history can be imported back"""
+        monitor = CuratorMonitor(team_size=10)
+        for _ in range(3):
+            monitor.calculate_zc(TeamMetrics(
+                timestamp=datetime.now().isoformat(),
+                slack_messages=100
+            ))
+
+        path = str(tmp_path / "history.json")
+        monitor.export_history(path)
+
+        restored = CuratorMonitor(team_size=10)
+        restored.import_history(path)
+
+        assert [r.zc for r in restored.history] == [r.zc for r in monitor.history]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,155 @@
+"""
+Unit Tests for Curator AI Mode Hysteresis
+
+Run with: pytest tests/unit/test_hysteresis.py
+"""
+
+import pytest
+import random
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from history import RingBufferHistory
+from hysteresis import ModeStateMachine
+from monitor import CuratorMonitor, TeamMetrics, ZcResult
+
+HOUR = 3600
+T0 = 1_700_000_000
+
+
+def feed(machine, values, start=T0, step=HOUR):
+    """Feed hourly samples; returns the transitions"""
+    transitions = []
+    for i, zc in enumerate(values):
+        transition = machine.update(start + i * step, zc)
+        if transition:
+            transitions.append(transition)
+    return transitions
+
+
+def brute_force_time(samples, now, window, predicate):
+    """Time in [now - window, now] where predicate(zc) holds (step function)"""
+    total = 0.0
+    for (t0, _), (t1, zc) in zip(samples, samples[1:]):
+        start, end = max(t0, now - window), min(t1, now)
+        if end > start and predicate(zc):
+            total += end - start
+    return total
+
+
+class TestModeStateMachine:
+    """Test committed mode switching"""
+
+    def test_single_spike_does_not_switch(self):
+        """Test that one RED sample doesn't change the committed mode"""
+        machine = ModeStateMachine()
+        transitions = feed(machine, [0.3] * 30 + [1.5] + [0.3] * 5)
+
+        assert transitions == []
+        assert machine.committed_zone == "GREEN"
+
+    def test_sustained_overload_switches_to_jam(self):
+        """Test the §2.2 rule: Zc > 0.9 for more than half of τ"""
+        machine = ModeStateMachine(window_hours=24)
+        feed(machine, [0.3] * 24)
+
+        transitions = feed(machine, [1.2] * 14, start=T0 + 24 * HOUR)
+
+        assert [t.to_zone for t in transitions] == ["RED"]
+        assert transitions[0].timestamp == T0 + (24 + 12) * HOUR   # 13h above 0.9 > 12h
+        assert machine.committed_mode == "JAM"
+
+    @pytest.mark.parametrize("baseline,flap,settled", [
+        (0.85, (1.05, 0.95), "RED"),      # Around the RED threshold
+        (0.3, (0.75, 0.65), "GREEN"),     # Around the GREEN threshold
+        (0.85, (0.75, 0.65), "GREEN"),
+    ])
+    def test_flapping_around_threshold_is_damped(self, baseline, flap, settled):
+        """Test that samples alternating across a threshold commit at most once"""
+        machine = ModeStateMachine()
+        feed(machine, [baseline] * 48)
+
+        transitions = feed(machine, list(flap) * 48, start=T0 + 48 * HOUR)
+
+        assert len(transitions) <= 1
+        assert machine.committed_zone == settled
+
+    def test_recovery_needs_longer_share(self):
+        """Test the exit rule: Zc < 0.8 for more than 0.7τ"""
+        machine = ModeStateMachine(window_hours=10)
+        feed(machine, [1.5] * 20)
+        assert machine.committed_zone == "RED"
+
+        transitions = feed(machine, [0.5] * 10, start=T0 + 20 * HOUR)
+
+        # < 0.9 and < 0.8 for > 7h happen together: straight back to STUDY_HALL
+        assert [t.to_zone for t in transitions] == ["GREEN"]
+        assert transitions[0].timestamp == T0 + 27 * HOUR
+
+    def test_integrals_match_brute_force(self):
+        """Test running sums against a full scan of irregular samples"""
+        rng = random.Random(11)
+        machine = ModeStateMachine(window_hours=6)
+        samples = []
+        t = T0
+        for _ in range(2000):
+            t += rng.uniform(1, 1800)
+            zc = rng.uniform(0.2, 1.4)
+            samples.append((t, zc))
+            machine.update(t, zc)
+
+            if len(samples) % 97 == 0:
+                window = machine.window
+                assert machine.time_above(1) == pytest.approx(
+                    brute_force_time(samples, t, window, lambda z: z > 0.9), abs=1e-3)
+                assert machine.time_below(0) == pytest.approx(
+                    brute_force_time(samples, t, window, lambda z: z < 0.8), abs=1e-3)
+
+        assert len(machine._segments) < 2000
+
+    def test_out_of_order_sample_ignored_for_duration(self):
+        """Test that a late sample doesn't move time backwards"""
+        machine = ModeStateMachine()
+        feed(machine, [0.3] * 5)
+        machine.update(T0, 1.5)
+
+        assert machine.zone == "RED"
+        assert machine.time_above(1) == 0
+
+
+class TestMonitorCommittedMode:
+    """Test committed mode on CuratorMonitor results"""
+
+    def test_results_carry_committed_mode(self):
+        """Test that ZcResult exposes committed and instantaneous zones"""
+        monitor = CuratorMonitor(team_size=10)
+        monitor.calculate_zc(TeamMetrics(timestamp="", slack_messages=150))
+        result = monitor.calculate_zc(TeamMetrics(timestamp="", slack_messages=900))
+
+        assert result.zone == "RED"
+        assert result.committed_zone == "GREEN"
+        assert result.committed_mode == "STUDY_HALL"
+        assert monitor.last_transition is None
+
+    def test_committed_mode_rebuilt_from_history(self):
+        """Test that a monitor replays stored history into the state machine"""
+        now = datetime.now()
+        history = [
+            ZcResult(timestamp=(now - timedelta(hours=30 - i)).isoformat(), zc=zc,
+                     v_generation=0, b_social=30, zone="", mode="", confidence=0.8,
+                     trend="STABLE", recommendation="")
+            for i, zc in enumerate([0.3] * 6 + [1.3] * 24)
+        ]
+        store = RingBufferHistory()
+        store.extend(history)
+        monitor = CuratorMonitor(team_size=10, history_store=store)
+
+        assert monitor.modes.committed_zone == "RED"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
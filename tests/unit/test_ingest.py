@@ -0,0 +1,156 @@
+"""
+Unit Tests for Curator AI Event Ingestion
+
+Run with: pytest tests/unit/test_ingest.py
+"""
+
+import pytest
+import json
+import time
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from ingest import EventAggregator
+from monitor import CuratorMonitor, TeamMetrics
+from registry import MonitorRegistry
+
+
+def ndjson(events):
+    return [json.dumps(e) for e in events]
+
+
+class TestEventAggregator:
+    """Test event validation, bucketing and feeding monitors"""
+
+    def test_events_become_team_metrics(self):
+        """Test that events are summed per team and metric"""
+        now = time.time()
+        events = EventAggregator()
+        result = events.ingest(
+            [{"source": "slack", "team": "a", "ts": now - 60}] * 40 +
+            [{"source": "github_events", "team": "a", "ts": now - 120, "count": 5}] +
+            [{"source": "ai", "team": "b", "ts": now - 60}] * 3
+        )
+
+        assert result.accepted == 44
+        assert result.rejected == 0
+        a = events.metrics("a")
+        assert (a.slack_messages, a.github_events, a.ai_outputs) == (40, 5, 0)
+        assert events.metrics("b").ai_outputs == 3
+        assert events.metrics("unknown").total_items() == 0
+
+    def test_window_excludes_old_events(self):
+        """Test that events older than the window aren't counted"""
+        now = time.time()
+        events = EventAggregator()
+        events.add("notion", "a", now - 3600)
+        events.add("notion", "a", now - 30 * 3600)
+
+        assert events.metrics("a", hours=24).notion_updates == 1
+        assert events.metrics("a", hours=48).notion_updates == 2
+
+    def test_timestamp_formats(self):
+        """Test epoch, ISO (with and without offset) and missing timestamps"""
+        events = EventAggregator()
+        events.add("email", "a", "2026-01-01T12:00:00Z")
+        events.add("email", "a", "2026-01-01T12:00:00")
+        events.add("email", "a", "2026-01-01T13:00:00+01:00")
+        events.add("email", "a")
+
+        assert events.metrics("a", now=1767268800 + 60, hours=1).emails == 3
+        assert events.metrics("a").emails == 1
+
+    def test_invalid_events_rejected_individually(self):
+        """Test that bad lines are reported without dropping good ones"""
+        events = EventAggregator()
+        lines = ndjson([
+            {"source": "slack"},
+            {"source": "fax"},
+            {"team": "a"},
+            {"source": "slack", "team": "../etc"},
+            {"source": "slack", "count": 0},
+            {"source": "slack", "ts": time.time() + 86400},
+            [1, 2],
+        ]) + ["{not json", ""]
+
+        result = events.ingest_lines(lines)
+
+        assert result.accepted == 1
+        assert result.rejected == 7
+        assert result.errors[0].startswith("line 2:")
+        assert events.metrics("default").slack_messages == 1
+
+    def test_feed_runs_active_teams_once(self):
+        """Test that feed() calculates Zc from the aggregated window"""
+        now = time.time()
+        registry = MonitorRegistry()
+        events = EventAggregator()
+        events.ingest_lines(ndjson(
+            [{"source": "slack", "team": "a", "ts": now - 60}] * 40 +
+            [{"source": "ai", "team": "a", "ts": now - 60}] * 10
+        ))
+
+        results = events.feed(registry)
+
+        expected = CuratorMonitor(team_size=10).calculate_zc(
+            TeamMetrics(timestamp="", slack_messages=40, ai_outputs=10))
+        assert list(results) == ["a"]
+        assert results["a"].zc == expected.zc
+        assert len(registry.get("a").history) == 1
+
+    def test_feed_skips_teams_without_events_in_window(self):
+        """Test that idle teams are not recalculated"""
+        now = time.time()
+        registry = MonitorRegistry()
+        events = EventAggregator()
+        events.add("slack", "a", now - 30 * 3600)
+        events.add("slack", "b", now - 60)
+
+        assert set(events.feed(registry)) == {"a", "b"}   # Both sent events
+        assert set(events.feed(registry)) == {"b"}        # Only b has events in window
+
+    def test_team_set_is_bounded(self):
+        """Test the allowlist and the team cap"""
+        now = time.time()
+        allowed = EventAggregator(allowed_teams=["a"])
+        result = allowed.ingest([{"source": "slack", "team": "a"}, {"source": "slack", "team": "b"}])
+        assert (result.accepted, result.rejected) == (1, 1)
+        assert allowed.teams() == ["a"]
+
+        capped = EventAggregator(max_teams=2)
+        result = capped.ingest([{"source": "slack", "team": f"t{i}", "ts": now} for i in range(5)])
+        assert (result.accepted, result.rejected) == (2, 3)
+        assert "too many teams" in result.errors[0]
+        capped.add("slack", "t0", now)   # Known teams still count
+
+    def test_expired_teams_are_forgotten(self):
+        """Test that teams with only expired events free their slot"""
+        now = time.time()
+        registry = MonitorRegistry()
+        events = EventAggregator(retention_hours=1, max_teams=1)
+        events.add("slack", "old", now - 1800)
+
+        events.feed(registry, hours=1)
+        assert events.teams() == ["old"]   # Still has events in the window
+
+        events.feed(registry, hours=1, now=now + 3600)
+        assert events.teams() == []
+        events.add("slack", "new", now)
+        assert events.teams() == ["new"]
+
+    def test_full_cap_drops_expired_teams_first(self):
+        """Test that a new team can take the slot of a team whose events expired"""
+        now = time.time()
+        events = EventAggregator(retention_hours=1, max_teams=1)
+        events.add("slack", "old", now - 7200)
+        events._dirty.clear()   # As after a feed
+
+        events.add("slack", "new", now)
+        assert events.teams() == ["new"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
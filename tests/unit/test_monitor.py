@@ -5,6 +5,9 @@ Run with: pytest tests/unit/test_monitor.py
 """
 
 import pytest
+import asyncio
+import threading
+import time
 from datetime import datetime
 import sys
 import os
@@ -162,6 +165,103 @@ class TestMetricsCollector:
         assert "test" in collector.collectors
 
 
+class TestConcurrentCollection:
+    """Test MetricsCollector concurrent and async modes"""
+    
+    def make_collector(self, release: threading.Event):
+        collector = MetricsCollector(default_timeout=2.0)
+        collector.register_collector("slack", lambda: {"slack_messages": 100})
+        collector.register_collector("notion", lambda: {"notion_updates": 10})
+        collector.register_collector(
+            "email", lambda: release.wait(5) and {"emails": 99}, timeout=0.1
+        )
+        return collector
+    
+    def test_sources_run_in_parallel(self):
+        """Test that total time is bounded by the slowest source, not the sum"""
+        collector = MetricsCollector()
+        for name in ("a", "b", "c", "d"):
+            collector.register_collector(name, lambda: time.sleep(0.1) or {"ai_outputs": 1})
+        
+        start = time.monotonic()
+        report = collector.collect_concurrent()
+        
+        assert time.monotonic() - start < 0.3
+        assert report.metrics.ai_outputs == 4
+        assert report.complete
+        collector.close()
+    
+    def test_slow_source_times_out_with_partial_metrics(self):
+        """Test that a source missing its deadline is reported, not awaited"""
+        release = threading.Event()
+        collector = self.make_collector(release)
+        
+        start = time.monotonic()
+        report = collector.collect_concurrent()
+        elapsed = time.monotonic() - start
+        release.set()
+        
+        assert elapsed < 1.0
+        assert report.metrics.slack_messages == 100
+        assert report.metrics.notion_updates == 10
+        assert report.metrics.emails == 0
+        assert report.sources["email"].status == "TIMEOUT"
+        assert report.sources["slack"].status == "OK"
+        assert report.sources["slack"].latency_ms >= 0
+        assert report.failed == ["email"]
+        assert collector.last_report is report
+        collector.close()
+    
+    def test_hung_source_not_restarted(self):
+        """Test that a source still running from the last run is skipped"""
+        release = threading.Event()
+        collector = self.make_collector(release)
+        collector.collect_concurrent()
+        
+        report = collector.collect_concurrent()
+        release.set()
+        
+        assert report.sources["email"].error == "previous call still running"
+        collector.close()
+    
+    def test_errors_reported(self):
+        """Test that failing sources don't break collection"""
+        collector = MetricsCollector()
+        collector.register_collector("ok", lambda: {"github_events": 5})
+        collector.register_collector("broken", lambda: 1 / 0)
+        
+        report = collector.collect_concurrent()
+        
+        assert report.metrics.github_events == 5
+        assert report.sources["broken"].status == "ERROR"
+        assert "division" in report.sources["broken"].error
+        collector.close()
+    
+    def test_async_collection(self):
+        """Test coroutine and plain sources on an event loop"""
+        collector = MetricsCollector()
+        
+        async def discord():
+            await asyncio.sleep(0.05)
+            return {"discord_messages": 40}
+        
+        async def linear():
+            await asyncio.sleep(5)
+            return {"linear_updates": 1}
+        
+        collector.register_collector("discord", discord)
+        collector.register_collector("linear", linear, timeout=0.1)
+        collector.register_collector("slack", lambda: {"slack_messages": 7})
+        
+        report = asyncio.run(collector.collect_async())
+        
+        assert report.metrics.discord_messages == 40
+        assert report.metrics.slack_messages == 7
+        assert report.sources["linear"].status == "TIMEOUT"
+        assert report.sources["discord"].latency_ms >= 50
+        collector.close()
+
+
 class TestHistoryManagement:
     """Test history storage and retrieval"""
     
@@ -0,0 +1,160 @@
+"""
+Unit Tests for Curator AI Monitor Registry
+
+Run with: pytest tests/unit/test_registry.py
+"""
+
+import pytest
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from monitor import CuratorMonitor, TeamMetrics
+from registry import MonitorRegistry
+
+
+def record(monitor: CuratorMonitor, messages: int = 100):
+    monitor.calculate_zc(TeamMetrics(
+        timestamp=datetime.now().isoformat(),
+        slack_messages=messages
+    ))
+
+
+class TestMonitorRegistry:
+    """Test per-team monitor hosting"""
+
+    def test_lazy_instantiation(self):
+        """Test that monitors are created on first use and then reused"""
+        registry = MonitorRegistry(default_team_size=7)
+
+        assert "alpha" not in registry
+        monitor = registry.get("alpha")
+
+        assert monitor.team_size == 7
+        assert registry.get("alpha") is monitor
+        assert len(registry) == 1
+
+    def test_teams_are_isolated(self):
+        """Test that each team has its own history"""
+        registry = MonitorRegistry()
+        record(registry.get("alpha"))
+        record(registry.get("alpha"))
+        record(registry.get("beta"))
+
+        assert len(registry.get("alpha").history) == 2
+        assert len(registry.get("beta").history) == 1
+
+    def test_team_size_override(self):
+        """Test that a per-request team size doesn't change the shared monitor"""
+        registry = MonitorRegistry(default_team_size=10)
+        monitor = registry.get("alpha")
+
+        small = monitor.calculate_zc(TeamMetrics(timestamp=datetime.now().isoformat(),
+                                                 slack_messages=100), team_size=4)
+        default = monitor.calculate_zc(TeamMetrics(timestamp=datetime.now().isoformat(),
+                                                   slack_messages=100))
+
+        assert small.b_social == 4.0 * 3.0
+        assert default.b_social == 10.0 * 3.0
+        assert registry.get("alpha").team_size == 10
+
+    def test_invalid_team_id(self):
+        """Test that unsafe team IDs are rejected"""
+        registry = MonitorRegistry()
+
+        with pytest.raises(ValueError):
+            registry.get("../etc/passwd")
+
+    def test_lru_eviction_spills_and_restores(self, tmp_path):
+        """Test that idle teams are evicted to disk and restored on demand"""
+        registry = MonitorRegistry(max_teams=2, shards=1, spill_dir=str(tmp_path))
+
+        record(registry.get("alpha"), messages=100)
+        record(registry.get("beta"))
+        record(registry.get("gamma"))  # Evicts alpha (least recently used)
+
+        assert "alpha" not in registry
+        assert (tmp_path / "alpha.json").exists()
+
+        restored = registry.get("alpha")
+        assert len(restored.history) == 1
+        assert restored.get_summary()["count"] == 1
+
+    def test_persistent_history_is_not_spilled(self, tmp_path):
+        """Test that SQLite-backed teams reload from the database, not a spill file"""
+        from storage import SQLiteHistory
+
+        db = str(tmp_path / "history.db")
+        registry = MonitorRegistry(
+            factory=lambda team_id: CuratorMonitor(team_size=10,
+                                                   history_store=SQLiteHistory(db, team=team_id)),
+            max_teams=1, shards=1, spill_dir=str(tmp_path / "spill"))
+        record(registry.get("alpha"))
+        record(registry.get("alpha"))
+        registry.get("beta")  # Evicts alpha
+
+        assert not list((tmp_path / "spill").iterdir())
+        restored = registry.get("alpha")
+        assert len(restored.history) == 2
+        assert restored.get_summary()["count"] == 2
+        registry.close()
+
+    def test_eviction_without_spill_warns(self, caplog):
+        """Test that discarding a team's history on eviction is logged"""
+        registry = MonitorRegistry(max_teams=1, shards=1)
+        record(registry.get("alpha"))
+        registry.get("beta")
+
+        assert "alpha" in caplog.text and "discarded" in caplog.text
+        assert len(registry.get("alpha").history) == 0
+
+    def test_concurrent_access(self):
+        """Test that concurrent first access creates a single monitor per team"""
+        registry = MonitorRegistry(shards=4)
+        teams = [f"team-{i % 20}" for i in range(400)]
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            monitors = list(pool.map(registry.get, teams))
+
+        assert len(registry) == 20
+        for team_id, monitor in zip(teams, monitors):
+            assert registry.get(team_id) is monitor
+
+    def test_concurrent_get_and_evict(self, tmp_path):
+        """Test that requests arriving mid-spill wait for it instead of losing history"""
+        def slow_export(monitor):
+            export = monitor.export_history
+
+            def export_history(path):
+                time.sleep(0.02)
+                export(path)
+            monitor.export_history = export_history
+            return monitor
+
+        registry = MonitorRegistry(factory=lambda team_id: slow_export(CuratorMonitor(team_size=10)),
+                                   max_teams=2, shards=1, spill_dir=str(tmp_path))
+        for _ in range(5):
+            record(registry.get("alpha"))
+
+        def worker(i):
+            if i % 3 == 0:
+                registry.evict("alpha")
+            elif i % 3 == 1:
+                registry.get(f"other-{i}")  # May push alpha out via LRU
+            return len(registry.get("alpha").history)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            lengths = list(pool.map(worker, range(60)))
+
+        assert lengths == [5] * 60
+        assert len(registry.get("alpha").history) == 5
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
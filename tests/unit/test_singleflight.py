@@ -0,0 +1,130 @@
+"""
+Unit Tests for Curator AI Request Coalescing
+
+Run with: pytest tests/unit/test_singleflight.py
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Test the thread-based group"""
+
+    def test_concurrent_calls_coalesced(self):
+        """Test that concurrent callers with one key share a single call"""
+        flights = SingleFlight()
+        executed = []
+        release = threading.Event()
+
+        def work():
+            executed.append(1)
+            release.wait(timeout=5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flights.do, "team-a", work) for _ in range(8)]
+            while flights.stats()["coalesced"] < 7:
+                time.sleep(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == ["result"] * 8
+        assert len(executed) == 1
+        assert flights.stats() == {"calls": 1, "coalesced": 7, "in_flight": 0}
+
+    def test_different_keys_not_coalesced(self):
+        """Test that each key gets its own call"""
+        flights = SingleFlight()
+
+        assert flights.do("a", lambda: 1) == 1
+        assert flights.do("b", lambda: 2) == 2
+        assert flights.stats()["calls"] == 2
+
+    def test_sequential_calls_rerun(self):
+        """Test that a finished call isn't reused"""
+        flights = SingleFlight()
+        counter = iter(range(10))
+
+        assert flights.do("a", lambda: next(counter)) == 0
+        assert flights.do("a", lambda: next(counter)) == 1
+
+    def test_error_shared_and_cleared(self):
+        """Test that errors propagate and don't poison the key"""
+        flights = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flights.do("a", fail)
+        assert flights.do("a", lambda: "ok") == "ok"
+
+
+class TestAsyncSingleFlight:
+    """Test the coroutine-based group"""
+
+    def test_concurrent_calls_coalesced(self):
+        """Test that concurrent awaiters share a single call"""
+        flights = AsyncSingleFlight()
+        executed = []
+
+        async def work():
+            executed.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(*[flights.do("a", work) for _ in range(5)])
+
+        assert asyncio.run(main()) == ["result"] * 5
+        assert len(executed) == 1
+        assert flights.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_cancelled_caller_does_not_cancel_call(self):
+        """Test that one caller's timeout leaves the shared call running"""
+        flights = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.1)
+            return "result"
+
+        async def impatient():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(flights.do("a", work), timeout=0.01)
+
+        async def main():
+            results = await asyncio.gather(impatient(), flights.do("a", work))
+            return results[1]
+
+        assert asyncio.run(main()) == "result"
+
+    def test_error_shared(self):
+        """Test that all awaiters see the call's exception"""
+        flights = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main():
+            return await asyncio.gather(*[flights.do("a", fail) for _ in range(3)],
+                                        return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flights.stats()["in_flight"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+"""
+Unit Tests for the Slack Bot's event handling
+
+Run with: pytest tests/unit/test_slack_bot.py
+"""
+
+import pytest
+import random
+import time
+import sys
+import os
+
+# Add curator-ai and the Slack integration to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/integrations/slack'))
+
+import bot as slack_bot
+from forks import ForkRegistry
+
+DATABASES = "database schema migration index query postgres transaction".split()
+LEDGERS = "blockchain token ledger consensus wallet decentralized mining".split()
+
+
+class FakeWebClient:
+    """Answers chat_postMessage like the Web API"""
+
+    def __init__(self):
+        self.posted = []
+
+    def chat_postMessage(self, channel, text, blocks=None):
+        self.posted.append((channel, text))
+        return {"ok": True, "channel": channel, "ts": f"{time.time():.6f}"}
+
+
+class FakeSocketModeClient:
+    """Records listeners and acknowledgements instead of opening a websocket"""
+
+    def __init__(self, app_token, web_client):
+        self.socket_mode_request_listeners = []
+        self.responses = []
+        self.connected = False
+
+    def connect(self):
+        self.connected = True
+
+    def send_socket_mode_response(self, response):
+        self.responses.append(response)
+
+    def deliver(self, envelope_id, event):
+        request = type("SocketModeRequest", (), {
+            "type": "events_api",
+            "envelope_id": envelope_id,
+            "payload": {"type": "event_callback", "event": event},
+        })()
+        for listener in self.socket_mode_request_listeners:
+            listener(self, request)
+
+
+@pytest.fixture
+def bot(monkeypatch):
+    # SlackBot.__init__ needs slack_sdk; build it around fakes instead
+    monkeypatch.setattr(slack_bot, "SocketModeClient", FakeSocketModeClient, raising=False)
+    monkeypatch.setattr(slack_bot, "SocketModeResponse",
+                        lambda envelope_id: ("ack", envelope_id), raising=False)
+    instance = object.__new__(slack_bot.SlackBot)
+    instance.client = FakeWebClient()
+    instance.forks = ForkRegistry()
+    instance.fork_threads = {}
+    return instance
+
+
+def message(channel, text, thread_ts=None, **extra):
+    event = {"type": "message", "channel": channel, "text": text, "ts": f"{time.time():.6f}", **extra}
+    if thread_ts is not None:
+        event["thread_ts"] = thread_ts
+    return event
+
+
+class TestMessageEvents:
+    """Test that Socket Mode message events reach fork divergence"""
+
+    def test_thread_replies_drive_fork_depth(self, bot):
+        """Test channel messages and fork thread replies delivered over Socket Mode"""
+        rng = random.Random(0)
+        socket = bot.connect("xapp-test")
+        assert socket.connected
+
+        for i in range(20):
+            socket.deliver(f"e{i}", message("C1", " ".join(rng.sample(DATABASES, 4))))
+        bot._handle_fork_command("C1", "U1", name="Ledgers")
+        ((channel, thread_ts), fork_id), = bot.fork_threads.items()
+        for i in range(20):
+            socket.deliver(f"f{i}", message(channel, " ".join(rng.sample(LEDGERS, 4)), thread_ts=thread_ts))
+
+        fork = bot.forks.get(fork_id)
+        assert fork.contributions == 20
+        assert fork.depth > 1.0
+        assert len(socket.responses) == 40   # Every envelope acknowledged
+
+    def test_ignored_events(self, bot):
+        """Test that edits, bot messages and other event types don't count"""
+        socket = bot.connect("xapp-test")
+        fork = bot.forks.open_fork("Ledgers", parent="C1")
+        bot.fork_threads[("C1", "1.0")] = fork.fork_id
+
+        socket.deliver("e1", message("C1", "token ledger", thread_ts="1.0", subtype="message_changed"))
+        socket.deliver("e2", message("C1", "token ledger", thread_ts="1.0", bot_id="B1"))
+        socket.deliver("e3", {"type": "reaction_added", "channel": "C1"})
+
+        assert bot.forks.get(fork.fork_id).contributions == 0
+        assert len(socket.responses) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
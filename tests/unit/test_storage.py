@@ -0,0 +1,195 @@
+"""
+Unit Tests for Curator AI SQLite Storage
+
+Run with: pytest tests/unit/test_storage.py
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import sqlite3
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from monitor import CuratorMonitor, TeamMetrics, ZcResult
+from storage import SQLiteHistory
+
+
+def make_result(when: datetime, zc: float = 0.5) -> ZcResult:
+    """Build a ZcResult at a given time"""
+    return ZcResult(
+        timestamp=when.isoformat(),
+        zc=zc,
+        v_generation=zc * 30,
+        b_social=30.0,
+        zone="GREEN",
+        mode="STUDY_HALL",
+        confidence=0.8,
+        trend="STABLE",
+        recommendation="Continue with async-first workflows."
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "curator_history.db")
+
+
+class TestSQLiteHistory:
+    """Test the SQLite history backend"""
+
+    def test_persists_across_restarts(self, db_path):
+        """Test that history survives closing and reopening the store"""
+        store = SQLiteHistory(db_path)
+        start = datetime.now()
+        for i in range(10):
+            store.append(make_result(start + timedelta(minutes=i), zc=i / 10))
+        store.close()
+
+        reopened = SQLiteHistory(db_path)
+        assert len(reopened) == 10
+        assert reopened[-1].zc == 0.9
+        assert reopened[0].zc == 0.0
+        assert reopened.latest().zc == 0.9
+        reopened.close()
+
+    def test_wal_mode_and_index(self, db_path):
+        """Test that the database uses WAL and the (team, ts) index"""
+        store = SQLiteHistory(db_path)
+        conn = sqlite3.connect(db_path)
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM zc_history WHERE team = ? AND ts >= ?",
+            ("default", 0)
+        ).fetchall()
+        assert "idx_zc_history_team_ts" in str(plan)
+
+        conn.close()
+        store.close()
+
+    def test_window_query_sees_pending_writes(self, db_path):
+        """Test that reads include results not yet flushed"""
+        store = SQLiteHistory(db_path, flush_interval=60)
+        start = datetime.now() - timedelta(hours=10)
+        for i in range(10):
+            store.append(make_result(start + timedelta(hours=i), zc=i))
+
+        window = store.since((start + timedelta(hours=7)).timestamp())
+
+        assert [r.zc for r in window] == [7, 8, 9]
+        assert [r.zc for r in store[-3:]] == [7, 8, 9]
+        store.close()
+
+    def test_teams_are_isolated(self, db_path):
+        """Test that teams sharing a database only see their own rows"""
+        alpha = SQLiteHistory(db_path, team="alpha")
+        beta = SQLiteHistory(db_path, team="beta")
+
+        alpha.append(make_result(datetime.now(), zc=0.1))
+        beta.append(make_result(datetime.now(), zc=0.9))
+        beta.append(make_result(datetime.now(), zc=1.1))
+
+        assert [r.zc for r in alpha.since(0)] == [0.1]
+        assert [r.zc for r in beta.since(0)] == [0.9, 1.1]
+        alpha.close()
+        beta.close()
+
+    def test_retention(self, db_path):
+        """Test that old rows are pruned on flush"""
+        store = SQLiteHistory(db_path, retention_hours=24)
+        start = datetime.now() - timedelta(hours=48)
+        for i in range(49):
+            store.append(make_result(start + timedelta(hours=i)))
+        store.flush()
+
+        assert len(store) == 25
+        assert len(store.since(0)) == 25
+        store.close()
+
+    def test_iteration_is_one_scan(self, db_path):
+        """Test that iterating runs a single ordered query, not one per row"""
+        store = SQLiteHistory(db_path)
+        start = datetime.now() - timedelta(hours=1)
+        for i in range(50):
+            store.append(make_result(start + timedelta(seconds=i), zc=i))
+        store.flush()
+
+        queries = []
+        store._conn.set_trace_callback(queries.append)
+        assert [r.zc for r in store] == list(range(50))
+        assert len([q for q in queries if q.startswith("SELECT")]) == 1
+        store.close()
+
+    def test_committed_mode_round_trip(self, db_path):
+        """Test that hysteresis fields survive a reload"""
+        store = SQLiteHistory(db_path)
+        result = make_result(datetime.now())
+        result.committed_zone, result.committed_mode = "YELLOW", "GUSH"
+        store.append(result)
+        store.close()
+
+        reopened = SQLiteHistory(db_path)
+        assert reopened[0] == result
+        reopened.close()
+
+    def test_migrates_old_schema(self, db_path):
+        """Test that databases without the committed columns are upgraded"""
+        conn = sqlite3.connect(db_path)
+        conn.execute("""CREATE TABLE zc_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, team TEXT NOT NULL, ts REAL NOT NULL,
+            timestamp TEXT NOT NULL, zc REAL NOT NULL, v_generation REAL NOT NULL,
+            b_social REAL NOT NULL, zone TEXT NOT NULL, mode TEXT NOT NULL,
+            confidence REAL NOT NULL, trend TEXT NOT NULL, recommendation TEXT NOT NULL)""")
+        conn.execute("INSERT INTO zc_history (team, ts, timestamp, zc, v_generation, b_social, "
+                     "zone, mode, confidence, trend, recommendation) VALUES "
+                     "('default', 0, '1970-01-01T00:00:00', 0.5, 15, 30, 'GREEN', "
+                     "'STUDY_HALL', 0.8, 'STABLE', 'ok')")
+        conn.commit()
+        conn.close()
+
+        store = SQLiteHistory(db_path)
+        store.append(make_result(datetime.now()))
+        assert [r.committed_zone for r in store] == [None, None]
+        store.close()
+
+    def test_failed_flush_keeps_batch(self, db_path):
+        """Test that results survive a failed write and land on the next flush"""
+        store = SQLiteHistory(db_path, flush_interval=60)
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TRIGGER reject BEFORE INSERT ON zc_history "
+                     "BEGIN SELECT RAISE(ABORT, 'disk full'); END")
+        conn.commit()
+        for i in range(3):
+            store.append(make_result(datetime.now() + timedelta(seconds=i), zc=i))
+
+        with pytest.raises(sqlite3.Error):
+            store.flush()
+        assert len(store) == 3
+
+        conn.execute("DROP TRIGGER reject")
+        conn.commit()
+        conn.close()
+        store.flush()
+        assert [r.zc for r in store.since(0)] == [0, 1, 2]
+        store.close()
+
+    def test_monitor_with_sqlite_backend(self, db_path):
+        """Test CuratorMonitor end to end on the SQLite backend"""
+        monitor = CuratorMonitor(team_size=10, history_store=SQLiteHistory(db_path))
+        for _ in range(3):
+            monitor.calculate_zc(TeamMetrics(
+                timestamp=datetime.now().isoformat(),
+                slack_messages=100
+            ))
+        monitor.history.close()
+
+        restarted = CuratorMonitor(team_size=10, history_store=SQLiteHistory(db_path))
+        assert len(restarted.get_history(hours=1)) == 3
+        restarted.history.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
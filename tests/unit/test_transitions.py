@@ -0,0 +1,148 @@
+"""
+Unit Tests for Curator AI Mode Transition Estimation
+
+Run with: pytest tests/unit/test_transitions.py
+"""
+
+import pytest
+import random
+from types import SimpleNamespace
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from monitor import CuratorMonitor, TeamMetrics
+from registry import MonitorRegistry
+from transitions import (APPENDIX_MATRIX, MODES, TransitionEstimator,
+                         stationary_distribution)
+
+
+def result(mode):
+    return SimpleNamespace(mode=mode)
+
+
+def simulate(matrix, steps, rng, start="STUDY_HALL"):
+    """Modes of a Markov chain with the given transition matrix"""
+    mode = start
+    modes = [mode]
+    for _ in range(steps):
+        row = matrix[MODES.index(mode)]
+        mode = rng.choices(MODES, weights=row)[0]
+        modes.append(mode)
+    return modes
+
+
+class TestStationaryDistribution:
+    """Test the linear solve"""
+
+    def test_appendix_matrix(self):
+        """Test πP = π for the §2.3 matrix"""
+        pi = stationary_distribution(APPENDIX_MATRIX)
+
+        assert sum(pi) == pytest.approx(1.0)
+        for j in range(3):
+            assert sum(pi[i] * APPENDIX_MATRIX[i][j] for i in range(3)) == pytest.approx(pi[j])
+        assert pi == pytest.approx([35 / 82, 29 / 82, 18 / 82])
+
+    def test_reducible_chain_falls_back_to_power_iteration(self):
+        """Test a chain with an absorbing state"""
+        pi = stationary_distribution([[0.5, 0.5, 0.0], [0.0, 1.0, 0.0], [0.0, 0.5, 0.5]])
+
+        assert pi == pytest.approx([0.0, 1.0, 0.0], abs=1e-6)
+
+
+class TestTransitionEstimator:
+    """Test incremental counting, smoothing and caching"""
+
+    def test_recovers_simulated_chain(self):
+        """Test that estimates converge to the generating matrix"""
+        rng = random.Random(2)
+        estimator = TransitionEstimator()
+        estimator.replay("a", map(result, simulate(APPENDIX_MATRIX, 20000, rng)))
+
+        fleet = estimator.fleet_summary()
+        assert fleet.transitions == 20000
+        for row, expected in zip(fleet.matrix, APPENDIX_MATRIX):
+            assert row == pytest.approx(expected, abs=0.02)
+        assert fleet.stationary == pytest.approx(stationary_distribution(APPENDIX_MATRIX), abs=0.03)
+
+    def test_sparse_team_shrinks_to_fleet(self):
+        """Test that a team with few samples borrows the fleet's rows"""
+        rng = random.Random(3)
+        estimator = TransitionEstimator()
+        for team in range(20):
+            estimator.replay(f"t{team}", map(result, simulate(APPENDIX_MATRIX, 500, rng)))
+        estimator.replay("new", map(result, ["JAM", "JAM"]))
+
+        fleet = estimator.fleet_summary()
+        new = estimator.team_summary("new")
+        assert new.transitions == 1
+        assert new.matrix[0] == pytest.approx(fleet.matrix[0])      # No STUDY_HALL data
+        assert new.matrix[2][2] > fleet.matrix[2][2]                # One JAM → JAM
+        assert estimator.team_summary("unknown") is None
+
+    def test_counts_are_per_team(self):
+        """Test that interleaved teams don't create cross-team transitions"""
+        estimator = TransitionEstimator()
+        for mode_a, mode_b in [("STUDY_HALL", "JAM")] * 3:
+            estimator.observe("a", result(mode_a))
+            estimator.observe("b", result(mode_b))
+
+        assert estimator.team_summary("a").counts[0] == [2, 0, 0]
+        assert estimator.team_summary("b").counts[2] == [0, 0, 2]
+        assert estimator.fleet_summary().transitions == 4
+
+    def test_stationary_cached_until_counts_change(self):
+        """Test that the solve runs once per change of counts"""
+        estimator = TransitionEstimator()
+        estimator.replay("a", map(result, ["STUDY_HALL", "GUSH", "JAM"]))
+
+        first = estimator.team_summary("a").stationary
+        assert estimator.team_summary("a").stationary is first
+        estimator.observe("a", result("JAM"))
+        assert estimator.team_summary("a").stationary is not first
+
+    def test_unknown_modes_ignored(self):
+        """Test that results without a valid mode are skipped"""
+        estimator = TransitionEstimator(mode_field="committed_mode")
+        assert not estimator.observe("a", SimpleNamespace(committed_mode=None))
+        assert not estimator.observe("a", SimpleNamespace(committed_mode="GUSH"))
+        assert estimator.observe("a", SimpleNamespace(committed_mode="JAM"))
+
+
+class TestRegistryTransitions:
+    """Test feeding the estimator from team monitors"""
+
+    def test_monitor_results_are_counted(self):
+        """Test that calculate_zc on registry monitors feeds the estimator"""
+        estimator = TransitionEstimator()
+        registry = MonitorRegistry(transitions=estimator)
+        for messages in [150, 300, 900]:
+            registry.get("a").calculate_zc(TeamMetrics(timestamp="", slack_messages=messages))
+
+        assert estimator.team_summary("a").counts == [[1, 0, 1], [0, 0, 0], [0, 0, 0]]
+
+    def test_spilled_history_replayed_once(self, tmp_path):
+        """Test that a reloaded team isn't counted twice"""
+        estimator = TransitionEstimator()
+        registry = MonitorRegistry(transitions=estimator, spill_dir=str(tmp_path))
+        for messages in [150, 900, 150]:
+            registry.get("a").calculate_zc(TeamMetrics(timestamp="", slack_messages=messages))
+        registry.evict("a")
+
+        registry.get("a").calculate_zc(TeamMetrics(timestamp="", slack_messages=900))
+
+        assert estimator.team_summary("a").transitions == 3
+
+    def test_listener_errors_do_not_break_calculation(self):
+        """Test that a failing listener is logged, not raised"""
+        monitor = CuratorMonitor(team_size=10)
+        monitor.add_listener(lambda r: 1 / 0)
+
+        assert monitor.calculate_zc(TeamMetrics(timestamp="", slack_messages=150)).zone == "GREEN"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,129 @@
+"""
+Unit Tests for Curator AI Trend Estimation
+
+Run with: pytest tests/unit/test_trend.py
+"""
+
+import pytest
+import random
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add curator-ai to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../tools/curator-ai'))
+
+from history import RingBufferHistory
+from monitor import CuratorMonitor, ZcResult
+from trend import TrendEstimator
+
+MINUTE = 60
+HOUR = 3600
+T0 = 1_700_000_000
+
+
+def least_squares(points):
+    """Reference slope of z over x"""
+    n = len(points)
+    mx = sum(x for x, _ in points) / n
+    mz = sum(z for _, z in points) / n
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    return sum((x - mx) * (z - mz) for x, z in points) / sxx
+
+
+class TestTrendEstimator:
+    """Test the windowed regression"""
+
+    def test_noise_does_not_flip_label(self):
+        """Test that minute-level noise around a flat level stays STABLE"""
+        rng = random.Random(5)
+        estimator = TrendEstimator(window_hours=6)
+        labels = [estimator.update(T0 + i * MINUTE, 0.6 + rng.uniform(-0.1, 0.1)).label
+                  for i in range(24 * 60)]
+
+        # The last-three-samples rule would flag ~1/3 of these samples
+        assert labels[360:].count("STABLE") / len(labels[360:]) > 0.95
+
+    def test_noisy_ramp_is_increasing(self):
+        """Test that a slow rise under noise is detected with its slope"""
+        rng = random.Random(6)
+        estimator = TrendEstimator(window_hours=6)
+        for i in range(12 * 60):
+            estimate = estimator.update(T0 + i * MINUTE, 0.4 + 0.05 * i / 60 + rng.gauss(0, 0.05))
+
+        assert estimate.label == "INCREASING"
+        assert estimate.slope == pytest.approx(0.05, rel=0.1)   # Zc per hour
+        assert estimate.change == pytest.approx(0.3, rel=0.1)
+        assert estimate.t_stat > 10
+        assert not estimate.by_index
+
+    def test_slope_matches_full_refit(self):
+        """Test running sums against a full regression over the window"""
+        rng = random.Random(7)
+        estimator = TrendEstimator(window_hours=2)
+        samples = []
+        t = T0
+        for step in range(5000):
+            t += rng.uniform(1, 300)
+            zc = rng.uniform(0.2, 1.4)
+            samples.append((t, zc))
+            estimate = estimator.update(t, zc)
+
+            if step % 251 == 250:
+                window = [((ts - t) / HOUR, z) for ts, z in samples if ts >= t - 2 * HOUR]
+                assert estimate.samples == len(window)
+                assert estimate.slope == pytest.approx(least_squares(window), abs=1e-9)
+
+        assert len(estimator) < 200
+
+    def test_sparse_samples_keep_minimum(self):
+        """Test that daily samples still get a trend from the last three"""
+        estimator = TrendEstimator(window_hours=24)
+        labels = [estimator.update(T0 + i * 24 * HOUR, zc).label for i, zc in
+                  enumerate([0.3, 0.5, 0.7, 0.9])]
+
+        assert labels == ["STABLE", "STABLE", "INCREASING", "INCREASING"]
+        assert len(estimator) == 3
+
+    def test_same_instant_uses_sample_index(self):
+        """Test that samples without a time spread are regressed on their order"""
+        estimator = TrendEstimator()
+        for zc in [0.8, 0.6, 0.4]:
+            estimate = estimator.update(T0, zc)
+
+        assert estimate.by_index
+        assert estimate.slope == pytest.approx(-0.2)
+        assert estimate.label == "DECREASING"
+
+    def test_small_change_is_stable(self):
+        """Test that a perfectly fitted but negligible slope isn't a trend"""
+        estimator = TrendEstimator(sensitivity=0.05)
+        for i, zc in enumerate([0.50, 0.51, 0.52]):
+            estimate = estimator.update(T0 + i * HOUR, zc)
+
+        assert estimate.label == "STABLE"
+
+
+class TestMonitorTrend:
+    """Test trend labels on CuratorMonitor results"""
+
+    def test_trend_rebuilt_from_history(self):
+        """Test that a monitor replays stored history into the estimator"""
+        now = datetime.now()
+        history = [
+            ZcResult(timestamp=(now - timedelta(hours=12 - i)).isoformat(), zc=0.3 + 0.05 * i,
+                     v_generation=0, b_social=30, zone="", mode="", confidence=0.8,
+                     trend="STABLE", recommendation="")
+            for i in range(12)
+        ]
+        store = RingBufferHistory()
+        store.extend(history)
+        monitor = CuratorMonitor(team_size=10, history_store=store)
+
+        assert monitor.trend_estimate.samples == 12
+        assert monitor.trend_estimate.label == "INCREASING"
+        assert monitor.trend_estimate.slope == pytest.approx(0.05)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,273 @@
+"""
+Unit Tests for the Zc Calculator CLI
+
+Run with: pytest tests/unit/test_zc_cli.py
+"""
+
+import pytest
+import io
+import json
+import subprocess
+import time
+import sys
+import os
+
+# Add CLI to path
+CLI_DIR = os.path.join(os.path.dirname(__file__), '../../tools/calculators/cli')
+sys.path.insert(0, CLI_DIR)
+
+import zc_cli
+from zc_cli import ZcCalculator, backfill, batch_process, read_rows
+
+# Modules a scalar call or --help may import beyond a bare interpreter
+# (typing, re, argparse and their dependencies: 31 on CPython 3.11). Unlike
+# wall-clock time this doesn't depend on the machine, and every new
+# top-level import shows up in it.
+MAX_STARTUP_IMPORTS = 35
+
+# Wall-clock overhead allowed over a bare interpreter (scalar invocation,
+# best of N); machine-dependent, so this check only runs when set.
+STARTUP_BUDGET_MS = os.environ.get("ZC_CLI_STARTUP_BUDGET_MS")
+
+# Modules a scalar calculation must not load
+HEAVY_MODULES = {"json", "csv", "shutil", "tempfile", "multiprocessing", "concurrent.futures"}
+
+ROWS = [
+    {"team": "a", "slack_messages": 150, "ai_outputs": 30},
+    {"team": "b", "slack_messages": 600, "ai_outputs": 90},
+    {"team": "c", "slack_messages": 900, "notion_updates": 40, "team_size": 5},
+]
+
+
+def run_batch(text: str, fmt: str, output_format: str = "ndjson"):
+    out, errors = io.StringIO(), io.StringIO()
+    counts = batch_process(read_rows(io.StringIO(text), fmt), out, output_format, errors)
+    return counts, out.getvalue(), errors.getvalue()
+
+
+class TestBatchMode:
+    """Test streaming NDJSON/CSV batch evaluation"""
+
+    def test_matches_single_calculation(self):
+        """Test that each batch row matches calculate()/interpret()"""
+        text = "".join(json.dumps(r) + "\n" for r in ROWS)
+        (written, failed), out, _ = run_batch(text, "ndjson")
+
+        assert (written, failed) == (3, 0)
+        for row, line in zip(ROWS, out.splitlines()):
+            result = json.loads(line)
+            calc = ZcCalculator()
+            v_gen, b_social = calc.estimate_from_metrics(
+                **{k: v for k, v in row.items() if k != "team"})
+            zc = calc.calculate(v_gen, b_social)
+            assert result["team"] == row["team"]
+            assert result["zc"] == pytest.approx(zc, abs=1e-4)
+            assert result["zone"] == calc.interpret(zc)["zone"]
+
+    def test_csv_in_csv_out(self):
+        """Test CSV input (string values, empty cells) and CSV output"""
+        text = "team,slack_messages,ai_outputs,team_size\na,150,30,\nb,600,90,10\n"
+        (written, _), out, _ = run_batch(text, "csv", output_format="csv")
+
+        lines = out.splitlines()
+        assert written == 2
+        assert lines[0] == "team,v_generation,b_social,zc,zone,mode"
+        assert lines[1].startswith("a,7.5,30.0,0.25,GREEN,")
+        assert ",YELLOW," in lines[2]
+
+    def test_bad_rows_reported_and_skipped(self):
+        """Test that invalid rows go to the error stream with line numbers"""
+        text = '{"slack_messages": 10}\nnot json\n\n{"slack_messages": "x"}\n[1]\n{"team_size": 0}\n'
+        (written, failed), out, errors = run_batch(text, "ndjson")
+
+        assert (written, failed) == (1, 4)
+        assert len(out.splitlines()) == 1
+        assert [e.split(":")[0] for e in errors.splitlines()] == \
+            ["line 2", "line 4", "line 5", "line 6"]
+
+    @pytest.mark.parametrize("row", [
+        '{"slack_messages": 10, "timeframe_hours": 0}',
+        '{"slack_messages": 1e400}',
+        '{"slack_messages": 10, "timeframe_hours": "nan"}',
+        '{"slack_messages": 10, "processing_hours_per_person": -1}',
+    ])
+    def test_out_of_range_rows_reported(self, row):
+        """Test that zero, overflowing and NaN inputs are per-row errors, not crashes"""
+        text = '{"slack_messages": 10}\n' + row + '\n{"slack_messages": 20}\n'
+        (written, failed), out, errors = run_batch(text, "ndjson")
+
+        assert (written, failed) == (2, 1)
+        assert errors.startswith("line 2: ")
+        for line in out.splitlines():
+            json.loads(line, parse_constant=lambda c: pytest.fail(f"{c} in output"))
+
+    def test_rows_consumed_lazily(self):
+        """Test that results are written before the input is exhausted"""
+        out = io.StringIO()
+        seen = []
+
+        def rows():
+            for i in range(3):
+                seen.append(out.getvalue().count("\n"))
+                yield i + 1, {"slack_messages": i}, None
+
+        batch_process(rows(), out, errors=io.StringIO())
+        assert seen == [0, 1, 2]
+
+    def test_format_detection(self):
+        """Test format detection from extension and first line"""
+        assert zc_cli._detect_format("m.csv", "{") == "csv"
+        assert zc_cli._detect_format("m.jsonl", "a,b") == "ndjson"
+        assert zc_cli._detect_format("-", '{"slack_messages": 1}') == "ndjson"
+        assert zc_cli._detect_format("-", "team,slack_messages") == "csv"
+
+
+class TestBackfill:
+    """Test multi-file backfill across a process pool"""
+
+    @pytest.fixture
+    def exports(self, tmp_path):
+        for t in range(4):
+            with open(tmp_path / f"team{t}.ndjson", "w") as f:
+                for i in range(50):
+                    f.write(json.dumps({"timestamp": f"2026-01-{i % 28 + 1:02d}",
+                                        "slack_messages": 20 * i + t}) + "\n")
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "mixed.csv").write_text(
+            "team,slack_messages\nx,100\ny,bad\n")
+        (tmp_path / "nested" / "single.json").write_text('{"slack_messages": 5}')
+        (tmp_path / "notes.txt").write_text("ignored")
+        return tmp_path
+
+    def test_pool_matches_serial(self, exports):
+        """Test that parallel output is identical to a single worker"""
+        serial, parallel = io.StringIO(), io.StringIO()
+        s1 = backfill(str(exports), serial, workers=1)
+        s2 = backfill(str(exports), parallel, workers=3)
+
+        assert serial.getvalue() == parallel.getvalue()
+        assert (s2["files"], s2["rows"], s2["failed"], s2["workers"]) == (6, 202, 1, 3)
+        assert s1["teams"] == s2["teams"]
+
+    def test_rows_match_batch_mode(self, exports):
+        """Test that backfill uses the same per-row logic as --batch"""
+        out = io.StringIO()
+        backfill(str(exports), out, workers=2)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+
+        team0 = [r for r in rows if r["team"] == "team0"]
+        assert len(team0) == 50
+        assert team0[10] == ZcCalculator().evaluate_row(
+            {"team": "team0", "timestamp": "2026-01-11", "slack_messages": 200})
+        assert {r["team"] for r in rows} >= {"x", "single"}
+
+    def test_bad_row_in_one_file(self, exports):
+        """Test that an invalid row fails only that row, in any worker"""
+        with open(exports / "team2.ndjson", "a") as f:
+            f.write('{"slack_messages": 10, "timeframe_hours": 0}\n')
+        out = io.StringIO()
+        summary = backfill(str(exports), out, workers=3)
+
+        assert (summary["rows"], summary["failed"]) == (202, 2)
+        assert any(e.endswith("team2.ndjson: line 51: timeframe_hours must be a finite "
+                              "number greater than 0") for e in summary["errors"])
+        assert len(out.getvalue().splitlines()) == 202
+
+    def test_unexpected_error_fails_the_file(self, exports, monkeypatch):
+        """Test that an unexpected exception drops one file instead of the backfill"""
+        evaluate_row = ZcCalculator.evaluate_row
+
+        def flaky(self, row):
+            if row.get("team") == "x":
+                raise RuntimeError("boom")
+            return evaluate_row(self, row)
+
+        monkeypatch.setattr(ZcCalculator, "evaluate_row", flaky)
+        out = io.StringIO()
+        summary = backfill(str(exports), out, workers=1)
+
+        assert (summary["rows"], summary["failed"]) == (201, 1)
+        assert summary["errors"] == [f"{exports / 'nested' / 'mixed.csv'}: RuntimeError: boom"]
+        assert '"team": "x"' not in out.getvalue()
+
+    def test_csv_output_single_header(self, exports):
+        """Test that CSV parts are consolidated under one header"""
+        out = io.StringIO()
+        summary = backfill(str(exports), out, output_format="csv", workers=2)
+        lines = out.getvalue().splitlines()
+
+        assert lines[0] == "team,timestamp,v_generation,b_social,zc,zone,mode"
+        assert len(lines) == summary["rows"] + 1
+        assert summary["errors"][0].endswith("line 3: invalid literal for int() with base 10: 'bad'")
+
+
+def run_cli(*args, python_args=()):
+    return subprocess.run([sys.executable, *python_args, os.path.join(CLI_DIR, "zc_cli.py"), *args],
+                          capture_output=True, text=True, check=True)
+
+
+def imported_modules(*args) -> set:
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args],
+                          capture_output=True, text=True, check=True)
+    return {line.split("|")[-1].strip() for line in proc.stderr.splitlines()
+            if line.startswith("import time:")}
+
+
+class TestStartup:
+    """Test the lazy imports of the scalar path"""
+
+    def test_scalar_path_skips_heavy_imports(self):
+        """Test that a scalar call imports no mode-specific modules"""
+        proc = run_cli("--vgen", "45", "--bsocial", "30", python_args=("-X", "importtime"))
+        imported = {line.split("|")[-1].strip() for line in proc.stderr.splitlines()}
+
+        assert "RED" in proc.stdout
+        assert not imported & HEAVY_MODULES
+
+    @pytest.mark.parametrize("args", [["--vgen", "45", "--bsocial", "30"], ["--help"]])
+    def test_startup_import_cap(self, args):
+        """Test that startup imports stay under the cap"""
+        bare = imported_modules("-c", "pass")
+        extra = imported_modules(os.path.join(CLI_DIR, "zc_cli.py"), *args) - bare
+
+        assert len(extra) <= MAX_STARTUP_IMPORTS, \
+            f"{len(extra)} modules imported at startup (cap {MAX_STARTUP_IMPORTS}): {sorted(extra)}"
+
+    def test_module_import_skips_argparse(self):
+        """Test that importing the module (as batch workers do) doesn't build the CLI"""
+        imported = imported_modules("-c", f"import sys; sys.path.insert(0, {CLI_DIR!r}); import zc_cli")
+
+        assert "zc_cli" in imported
+        assert "argparse" not in imported
+
+    @pytest.mark.skipif(STARTUP_BUDGET_MS is None, reason="set ZC_CLI_STARTUP_BUDGET_MS to run")
+    def test_startup_budget(self):
+        """Test that a scalar call stays within the startup budget"""
+        def best_ms(cmd):
+            best = float("inf")
+            for _ in range(7):
+                start = time.perf_counter()
+                subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True)
+                best = min(best, time.perf_counter() - start)
+            return best * 1000
+
+        budget = float(STARTUP_BUDGET_MS)
+        bare = best_ms([sys.executable, "-c", "pass"])
+        cli = best_ms([sys.executable, os.path.join(CLI_DIR, "zc_cli.py"),
+                       "--vgen", "45", "--bsocial", "30", "--json"])
+
+        assert cli - bare < budget, \
+            f"startup {cli - bare:.1f}ms over bare interpreter (budget {budget}ms)"
+
+    def test_json_output(self):
+        """Test that --json output is valid JSON with the interpretation fields"""
+        calc = ZcCalculator()
+        result = json.loads(calc.format_json(0.5, calc.interpret(0.5), 15.0, 30.0))
+
+        assert result == {"zc": 0.5, "v_generation": 15.0, "b_social": 30.0, **calc.interpret(0.5)}
+        proc = run_cli("--vgen", "45", "--bsocial", "30", "--json")
+        assert json.loads(proc.stdout)["zone"] == "RED"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
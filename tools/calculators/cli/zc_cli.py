@@ -7,13 +7,48 @@ Usage:
     python zc_cli.py --vgen 45 --bsocial 30
     python zc_cli.py --interactive
     python zc_cli.py --monitor slack_export.json
+    python zc_cli.py --batch metrics.ndjson > results.ndjson
+    python zc_cli.py backfill exports/ --output history.ndjson
 """
 
+# Startup matters: the CLI runs from shell scripts and cron many times a
+# minute. argparse, json, csv, datetime and the process pool are imported
+# where they are used, so importing this module (batch workers, tests)
+# loads none of them.
+import math
+import os
 import sys
-import json
-import argparse
-from datetime import datetime, timedelta
-from typing import Dict, Tuple
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+# Row fields read by estimate_from_metrics (batch mode); other fields are passed through
+METRIC_ARGS = {
+    'slack_messages': int,
+    'notion_updates': int,
+    'ai_outputs': int,
+    'emails': int,
+    'timeframe_hours': float,
+    'team_size': int,
+    'processing_hours_per_person': float,
+}
+
+# Metric fields that must be finite and greater than 0 when given
+CAPACITY_ARGS = ('timeframe_hours', 'team_size', 'processing_hours_per_person')
+
+RESULT_FIELDS = ('v_generation', 'b_social', 'zc', 'zone', 'mode')
+
+# Backfill: metrics files picked up from the input directory, and CSV columns
+BACKFILL_EXTENSIONS = ('.ndjson', '.jsonl', '.json', '.csv')
+BACKFILL_FIELDS = ('team', 'timestamp') + RESULT_FIELDS
+
+# Per-row error messages kept per backfilled file
+MAX_FILE_ERRORS = 10
+
+
+def _now_iso() -> str:
+    from datetime import datetime
+    return datetime.now().isoformat()
 
 
 class ZcCalculator:
@@ -33,7 +68,7 @@ class ZcCalculator:
         
         zc = v_generation / b_social
         self.history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _now_iso(),
             'v_generation': v_generation,
             'b_social': b_social,
             'zc': zc
@@ -98,6 +133,68 @@ class ZcCalculator:
         
         return v_generation, b_social
     
+    def evaluate_row(self, row: Dict) -> Dict:
+        """
+        Compute Zc, zone and mode for one metrics row (batch mode)
+        
+        Unlike calculate(), nothing is kept in history, so memory stays
+        constant however many rows are evaluated.
+        
+        Args:
+            row: Metric fields (see METRIC_ARGS); numbers or numeric strings,
+                 missing or empty fields use the estimate_from_metrics defaults
+        
+        Returns:
+            The row's non-metric fields plus v_generation, b_social, zc, zone, mode
+        
+        Raises:
+            ValueError: On non-numeric or out-of-range metrics, or a
+                        timeframe, team size or processing time that isn't
+                        a finite number greater than 0
+        """
+        kwargs = {}
+        for name, convert in METRIC_ARGS.items():
+            value = row.get(name)
+            if value is not None and value != '':
+                try:
+                    kwargs[name] = convert(value)
+                except OverflowError:
+                    raise ValueError(f"{name} out of range: {value!r}")
+        for name in CAPACITY_ARGS:
+            if name in kwargs and not (math.isfinite(kwargs[name]) and kwargs[name] > 0):
+                raise ValueError(f"{name} must be a finite number greater than 0")
+        
+        try:
+            v_gen, b_social = self.estimate_from_metrics(**kwargs)
+        except OverflowError:
+            raise ValueError("metrics out of range")
+        if not (math.isfinite(v_gen) and math.isfinite(b_social)):
+            raise ValueError("metrics out of range")
+        if b_social <= 0:
+            raise ValueError("B_social must be greater than 0")
+        zc = v_gen / b_social
+        interpretation = self.interpret(zc)
+        
+        result = {k: v for k, v in row.items() if k not in METRIC_ARGS}
+        result.update(
+            v_generation=round(v_gen, 4),
+            b_social=round(b_social, 4),
+            zc=round(zc, 4),
+            zone=interpretation['zone'],
+            mode=interpretation['mode']
+        )
+        return result
+    
+    def format_json(self, zc: float, interpretation: Dict[str, str],
+                    v_gen: float, b_social: float) -> str:
+        """Format calculation results as one JSON line (for scripts; no ANSI)"""
+        return _dumps({
+            'zc': round(zc, 4),
+            'v_generation': round(v_gen, 4),
+            'b_social': round(b_social, 4),
+            **interpretation
+        })
+    
     def format_output(self, zc: float, interpretation: Dict[str, str], 
                      v_gen: float, b_social: float, verbose: bool = False) -> str:
         """Format calculation results for display"""
@@ -134,6 +231,11 @@ class ZcCalculator:
         return '\n'.join(output)
 
 
+def _dumps(obj) -> str:
+    import json
+    return json.dumps(obj, ensure_ascii=False)
+
+
 def interactive_mode():
     """Run calculator in interactive mode"""
     calc = ZcCalculator()
@@ -190,8 +292,10 @@ def interactive_mode():
     print(calc.format_output(zc, interpretation, v_gen, b_social, verbose=True))
 
 
-def monitor_mode(filepath: str):
+def monitor_mode(filepath: str, as_json: bool = False):
     """Monitor Zc from JSON metrics file"""
+    import json
+    
     calc = ZcCalculator()
     
     try:
@@ -211,7 +315,10 @@ def monitor_mode(filepath: str):
         
         zc = calc.calculate(v_gen, b_social)
         interpretation = calc.interpret(zc)
-        print(calc.format_output(zc, interpretation, v_gen, b_social, verbose=True))
+        if as_json:
+            print(calc.format_json(zc, interpretation, v_gen, b_social))
+        else:
+            print(calc.format_output(zc, interpretation, v_gen, b_social, verbose=True))
         
     except FileNotFoundError:
         print(f"Error: File '{filepath}' not found")
@@ -221,15 +328,367 @@ def monitor_mode(filepath: str):
         print(f"Error: {e}")
 
 
-def main():
+def _detect_format(path: str, first_line: str) -> str:
+    """Guess ndjson or csv from the file extension, else from the first line"""
+    if path.endswith('.csv'):
+        return 'csv'
+    if path.endswith(('.ndjson', '.jsonl', '.json')):
+        return 'ndjson'
+    return 'ndjson' if first_line.lstrip().startswith('{') else 'csv'
+
+
+def read_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """
+    Stream metric rows from an NDJSON or CSV file, one line at a time
+    
+    Args:
+        stream: Open text stream
+        fmt: 'ndjson' or 'csv'
+    
+    Yields:
+        (line number, row or None, error or None)
+    """
+    import json
+    
+    if fmt == 'csv':
+        import csv
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+    
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"invalid JSON: {e}"
+            continue
+        if isinstance(row, dict):
+            yield line_no, row, None
+        else:
+            yield line_no, None, "expected a JSON object"
+
+
+class _RowWriter:
+    """
+    Writes result rows as NDJSON or CSV
+    
+    CSV columns are ``fields`` if given, else the first row's fields; the
+    header line can be left out (backfill writes it once for all files).
+    """
+    
+    def __init__(self, stream: TextIO, fmt: str,
+                 fields: Optional[Sequence[str]] = None, header: bool = True):
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = fields
+        self.header = header
+        self.csv_writer = None
+    
+    def write(self, result: Dict):
+        if self.fmt == 'ndjson':
+            self.stream.write(_dumps(result) + '\n')
+            return
+        if self.csv_writer is None:
+            import csv
+            fields = self.fields or \
+                [k for k in result if k not in RESULT_FIELDS] + list(RESULT_FIELDS)
+            self.csv_writer = csv.DictWriter(self.stream, fieldnames=fields,
+                                             extrasaction='ignore', lineterminator='\n')
+            if self.header:
+                self.csv_writer.writeheader()
+        self.csv_writer.writerow(result)
+
+
+def batch_process(rows: Iterable[Tuple[int, Optional[Dict], Optional[str]]],
+                  out: TextIO, output_format: str = 'ndjson',
+                  errors: TextIO = sys.stderr,
+                  writer: Optional[_RowWriter] = None) -> Tuple[int, int]:
+    """
+    Evaluate every row and write results as they are computed
+    
+    Args:
+        rows: Output of read_rows
+        out: Stream for results
+        output_format: 'ndjson' or 'csv'
+        errors: Stream for per-row error messages
+        writer: Optional preconfigured writer (overrides out/output_format)
+    
+    Returns:
+        Tuple of (rows written, rows failed)
+    """
+    calc = ZcCalculator()
+    writer = writer or _RowWriter(out, output_format)
+    written = failed = 0
+    
+    for line_no, row, error in rows:
+        if row is not None:
+            try:
+                writer.write(calc.evaluate_row(row))
+                written += 1
+                continue
+            except (TypeError, ValueError) as e:
+                error = str(e)
+        failed += 1
+        errors.write(f"line {line_no}: {error}\n")
+    
+    return written, failed
+
+
+def _chain_first(first_line: str, stream: TextIO) -> Iterator[str]:
+    if first_line:
+        yield first_line
+    yield from stream
+
+
+def batch_mode(path: str, input_format: str = 'auto', output_format: str = 'ndjson') -> int:
+    """
+    Stream metric rows from a file (or '-' for stdin) to Zc results on stdout
+    
+    Returns:
+        Exit code (1 if the input couldn't be read or any row failed)
+    """
+    try:
+        stream = sys.stdin if path == '-' else open(path, 'r', newline='')
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    try:
+        first_line = stream.readline()
+        fmt = input_format if input_format != 'auto' else _detect_format(path, first_line)
+        # Put the sniffed line back in front of the rest of the stream
+        lines = _chain_first(first_line, stream)
+        written, failed = batch_process(read_rows(lines, fmt), sys.stdout, output_format)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`)
+        return 0
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    
+    print(f"Processed {written + failed} rows ({failed} failed)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def discover_metrics_files(directory: str) -> List[str]:
+    """All metrics files (by extension) below directory, sorted by path"""
+    found = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.endswith(BACKFILL_EXTENSIONS):
+                found.append(os.path.join(root, name))
+    return sorted(found)
+
+
+def _file_rows(path: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """Rows of a metrics file: NDJSON/CSV streamed, .json as one object or a list"""
+    import json
+    
+    with open(path, 'r', newline='') as f:
+        if path.endswith('.json'):
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                yield 1, None, f"invalid JSON: {e}"
+                return
+            for i, row in enumerate(data if isinstance(data, list) else [data], start=1):
+                yield (i, row, None) if isinstance(row, dict) else (i, None, "expected a JSON object")
+            return
+        yield from read_rows(f, _detect_format(path, ''))
+
+
+def _with_team(rows, team: str, teams: Counter):
+    """Default each row's team to the file name and count rows per team"""
+    for line_no, row, error in rows:
+        if row is not None:
+            if not row.get('team'):
+                row['team'] = team
+            teams[row['team']] += 1
+        yield line_no, row, error
+
+
+def backfill_file(path: str, part_path: str, output_format: str = 'ndjson') -> Dict:
+    """
+    Evaluate one metrics file into a part file (runs in a worker process)
+    
+    Args:
+        path: Metrics file (rows without a team use the file name)
+        part_path: Where to write this file's results (CSV without header)
+        output_format: 'ndjson' or 'csv'
+    
+    Bad rows are counted and reported per row. Any other failure (unreadable
+    file, unexpected exception) fails the whole file: its partial results
+    are dropped and the error is reported instead of reaching the pool.
+    
+    Returns:
+        Stats dict: path, rows, failed, errors, teams, seconds, cpu_seconds
+    """
+    start, cpu_start = time.perf_counter(), time.process_time()
+    team = os.path.splitext(os.path.basename(path))[0]
+    teams = Counter()
+    errors = []
+    
+    class _Errors:
+        def write(self, message: str):
+            if len(errors) < MAX_FILE_ERRORS:
+                errors.append(f"{path}: {message.rstrip()}")
+    
+    try:
+        with open(part_path, 'w', newline='') as out:
+            writer = _RowWriter(out, output_format, fields=BACKFILL_FIELDS, header=False)
+            written, failed = batch_process(_with_team(_file_rows(path), team, teams),
+                                            out, errors=_Errors(), writer=writer)
+    except Exception as e:
+        try:
+            open(part_path, 'w').close()
+        except OSError:
+            pass
+        written, failed = 0, 1
+        errors.append(f"{path}: {type(e).__name__}: {e}")
+    
+    return {
+        'path': path,
+        'rows': written,
+        'failed': failed,
+        'errors': errors,
+        'teams': dict(teams),
+        'seconds': time.perf_counter() - start,
+        'cpu_seconds': time.process_time() - cpu_start,
+    }
+
+
+def backfill(directory: str, out: TextIO, output_format: str = 'ndjson',
+             workers: Optional[int] = None) -> Dict:
+    """
+    Re-derive Zc series for every metrics file in a directory
+    
+    Files are sharded across a process pool (largest first, so one big file
+    doesn't finish last). Each worker writes its results to a part file;
+    the parts are then concatenated into ``out`` in path order, so output
+    is deterministic and memory stays bounded.
+    
+    Args:
+        directory: Directory searched recursively for metrics files
+        out: Stream for the consolidated results
+        output_format: 'ndjson' or 'csv'
+        workers: Worker processes (default: CPU count)
+    
+    Returns:
+        Summary dict: files, rows, failed, teams, workers, seconds,
+        cpu_seconds, rows_per_second, errors
+    """
+    import csv
+    import shutil
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+    
+    start = time.perf_counter()
+    paths = discover_metrics_files(directory)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths) or 1))
+    
+    part_dir = tempfile.mkdtemp(prefix='zc-backfill-')
+    parts = {path: os.path.join(part_dir, f"{i:06d}.part") for i, path in enumerate(paths)}
+    by_size = sorted(paths, key=lambda p: os.path.getsize(p), reverse=True)
+    
+    try:
+        if workers == 1:
+            stats = [backfill_file(p, parts[p], output_format) for p in by_size]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(backfill_file, p, parts[p], output_format) for p in by_size]
+                stats = [f.result() for f in futures]
+        
+        if output_format == 'csv':
+            csv.writer(out, lineterminator='\n').writerow(BACKFILL_FIELDS)
+        for path in paths:
+            if not os.path.exists(parts[path]):
+                continue
+            with open(parts[path], 'r', newline='') as part:
+                shutil.copyfileobj(part, out)
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+    
+    teams = Counter()
+    for s in stats:
+        teams.update(s['teams'])
+    rows = sum(s['rows'] for s in stats)
+    seconds = time.perf_counter() - start
+    return {
+        'files': len(paths),
+        'rows': rows,
+        'failed': sum(s['failed'] for s in stats),
+        'teams': dict(teams),
+        'workers': workers,
+        'seconds': round(seconds, 3),
+        'cpu_seconds': round(sum(s['cpu_seconds'] for s in stats), 3),
+        'rows_per_second': round(rows / seconds) if seconds > 0 else 0,
+        'errors': [e for s in stats for e in s['errors']][:MAX_FILE_ERRORS],
+    }
+
+
+def backfill_mode(directory: str, output: Optional[str], output_format: str = 'ndjson',
+                  workers: Optional[int] = None) -> int:
+    """
+    Run backfill and print a timing summary to stderr
+    
+    Returns:
+        Exit code (1 if the directory is missing or any row failed)
+    """
+    if not os.path.isdir(directory):
+        print(f"Error: Directory '{directory}' not found", file=sys.stderr)
+        return 1
+    
+    if output:
+        with open(output, 'w', newline='') as out:
+            summary = backfill(directory, out, output_format, workers)
+    else:
+        summary = backfill(directory, sys.stdout, output_format, workers)
+        sys.stdout.flush()
+    
+    for error in summary['errors']:
+        print(error, file=sys.stderr)
+    print(f"Backfilled {summary['rows']} rows for {len(summary['teams'])} teams "
+          f"from {summary['files']} files ({summary['failed']} failed)", file=sys.stderr)
+    print(f"  {summary['seconds']:.2f}s wall, {summary['cpu_seconds']:.2f}s CPU, "
+          f"{summary['workers']} workers, {summary['rows_per_second']} rows/s", file=sys.stderr)
+    return 1 if summary['failed'] else 0
+
+
+def _terminal_width() -> int:
+    """Terminal width as shutil.get_terminal_size() reports it, without importing shutil"""
+    try:
+        return int(os.environ['COLUMNS'])
+    except (KeyError, ValueError):
+        pass
+    try:
+        return os.get_terminal_size(sys.__stdout__.fileno()).columns
+    except (AttributeError, ValueError, OSError):
+        return 80
+
+
+def _build_parser():
+    import argparse
+    
+    def formatter(cls):
+        # argparse builds a formatter for every add_argument(); with the
+        # default width each one would import shutil (and bz2, lzma, ...)
+        return lambda prog: cls(prog, width=_terminal_width() - 2)
+    
     parser = argparse.ArgumentParser(
         description='Calculate Cognitive Impedance (Zc) ratio for your team',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+        formatter_class=formatter(argparse.RawDescriptionHelpFormatter),
         epilog="""
 Examples:
   %(prog)s --vgen 45 --bsocial 30
   %(prog)s --interactive
   %(prog)s --monitor metrics.json
+  %(prog)s --batch metrics.ndjson > results.ndjson
+  %(prog)s --batch - --output-format csv < metrics.csv
+  %(prog)s backfill exports/ --output history.ndjson --workers 8
   
   # Estimate from metrics
   %(prog)s --slack 150 --notion 20 --ai 30 --emails 40 --team-size 10
@@ -242,6 +701,12 @@ For more information: https://github.com/pyragogy/protocols
     parser.add_argument('--bsocial', type=float, help='B_social (processing capacity per hour)')
     parser.add_argument('--interactive', action='store_true', help='Run in interactive mode')
     parser.add_argument('--monitor', type=str, help='Monitor from JSON file')
+    parser.add_argument('--batch', type=str, metavar='FILE',
+                       help='Stream NDJSON/CSV metric rows (- for stdin) to results on stdout')
+    parser.add_argument('--input-format', choices=['auto', 'ndjson', 'csv'], default='auto',
+                       help='Batch input format (default: from extension or first line)')
+    parser.add_argument('--output-format', choices=['ndjson', 'csv'], default='ndjson',
+                       help='Batch output format (default: ndjson)')
     
     # Metric-based estimation
     parser.add_argument('--slack', type=int, help='Slack messages in last 24h')
@@ -253,8 +718,33 @@ For more information: https://github.com/pyragogy/protocols
                        help='Processing hours per person per day (default: 3.0)')
     
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--json', action='store_true',
+                       help='Print one JSON object instead of the formatted report')
     
-    args = parser.parse_args()
+    subparsers = parser.add_subparsers(dest='command', metavar='{backfill}')
+    backfill_parser = subparsers.add_parser(
+        'backfill',
+        formatter_class=formatter(argparse.HelpFormatter),
+        help='Re-derive Zc for every metrics file in a directory (parallel)',
+        description='Evaluate every .ndjson/.jsonl/.json/.csv file below DIR in a '
+                    'process pool and write the consolidated results. Rows without '
+                    'a team field use the file name.'
+    )
+    backfill_parser.add_argument('directory', metavar='DIR', help='Directory with metrics files')
+    backfill_parser.add_argument('--output', '-o', type=str, help='Output file (default: stdout)')
+    backfill_parser.add_argument('--output-format', choices=['ndjson', 'csv'], default='ndjson',
+                                 help='Output format (default: ndjson)')
+    backfill_parser.add_argument('--workers', '-j', type=int, help='Worker processes (default: CPU count)')
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    args = _build_parser().parse_args(argv)
+    
+    # Backfill subcommand
+    if args.command == 'backfill':
+        sys.exit(backfill_mode(args.directory, args.output, args.output_format, args.workers))
     
     calc = ZcCalculator()
     
@@ -263,9 +753,13 @@ For more information: https://github.com/pyragogy/protocols
         interactive_mode()
         return
     
+    # Batch mode
+    if args.batch:
+        sys.exit(batch_mode(args.batch, args.input_format, args.output_format))
+    
     # Monitor mode
     if args.monitor:
-        monitor_mode(args.monitor)
+        monitor_mode(args.monitor, as_json=args.json)
         return
     
     # Metric-based estimation
@@ -283,12 +777,15 @@ For more information: https://github.com/pyragogy/protocols
         v_gen = args.vgen
         b_social = args.bsocial
     else:
-        parser.print_help()
+        _build_parser().print_help()
         return
     
     zc = calc.calculate(v_gen, b_social)
     interpretation = calc.interpret(zc)
-    print(calc.format_output(zc, interpretation, v_gen, b_social, verbose=args.verbose))
+    if args.json:
+        print(calc.format_json(zc, interpretation, v_gen, b_social))
+    else:
+        print(calc.format_output(zc, interpretation, v_gen, b_social, verbose=args.verbose))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,165 @@
+"""
+Curator AI - Streaming Aggregates
+Incremental summary statistics over Zc history
+
+Summary endpoints (dashboard /api/stats/summary, Slack /status, Discord
+!status) need the average Zc and zone distribution over a window. Instead of
+re-scanning history on every request, ZcAggregates keeps cumulative totals per
+time bucket: the totals for any window are the difference of two prefix sums,
+found by binary search over bucket ids.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Optional
+import time
+
+ZONES = ("GREEN", "YELLOW", "RED")
+
+
+class ZcAggregates:
+    """
+    Bucketed running totals of Zc results
+
+    Each bucket stores the cumulative count, Zc sum and per-zone counts up to
+    and including that bucket. Updating is O(1) for in-order samples; a
+    summary over any window is O(log B) in the number of buckets, independent
+    of how many results were recorded. Windows are resolved to bucket
+    boundaries (``bucket_seconds``).
+    """
+
+    def __init__(self, bucket_seconds: int = 300, retention_hours: float = 744):
+        """
+        Initialize aggregates
+
+        Args:
+            bucket_seconds: Time resolution of the buckets
+            retention_hours: How long buckets are kept (default: 31 days)
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be greater than 0")
+
+        self.bucket_seconds = bucket_seconds
+        self.retention_hours = retention_hours
+        self.clear()
+
+    def clear(self):
+        """Reset all totals"""
+        self._ids = array('q')
+        self._count = array('q')
+        self._sum = array('d')
+        self._zones = {zone: array('q') for zone in ZONES}
+        self._start = 0  # Index of the oldest live bucket
+        # Cumulative totals of evicted buckets
+        self._base_count = 0
+        self._base_sum = 0.0
+        self._base_zones = {zone: 0 for zone in ZONES}
+
+    def add(self, timestamp: float, zc: float, zone: str):
+        """
+        Record one Zc result
+
+        Args:
+            timestamp: Epoch seconds of the result
+            zc: Zc value
+            zone: GREEN, YELLOW or RED
+        """
+        bucket = int(timestamp // self.bucket_seconds)
+        last = len(self._ids) - 1
+
+        if last >= self._start and bucket < self._ids[last]:
+            self._add_out_of_order(bucket, zc, zone)
+            return
+
+        if last < self._start or bucket > self._ids[last]:
+            self._ids.append(bucket)
+            self._count.append(self._count[last] if last >= 0 else self._base_count)
+            self._sum.append(self._sum[last] if last >= 0 else self._base_sum)
+            for z in ZONES:
+                self._zones[z].append(self._zones[z][last] if last >= 0 else self._base_zones[z])
+            last += 1
+
+        self._count[last] += 1
+        self._sum[last] += zc
+        if zone in self._zones:
+            self._zones[zone][last] += 1
+
+        self._evict(bucket)
+
+    def _add_out_of_order(self, bucket: int, zc: float, zone: str):
+        """Insert a late sample; shifts every later prefix total (O(B))"""
+        index = bisect_left(self._ids, bucket, self._start)
+        if self._ids[index] != bucket:
+            previous = index - 1
+            self._ids.insert(index, bucket)
+            live = previous >= self._start
+            self._count.insert(index, self._count[previous] if live else self._base_count)
+            self._sum.insert(index, self._sum[previous] if live else self._base_sum)
+            for z in ZONES:
+                self._zones[z].insert(
+                    index, self._zones[z][previous] if live else self._base_zones[z])
+
+        for i in range(index, len(self._ids)):
+            self._count[i] += 1
+            self._sum[i] += zc
+            if zone in self._zones:
+                self._zones[zone][i] += 1
+
+    def _evict(self, newest_bucket: int):
+        if self.retention_hours is None:
+            return
+        oldest_allowed = newest_bucket - int(self.retention_hours * 3600 // self.bucket_seconds)
+        while self._start < len(self._ids) - 1 and self._ids[self._start] < oldest_allowed:
+            self._base_count = self._count[self._start]
+            self._base_sum = self._sum[self._start]
+            for z in ZONES:
+                self._base_zones[z] = self._zones[z][self._start]
+            self._start += 1
+
+        # Compact once more than half of the arrays are dead buckets
+        if self._start > 1024 and self._start * 2 > len(self._ids):
+            del self._ids[:self._start]
+            del self._count[:self._start]
+            del self._sum[:self._start]
+            for z in ZONES:
+                del self._zones[z][:self._start]
+            self._start = 0
+
+    def summary(self, hours: float = 168, now: Optional[float] = None) -> Dict:
+        """
+        Summarize results in the last ``hours``
+
+        Args:
+            hours: Window size in hours
+            now: End of the window in epoch seconds (default: current time)
+
+        Returns:
+            Dict with count, avg_zc and zone_distribution
+        """
+        if now is None:
+            now = time.time()
+
+        first_bucket = int((now - hours * 3600) // self.bucket_seconds)
+        end_bucket = int(now // self.bucket_seconds)
+        lo = bisect_left(self._ids, first_bucket, self._start)
+        hi = bisect_left(self._ids, end_bucket + 1, self._start) - 1
+
+        if hi < lo:
+            return {"count": 0, "avg_zc": 0.0,
+                    "zone_distribution": {zone: 0 for zone in ZONES}}
+
+        # Totals in [lo, hi] = prefix(hi) - prefix(lo - 1)
+        before = lo - 1
+        live = before >= self._start
+        count = self._count[hi] - (self._count[before] if live else self._base_count)
+        zc_sum = self._sum[hi] - (self._sum[before] if live else self._base_sum)
+        zones = {
+            z: self._zones[z][hi] - (self._zones[z][before] if live else self._base_zones[z])
+            for z in ZONES
+        }
+
+        return {
+            "count": count,
+            "avg_zc": zc_sum / count,
+            "zone_distribution": zones
+        }
@@ -0,0 +1,257 @@
+"""
+Curator AI - Batch Zc Computation
+Columnar, vectorized Zc calculation for backfills and what-if analyses
+
+calculate_zc_batch() takes columns of metric counts (one row per team-day or
+any other measurement window) and returns columns of zc, zone, mode, trend
+and confidence computed with the same rules as CuratorMonitor.calculate_zc.
+NumPy is used when installed; otherwise a pure-Python path over array('d')
+produces identical results. Trends are fitted with the same windowed
+regression as the monitor (trend.py), one sequential pass per team.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+from trend import TrendEstimator
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Same defaults as CuratorMonitor
+GREEN_THRESHOLD = 0.7
+YELLOW_THRESHOLD = 1.0
+TREND_WINDOW = 24
+
+METRIC_FIELDS = ("slack_messages", "discord_messages", "notion_updates",
+                 "github_events", "linear_updates", "ai_outputs", "emails")
+
+Column = Union[Sequence[float], "np.ndarray"]
+
+
+@dataclass
+class ZcBatchResult:
+    """Columnar Zc results (NumPy arrays or Python lists/arrays)"""
+    zc: Column
+    v_generation: Column
+    b_social: Column
+    zone: Column
+    mode: Column
+    confidence: Column
+    trend: Column
+
+    def __len__(self) -> int:
+        return len(self.zc)
+
+    def rows(self) -> Iterator[Dict]:
+        """Iterate results row by row as dicts"""
+        for i in range(len(self)):
+            yield {
+                "zc": float(self.zc[i]),
+                "v_generation": float(self.v_generation[i]),
+                "b_social": float(self.b_social[i]),
+                "zone": str(self.zone[i]),
+                "mode": str(self.mode[i]),
+                "confidence": float(self.confidence[i]),
+                "trend": str(self.trend[i]),
+            }
+
+
+def _total_items(metrics: Mapping[str, Column]):
+    unknown = set(metrics) - set(METRIC_FIELDS) - {"total_items"}
+    if unknown:
+        raise ValueError(f"Unknown metric columns: {sorted(unknown)}")
+    if "total_items" in metrics:
+        return metrics["total_items"]
+
+    columns = [metrics[name] for name in METRIC_FIELDS if name in metrics]
+    if not columns:
+        raise ValueError("At least one metric column is required")
+    if NUMPY_AVAILABLE:
+        return np.sum([np.asarray(c, dtype=np.float64) for c in columns], axis=0)
+    return array('d', (sum(values) for values in zip(*columns)))
+
+
+def _trends(zc: Sequence[float], timestamps: Optional[Column], timeframe_hours,
+            team_ids: Optional[Sequence], window_hours: float) -> List[str]:
+    """Trend label per row from a per-team TrendEstimator"""
+    n = len(zc)
+    estimator = TrendEstimator(window_hours=window_hours)
+    labels = []
+    t = 0.0
+    for i in range(n):
+        if i and team_ids is not None and team_ids[i] != team_ids[i - 1]:
+            estimator.reset()
+        if timestamps is None:
+            # Consecutive measurement windows
+            t += float(timeframe_hours[i]) * 3600
+        else:
+            t = float(timestamps[i])
+        labels.append(estimator.update(t, float(zc[i])).label)
+    return labels
+
+
+def calculate_zc_batch(metrics: Mapping[str, Column],
+                       team_sizes: Union[int, Column],
+                       timeframe_hours: Union[float, Column] = 24,
+                       processing_hours_per_person: Union[float, Column] = 3.0,
+                       team_ids: Optional[Sequence] = None,
+                       green_threshold: float = GREEN_THRESHOLD,
+                       yellow_threshold: float = YELLOW_THRESHOLD,
+                       timestamps: Optional[Column] = None,
+                       trend_window_hours: float = TREND_WINDOW) -> ZcBatchResult:
+    """
+    Calculate Zc for many rows in one pass
+
+    Rows are treated as a chronological series per team (all rows form one
+    series unless ``team_ids`` is given; rows of a team must be contiguous),
+    so the trend of each row is fitted over the rows of its team up to and
+    including it, exactly like CuratorMonitor fits it over history. Without
+    ``timestamps``, rows are consecutive windows of ``timeframe_hours``.
+
+    Args:
+        metrics: Columns keyed by TeamMetrics field names (or "total_items")
+        team_sizes: Team size per row (or one value for all rows)
+        timeframe_hours: Measurement window per row (or one value)
+        processing_hours_per_person: Capacity per person per day (or one value)
+        team_ids: Optional team ID per row
+        green_threshold: Upper Zc bound of the GREEN zone
+        yellow_threshold: Upper Zc bound of the YELLOW zone
+        timestamps: Optional sample time per row (epoch seconds)
+        trend_window_hours: Trend regression window
+
+    Returns:
+        ZcBatchResult with one entry per row
+
+    Raises:
+        ValueError: If any row has B_social <= 0
+    """
+    total = _total_items(metrics)
+    n = len(total)
+    if team_ids is not None and len(team_ids) != n:
+        raise ValueError("team_ids must have one entry per row")
+    if timestamps is not None and len(timestamps) != n:
+        raise ValueError("timestamps must have one entry per row")
+
+    if NUMPY_AVAILABLE:
+        return _calculate_numpy(total, team_sizes, timeframe_hours,
+                                processing_hours_per_person, team_ids,
+                                green_threshold, yellow_threshold,
+                                timestamps, trend_window_hours)
+    return _calculate_python(total, team_sizes, timeframe_hours,
+                             processing_hours_per_person, team_ids,
+                             green_threshold, yellow_threshold,
+                             timestamps, trend_window_hours)
+
+
+def _round2(values: "np.ndarray") -> "np.ndarray":
+    """
+    Round to 2 decimals exactly like Python's round()
+
+    np.round scales by 100 first, which can land on the other side of a tie
+    (e.g. 0.475). Values that are that close to a tie are re-rounded with
+    round(); everything else keeps the vectorized result.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    ties = np.nonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)[0]
+    for i in ties:
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+
+def _calculate_numpy(total, team_sizes, timeframe_hours, processing_hours,
+                     team_ids, green, yellow, timestamps, trend_window) -> ZcBatchResult:
+    total = np.asarray(total, dtype=np.float64)
+    n = len(total)
+    tf = np.broadcast_to(np.asarray(timeframe_hours, dtype=np.float64), (n,))
+    size = np.broadcast_to(np.asarray(team_sizes, dtype=np.float64), (n,))
+    hours = np.broadcast_to(np.asarray(processing_hours, dtype=np.float64), (n,))
+
+    v_generation = total / tf
+    b_social = (size * hours * 24) / tf
+    if np.any(b_social <= 0):
+        raise ValueError("B_social must be greater than 0")
+    zc = v_generation / b_social
+
+    zone = np.where(zc < green, "GREEN", np.where(zc < yellow, "YELLOW", "RED"))
+    mode = np.where(zc < green, "STUDY_HALL", np.where(zc < yellow, "GUSH", "JAM"))
+
+    # Trend from the windowed regression over (rounded) values of the same team
+    rounded = _round2(zc)
+    trend = np.array(_trends(rounded.tolist(), timestamps, tf, team_ids, trend_window),
+                     dtype="<U10")
+    inc = trend == "INCREASING"
+    dec = trend == "DECREASING"
+
+    near_green = (green - 0.1 <= zc) & (zc <= green + 0.1)
+    near_yellow = (yellow - 0.1 <= zc) & (zc <= yellow + 0.1)
+    confidence = np.where(near_green | near_yellow, 0.8 - 0.2, 0.8)
+    confidence = np.where(inc, confidence - 0.1, np.where(dec, confidence + 0.1, confidence))
+    confidence = np.maximum(0.5, np.minimum(1.0, confidence))
+
+    return ZcBatchResult(
+        zc=rounded,
+        v_generation=_round2(v_generation),
+        b_social=_round2(b_social),
+        zone=zone,
+        mode=mode,
+        confidence=confidence,
+        trend=trend
+    )
+
+
+def _calculate_python(total, team_sizes, timeframe_hours, processing_hours,
+                      team_ids, green, yellow, timestamps, trend_window) -> ZcBatchResult:
+    n = len(total)
+
+    def column(value):
+        return value if isinstance(value, (list, tuple, array)) else [value] * n
+
+    tf, size, hours = column(timeframe_hours), column(team_sizes), column(processing_hours)
+    estimator = TrendEstimator(window_hours=trend_window)
+    t = 0.0
+
+    result = ZcBatchResult(zc=array('d'), v_generation=array('d'), b_social=array('d'),
+                           zone=[], mode=[], confidence=array('d'), trend=[])
+
+    for i in range(n):
+        v_generation = total[i] / tf[i]
+        b_social = (size[i] * hours[i] * 24) / tf[i]
+        if b_social <= 0:
+            raise ValueError("B_social must be greater than 0")
+        zc = v_generation / b_social
+
+        if zc < green:
+            zone, mode = "GREEN", "STUDY_HALL"
+        elif zc < yellow:
+            zone, mode = "YELLOW", "GUSH"
+        else:
+            zone, mode = "RED", "JAM"
+
+        if i and team_ids is not None and team_ids[i] != team_ids[i - 1]:
+            estimator.reset()
+        t = t + tf[i] * 3600 if timestamps is None else timestamps[i]
+        trend = estimator.update(t, round(zc, 2)).label
+
+        confidence = 0.8
+        if green - 0.1 <= zc <= green + 0.1 or yellow - 0.1 <= zc <= yellow + 0.1:
+            confidence -= 0.2
+        if trend == "INCREASING":
+            confidence -= 0.1
+        elif trend == "DECREASING":
+            confidence += 0.1
+
+        result.zc.append(round(zc, 2))
+        result.v_generation.append(round(v_generation, 2))
+        result.b_social.append(round(b_social, 2))
+        result.zone.append(zone)
+        result.mode.append(mode)
+        result.confidence.append(max(0.5, min(1.0, confidence)))
+        result.trend.append(trend)
+
+    return result
@@ -0,0 +1,264 @@
+"""
+Curator AI - Recommendation Cache
+Content-addressed cache for Claude recommendations
+
+Recommendations are keyed by a hash of the inputs that shape the prompt
+(zone, mode, trend, quantized Zc, team context and a digest of recent
+history), so repeated dashboard refreshes or commands for an unchanged
+team reuse the previous answer instead of calling Claude again.
+
+- In-memory LRU with a per-entry TTL
+- Optional on-disk tier (one JSON file per key) that survives restarts,
+  pruned of expired and excess files on open and periodically on put
+- Hit/miss counters for monitoring
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Zc values closer than this share a cache entry
+ZC_QUANTUM = 0.05
+
+# Same window the prompt shows Claude
+HISTORY_ENTRIES = 7
+
+
+def _quantize(zc: float, quantum: float = ZC_QUANTUM) -> float:
+    return round(round(zc / quantum) * quantum, 4)
+
+
+def recommendation_key(result,
+                       team_context: Optional[str] = None,
+                       history: Optional[List] = None,
+                       zc_quantum: float = ZC_QUANTUM) -> str:
+    """
+    Normalized cache key for a recommendation request
+
+    Args:
+        result: Current ZcResult
+        team_context: Optional team context passed to the prompt
+        history: Optional recent ZcResult history (last 7 entries are used)
+        zc_quantum: Zc bucket width
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    context = " ".join((team_context or "").split())
+    recent = [
+        (h.timestamp[:10], _quantize(h.zc, zc_quantum), h.zone)
+        for h in (history or [])[-HISTORY_ENTRIES:]
+    ]
+    history_digest = hashlib.sha256(
+        json.dumps(recent, separators=(",", ":")).encode()
+    ).hexdigest()
+
+    payload = {
+        "zone": result.zone,
+        "mode": result.mode,
+        "trend": result.trend,
+        "zc": _quantize(result.zc, zc_quantum),
+        "context": context,
+        "history": history_digest,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def _copy(value: Dict) -> Dict:
+    """Deep copy of a JSON-serializable value"""
+    return json.loads(json.dumps(value))
+
+
+class RecommendationCache:
+    """
+    TTL + LRU cache of recommendation dicts
+
+    Values are plain JSON-serializable dicts (e.g. ``Recommendation.__dict__``);
+    ``get`` returns a fresh copy so callers can't mutate cached entries.
+    """
+
+    def __init__(self,
+                 max_entries: int = 256,
+                 ttl_seconds: float = 900,
+                 disk_dir: Optional[str] = None,
+                 max_disk_entries: int = 4096,
+                 prune_interval: float = 60):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum entries kept in memory
+            ttl_seconds: How long an entry stays valid
+            disk_dir: Optional directory for the on-disk tier
+            max_disk_entries: Maximum files kept in the on-disk tier
+            prune_interval: Minimum seconds between disk prunes triggered by put()
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self.prune_interval = prune_interval
+        self._last_prune = float("-inf")
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self.prune_disk()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return now - stored_at >= self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached value for key, or None if missing/expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[0], now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _copy(entry[1])
+                del self._entries[key]
+
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, entry)
+        return _copy(entry[1])
+
+    def put(self, key: str, value: Dict):
+        """Store a value under key"""
+        entry = (time.time(), _copy(value))
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+        if self.disk_dir and entry[0] - self._last_prune >= self.prune_interval:
+            self.prune_disk()
+
+    def _store(self, key: str, entry: Tuple[float, Dict]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _read_disk(self, key: str, now: float) -> Optional[Tuple[float, Dict]]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+
+        if self._expired(data["stored_at"], now):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return data["stored_at"], data["value"]
+
+    def _write_disk(self, key: str, entry: Tuple[float, Dict]):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({"stored_at": entry[0], "value": entry[1]}, f)
+            # The file's mtime is its storage time, so pruning needn't read it
+            os.utime(tmp_path, (entry[0], entry[0]))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache file {path}: {e}")
+
+    def prune_disk(self) -> int:
+        """
+        Delete expired cache files, then the oldest beyond max_disk_entries
+
+        Returns:
+            Number of files deleted
+        """
+        if not self.disk_dir:
+            return 0
+        now = time.time()
+        self._last_prune = now
+        files = []
+        try:
+            with os.scandir(self.disk_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        try:
+                            files.append((entry.stat().st_mtime, entry.path))
+                        except OSError:
+                            pass
+        except OSError as e:
+            logger.warning(f"Failed to list cache directory {self.disk_dir}: {e}")
+            return 0
+
+        files.sort(reverse=True)  # Newest first
+        removed = 0
+        for i, (stored_at, path) in enumerate(files):
+            if i >= self.max_disk_entries or self._expired(stored_at, now):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logger.info(f"Pruned {removed} cache files from {self.disk_dir}")
+        return removed
+
+    def clear(self):
+        """Drop all entries (memory and disk)"""
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def stats(self) -> Dict:
+        """Hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,217 @@
+"""
+Curator AI - Event Counters
+Time-bucketed event counts per source (channel, feed, ...)
+
+Integrations record each event once (from incremental polling or live
+events) instead of re-reading history on every measurement; sliding window
+totals are then summed from buckets.
+
+Per key the counter also remembers:
+- ``latest``: timestamp of the newest event seen (the high-water mark from
+  which the next incremental fetch starts)
+- ``covered_since``: the time from which counting is known to be complete
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _Key:
+    """Buckets and marks of one source"""
+
+    __slots__ = ("buckets", "latest", "covered_since")
+
+    def __init__(self, covered_since: Optional[float] = None):
+        self.buckets: Dict[int, int] = {}
+        self.latest: Optional[float] = None
+        self.covered_since = covered_since
+
+
+class BucketCounter:
+    """
+    Thread-safe per-key event counts in fixed-width time buckets
+
+    - ``add(key, ts)`` counts one event (O(1))
+    - ``total(hours)`` sums the buckets in the window (O(window / bucket))
+    - Buckets older than ``retention_hours`` are dropped
+    """
+
+    def __init__(self, bucket_seconds: int = 60, retention_hours: Optional[float] = 168):
+        """
+        Initialize counter
+
+        Args:
+            bucket_seconds: Width of each bucket
+            retention_hours: Drop buckets older than this (None keeps all)
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be greater than 0")
+
+        self.bucket_seconds = bucket_seconds
+        self.retention_hours = retention_hours
+        self._keys: Dict[str, _Key] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, ts: float) -> int:
+        return int(ts // self.bucket_seconds)
+
+    def add(self, key: str, ts: float, count: int = 1):
+        """Count events of key at Unix timestamp ts"""
+        with self._lock:
+            entry = self._keys.get(key)
+            if entry is None:
+                entry = self._keys[key] = _Key()
+            bucket = self._bucket(ts)
+            entry.buckets[bucket] = entry.buckets.get(bucket, 0) + count
+            if entry.latest is None or ts > entry.latest:
+                entry.latest = ts
+
+    def reset(self, key: str, covered_since: float):
+        """Forget key's counts; counting restarts complete from covered_since"""
+        with self._lock:
+            self._keys[key] = _Key(covered_since)
+
+    def mark_covered(self, key: str, covered_since: float):
+        """Declare key's counts complete from covered_since on"""
+        with self._lock:
+            entry = self._keys.get(key)
+            if entry is None:
+                entry = self._keys[key] = _Key()
+            entry.covered_since = covered_since
+
+    def latest(self, key: str) -> Optional[float]:
+        """Timestamp of the newest event counted for key"""
+        with self._lock:
+            entry = self._keys.get(key)
+            return entry.latest if entry else None
+
+    def covered_since(self, key: str) -> Optional[float]:
+        """Time from which key's counts are complete (None if unknown)"""
+        with self._lock:
+            entry = self._keys.get(key)
+            return entry.covered_since if entry else None
+
+    def covers(self, key: str, since: float) -> bool:
+        """True if key's counts are complete from since on"""
+        covered = self.covered_since(key)
+        return covered is not None and covered <= since
+
+    def counts(self,
+               hours: float,
+               now: Optional[float] = None,
+               keys: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Events per key in the last ``hours``
+
+        Args:
+            hours: Window size
+            now: End of the window (default: current time)
+            keys: Keys to report (default: all known keys)
+
+        Returns:
+            Count per key
+        """
+        now = time.time() if now is None else now
+        start = self._bucket(now - hours * 3600)
+        end = self._bucket(now)
+
+        with self._lock:
+            self._prune(now)
+            result = {}
+            for key in (self._keys if keys is None else keys):
+                entry = self._keys.get(key)
+                if entry is None:
+                    result[key] = 0
+                elif len(entry.buckets) <= end - start + 1:
+                    result[key] = sum(n for b, n in entry.buckets.items() if start <= b <= end)
+                else:
+                    result[key] = sum(entry.buckets.get(b, 0) for b in range(start, end + 1))
+            return result
+
+    def total(self,
+              hours: float,
+              now: Optional[float] = None,
+              keys: Optional[Iterable[str]] = None) -> int:
+        """Events across keys in the last ``hours``"""
+        return sum(self.counts(hours, now=now, keys=keys).values())
+
+    def _prune(self, now: float):
+        if self.retention_hours is None:
+            return
+        cutoff_ts = now - self.retention_hours * 3600
+        cutoff = self._bucket(cutoff_ts)
+        for entry in self._keys.values():
+            if entry.buckets and min(entry.buckets) < cutoff:
+                entry.buckets = {b: n for b, n in entry.buckets.items() if b >= cutoff}
+                if entry.covered_since is not None and entry.covered_since < cutoff_ts:
+                    entry.covered_since = cutoff * self.bucket_seconds
+
+    def empty(self, now: Optional[float] = None) -> bool:
+        """True if no key has a bucket left after dropping expired ones"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._prune(now)
+            return not any(entry.buckets for entry in self._keys.values())
+
+    def keys(self):
+        """Known keys"""
+        with self._lock:
+            return list(self._keys)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable state"""
+        with self._lock:
+            return {
+                "bucket_seconds": self.bucket_seconds,
+                "retention_hours": self.retention_hours,
+                "keys": {
+                    key: {
+                        "latest": entry.latest,
+                        "covered_since": entry.covered_since,
+                        "buckets": {str(b): n for b, n in entry.buckets.items()},
+                    }
+                    for key, entry in self._keys.items()
+                },
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BucketCounter":
+        """Rebuild a counter from to_dict() output"""
+        counter = cls(bucket_seconds=data["bucket_seconds"],
+                      retention_hours=data.get("retention_hours"))
+        for key, state in data.get("keys", {}).items():
+            entry = counter._keys[key] = _Key(state.get("covered_since"))
+            entry.latest = state.get("latest")
+            entry.buckets = {int(b): n for b, n in state.get("buckets", {}).items()}
+        return counter
+
+    def save(self, path: str):
+        """Write state to a JSON file (atomically)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "BucketCounter":
+        """
+        Load state from a JSON file, or start empty if it doesn't exist
+
+        Args:
+            path: JSON file written by save()
+            **kwargs: Constructor arguments used when starting empty
+        """
+        if not os.path.exists(path):
+            return cls(**kwargs)
+        try:
+            with open(path, 'r') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable counter state {path}: {e}")
+            return cls(**kwargs)
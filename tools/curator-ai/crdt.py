@@ -0,0 +1,414 @@
+"""
+Curator AI - Cognitive CRDTs
+Delta-state CRDTs for idea repositories, syntheses and revisions
+(core/theory/COGNITIVE-CRDTS.md, MATHEMATICAL-APPENDIX.md §5)
+
+Every mutation gets a dot (replica ID, counter). Each replica keeps a
+compact causal context: a version vector of contiguous counters plus a small
+"cloud" of out-of-order dots, folded into the vector once it fills the gap.
+
+Replicas sync by exchanging deltas instead of full states:
+
+    delta = alice.delta_since(bob.context)   # Only what Bob hasn't seen
+    bob.merge(delta)
+
+Merges are commutative, associative and idempotent, so deltas can be
+duplicated, reordered or mixed with full states and replicas still converge.
+Dots are indexed per replica, so delta_since costs O(replicas · log n +
+size of the delta) rather than O(total ideas).
+
+    GSet        grow-only set (Idea Addition)           → IdeaRepository
+    MVRegister  multi-value register (Partial Synthesis) → SynthesisRegister
+    LWWMap      last-writer-wins map (Revision)          → IdeaState
+"""
+
+import time
+from bisect import bisect_right
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+Dot = Tuple[str, int]
+
+
+class VersionVector:
+    """
+    Compact causal context: contiguous counters per replica plus a dot cloud
+    """
+
+    __slots__ = ("vv", "cloud")
+
+    def __init__(self, vv: Optional[Dict[str, int]] = None, cloud: Optional[Set[Dot]] = None):
+        self.vv: Dict[str, int] = dict(vv or {})
+        self.cloud: Set[Dot] = set(cloud or ())
+        self.compact()
+
+    def __contains__(self, dot: Dot) -> bool:
+        return dot[1] <= self.vv.get(dot[0], 0) or dot in self.cloud
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, VersionVector) and self.vv == other.vv and self.cloud == other.cloud
+
+    def __repr__(self) -> str:
+        return f"VersionVector({self.vv!r}, cloud={sorted(self.cloud)!r})"
+
+    def next_dot(self, replica: str) -> Dot:
+        """Allocate (and record) the next dot of ``replica``"""
+        dot = (replica, self.vv.get(replica, 0) + 1)
+        self.vv[replica] = dot[1]
+        return dot
+
+    def add(self, dot: Dot):
+        """Record one dot"""
+        if dot not in self:
+            self.cloud.add(dot)
+            self.compact()
+
+    def merge(self, other: "VersionVector"):
+        """Union of both contexts"""
+        for replica, counter in other.vv.items():
+            if counter > self.vv.get(replica, 0):
+                self.vv[replica] = counter
+        self.cloud |= other.cloud
+        self.compact()
+
+    def compact(self):
+        """Fold cloud dots that extend a replica's contiguous range into the vector"""
+        if not self.cloud:
+            return
+        for replica, counter in sorted(self.cloud):
+            if counter == self.vv.get(replica, 0) + 1:
+                self.vv[replica] = counter
+        self.cloud = {dot for dot in self.cloud if dot[1] > self.vv.get(dot[0], 0)}
+
+    def covers(self, other: "VersionVector") -> bool:
+        """True if every dot of ``other`` is in this context"""
+        return (all(counter <= self.vv.get(replica, 0) for replica, counter in other.vv.items())
+                and all(dot in self for dot in other.cloud))
+
+    def copy(self) -> "VersionVector":
+        return VersionVector(self.vv, self.cloud)
+
+    def to_dict(self) -> Dict:
+        return {"vv": dict(self.vv), "cloud": sorted([r, c] for r, c in self.cloud)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VersionVector":
+        return cls(data.get("vv"), {(r, c) for r, c in data.get("cloud", ())})
+
+
+class _DotIndex:
+    """Per-replica dot counters (sorted) and the key each dot wrote"""
+
+    def __init__(self):
+        self._counters: Dict[str, List[int]] = {}
+        self._keys: Dict[str, List[Any]] = {}
+        self._size = 0
+
+    def add(self, dot: Dot, key):
+        counters = self._counters.setdefault(dot[0], [])
+        keys = self._keys.setdefault(dot[0], [])
+        if not counters or counters[-1] < dot[1]:
+            counters.append(dot[1])
+            keys.append(key)
+        else:
+            i = bisect_right(counters, dot[1])
+            counters.insert(i, dot[1])
+            keys.insert(i, key)
+        self._size += 1
+
+    def since(self, context: VersionVector) -> Iterator[Tuple[Dot, Any]]:
+        """(dot, key) entries whose dot is not in ``context``"""
+        for replica, counters in self._counters.items():
+            keys = self._keys[replica]
+            for i in range(bisect_right(counters, context.vv.get(replica, 0)), len(counters)):
+                dot = (replica, counters[i])
+                if dot not in context.cloud:
+                    yield dot, keys[i]
+
+    def rebuild(self, live: Dict[Any, Dot]):
+        """Keep only the live dot of each key"""
+        self._counters, self._keys, self._size = {}, {}, 0
+        for key, dot in sorted(live.items(), key=lambda item: item[1]):
+            self.add(dot, key)
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class _DeltaCRDT:
+    """Replica ID, causal context and dot index shared by the CRDTs"""
+
+    def __init__(self, replica_id: str):
+        self.replica_id = replica_id
+        self.context = VersionVector()
+        self._index = _DotIndex()
+
+    def _empty(self):
+        """New empty instance of the same type (used for deltas)"""
+        return type(self)(self.replica_id)
+
+    def delta_since(self, context: VersionVector):
+        """
+        State the holder of ``context`` hasn't seen
+
+        Args:
+            context: The receiving replica's causal context
+
+        Returns:
+            A delta of the same type; merge() it into the receiver
+        """
+        raise NotImplementedError
+
+    def merge(self, other):
+        raise NotImplementedError
+
+
+class GSet(_DeltaCRDT):
+    """
+    Grow-only set; add() returns the delta to ship
+    """
+
+    def __init__(self, replica_id: str = "local"):
+        super().__init__(replica_id)
+        self._elements: Dict[Hashable, Dot] = {}
+
+    def add(self, element: Hashable) -> "GSet":
+        """Add an element (idempotent); returns the delta"""
+        delta = self._empty()
+        if element in self._elements:
+            return delta
+        dot = self.context.next_dot(self.replica_id)
+        self._elements[element] = dot
+        self._index.add(dot, element)
+        delta._elements[element] = dot
+        delta.context.add(dot)
+        return delta
+
+    def merge(self, other: "GSet") -> "GSet":
+        """Union with another replica's state or delta"""
+        for element, dot in other._elements.items():
+            if element not in self._elements:
+                self._elements[element] = dot
+                self._index.add(dot, element)
+        self.context.merge(other.context)
+        return self
+
+    def delta_since(self, context: VersionVector) -> "GSet":
+        delta = self._empty()
+        for dot, element in self._index.since(context):
+            if self._elements.get(element) == dot:
+                delta._elements[element] = dot
+        delta.context = self.context.copy()
+        return delta
+
+    @property
+    def value(self) -> frozenset:
+        return frozenset(self._elements)
+
+    def __contains__(self, element) -> bool:
+        return element in self._elements
+
+    def __iter__(self):
+        return iter(self._elements)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def to_dict(self) -> Dict:
+        return {"elements": [[e, list(d)] for e, d in self._elements.items()],
+                "context": self.context.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict, replica_id: str = "local") -> "GSet":
+        state = cls(replica_id)
+        for element, (replica, counter) in data["elements"]:
+            state._elements[element] = (replica, counter)
+            state._index.add((replica, counter), element)
+        state.context = VersionVector.from_dict(data["context"])
+        return state
+
+
+class MVRegister(_DeltaCRDT):
+    """
+    Multi-value register: concurrent writes are all kept; a write replaces
+    every value its replica has seen
+    """
+
+    def __init__(self, replica_id: str = "local"):
+        super().__init__(replica_id)
+        self._entries: Dict[Dot, Any] = {}
+
+    def write(self, value) -> "MVRegister":
+        """Replace the values seen by this replica; returns the delta"""
+        delta = self._empty()
+        # Recorded in the context by the merge below
+        dot = (self.replica_id, self.context.vv.get(self.replica_id, 0) + 1)
+        for old in self._entries:
+            delta.context.add(old)
+        delta.context.add(dot)
+        delta._entries[dot] = value
+        self.merge(delta)
+        return delta
+
+    def merge(self, other: "MVRegister") -> "MVRegister":
+        """Keep values not overwritten by the other side"""
+        entries = {dot: value for dot, value in self._entries.items()
+                   if dot in other._entries or dot not in other.context}
+        for dot, value in other._entries.items():
+            if dot not in self.context:
+                entries[dot] = value
+        self._entries = entries
+        self.context.merge(other.context)
+        return self
+
+    def delta_since(self, context: VersionVector) -> "MVRegister":
+        # Live values are few; ship them all once anything is new
+        if context.covers(self.context):
+            return self._empty()
+        delta = self._empty()
+        delta._entries = dict(self._entries)
+        delta.context = self.context.copy()
+        return delta
+
+    @property
+    def values(self) -> List:
+        """Current values, ordered by dot"""
+        return [self._entries[dot] for dot in sorted(self._entries)]
+
+    @property
+    def value(self) -> frozenset:
+        return frozenset(self._entries.items())
+
+    def to_dict(self) -> Dict:
+        return {"entries": [[list(d), v] for d, v in sorted(self._entries.items())],
+                "context": self.context.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict, replica_id: str = "local") -> "MVRegister":
+        state = cls(replica_id)
+        state._entries = {(r, c): v for (r, c), v in data["entries"]}
+        state.context = VersionVector.from_dict(data["context"])
+        return state
+
+
+class LWWMap(_DeltaCRDT):
+    """
+    Map of last-writer-wins registers ordered by (timestamp, replica, counter)
+    """
+
+    def __init__(self, replica_id: str = "local"):
+        super().__init__(replica_id)
+        # key -> (timestamp, replica, counter, value)
+        self._entries: Dict[Hashable, Tuple[float, str, int, Any]] = {}
+
+    def set(self, key: Hashable, value=None, timestamp: Optional[float] = None) -> "LWWMap":
+        """
+        Write a key unless a newer write already won
+
+        Args:
+            key: Register key
+            value: Register value
+            timestamp: Write time (default: now)
+
+        Returns:
+            The delta (empty if the write lost)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        delta = self._empty()
+        current = self._entries.get(key)
+        if current is not None and current[:2] > (timestamp, self.replica_id):
+            return delta
+        dot = self.context.next_dot(self.replica_id)
+        delta._entries[key] = (timestamp, dot[0], dot[1], value)
+        delta.context.add(dot)
+        self.merge(delta)
+        return delta
+
+    def merge(self, other: "LWWMap") -> "LWWMap":
+        """Keep the newer write of every key"""
+        for key, entry in other._entries.items():
+            current = self._entries.get(key)
+            if current is None or entry[:3] > current[:3]:
+                self._entries[key] = entry
+                self._index.add(entry[1:3], key)
+        self.context.merge(other.context)
+        # Superseded writes stay indexed until they outnumber live ones
+        if len(self._index) > 2 * len(self._entries) + 64:
+            self._index.rebuild({key: entry[1:3] for key, entry in self._entries.items()})
+        return self
+
+    def delta_since(self, context: VersionVector) -> "LWWMap":
+        delta = self._empty()
+        for dot, key in self._index.since(context):
+            entry = self._entries[key]
+            if entry[1:3] == dot:
+                delta._entries[key] = entry
+        delta.context = self.context.copy()
+        return delta
+
+    def get(self, key: Hashable, default=None):
+        entry = self._entries.get(key)
+        return default if entry is None else entry[3]
+
+    def timestamp(self, key: Hashable) -> Optional[float]:
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    @property
+    def value(self) -> Dict:
+        return {key: entry[3] for key, entry in self._entries.items()}
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self) -> Dict:
+        return {"entries": [[k, list(e)] for k, e in self._entries.items()],
+                "context": self.context.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict, replica_id: str = "local") -> "LWWMap":
+        state = cls(replica_id)
+        for key, (ts, replica, counter, value) in data["entries"]:
+            state._entries[key] = (ts, replica, counter, value)
+            state._index.add((replica, counter), key)
+        state.context = VersionVector.from_dict(data["context"])
+        return state
+
+
+class IdeaRepository(GSet):
+    """Shared idea pool (Idea Addition, COGNITIVE-CRDTS.md §2.1)"""
+
+    @property
+    def ideas(self) -> frozenset:
+        return self.value
+
+
+class SynthesisRegister(MVRegister):
+    """Concurrent syntheses kept side by side (Partial Synthesis, §2.2)"""
+
+    def synthesize(self, author: str, synthesis: str,
+                   timestamp: Optional[float] = None) -> "SynthesisRegister":
+        """Record a synthesis that supersedes those this replica has seen"""
+        return self.write((author, synthesis, time.time() if timestamp is None else timestamp))
+
+    def get_all_versions(self) -> List[Tuple[str, str, float]]:
+        """(author, synthesis, timestamp) of every concurrent synthesis"""
+        return self.values
+
+
+class IdeaState(LWWMap):
+    """When each idea was last processed (Revision, §2.3)"""
+
+    def process(self, idea_id: Hashable, timestamp: Optional[float] = None) -> bool:
+        """Mark an idea processed; False (no-op) if it was processed at or after ``timestamp``"""
+        timestamp = time.time() if timestamp is None else timestamp
+        last = self.timestamp(idea_id)
+        if last is not None and timestamp <= last:
+            return False
+        return len(self.set(idea_id, True, timestamp)) > 0
+
+    @property
+    def processed(self) -> Dict[Hashable, float]:
+        return {key: entry[0] for key, entry in self._entries.items()}
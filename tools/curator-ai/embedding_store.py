@@ -0,0 +1,363 @@
+"""
+Curator AI - Embedding Store
+Persistent embeddings keyed by content hash, so a synthesis run only embeds
+new or revised ideas (OSTAgent.synthesize_on_schedule, COGNITIVE-CRDTS.md §4.2)
+
+A store directory holds:
+
+    meta.json        {"dim": d}
+    vectors.f32      contiguous row-major float32 matrix, append-only
+    hashes.bin       16-byte BLAKE2b digest of each row's text, append-only
+    tombstones.bin   one bit per row, set when no idea uses the row anymore
+
+Rows are only appended. A revised idea gets a new row and its old row is
+tombstoned (and revived if the text comes back); compact() rewrites the
+files without tombstoned rows. Vectors are L2-normalized on insert, so
+similarity is a dot product. The matrix is memory-mapped: matrix() is a
+NumPy view of the file and similar() scores the mapped rows without
+building Python objects per row (a slower pure-Python fallback reads the
+same buffer when NumPy is missing).
+"""
+
+import json
+import math
+import mmap
+import os
+from array import array
+from hashlib import blake2b
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+KEY_BYTES = 16
+
+# Batch embedding function: texts -> one vector per text
+EmbedFn = Callable[[List[str]], Sequence[Sequence[float]]]
+
+
+def content_key(text: str) -> bytes:
+    """Hash of an idea's text, insensitive to whitespace changes"""
+    return blake2b(" ".join(text.split()).encode(), digest_size=KEY_BYTES).digest()
+
+
+class EmbeddingStore:
+    """
+    Append-only, memory-mapped embedding matrix keyed by content hash
+    """
+
+    def __init__(self, directory: str, dim: int):
+        """
+        Open (or create) a store
+
+        Args:
+            directory: Directory holding the store files
+            dim: Embedding dimension (must match an existing store)
+
+        Raises:
+            ValueError: If the store was created with another dimension
+        """
+        self.directory = directory
+        self.dim = dim
+        self.row_bytes = 4 * dim
+        os.makedirs(directory, exist_ok=True)
+
+        meta_path = os.path.join(directory, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                stored = json.load(f)["dim"]
+            if stored != dim:
+                raise ValueError(f"Embedding store {directory} has dim {stored}, not {dim}")
+        else:
+            with open(meta_path, "w") as f:
+                json.dump({"dim": dim}, f)
+
+        self._vectors_path = os.path.join(directory, "vectors.f32")
+        self._hashes_path = os.path.join(directory, "hashes.bin")
+        self._tombstones_path = os.path.join(directory, "tombstones.bin")
+        self.embedded = 0
+        self.reused = 0
+        self._load()
+
+    def _load(self):
+        for path in (self._vectors_path, self._hashes_path):
+            open(path, "ab").close()
+        # A crash between the two appends leaves one file a row ahead
+        rows = min(os.path.getsize(self._vectors_path) // self.row_bytes,
+                   os.path.getsize(self._hashes_path) // KEY_BYTES)
+        for path, size in ((self._vectors_path, rows * self.row_bytes),
+                           (self._hashes_path, rows * KEY_BYTES)):
+            if os.path.getsize(path) != size:
+                logger.warning(f"Truncating incomplete row from {path}")
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+
+        with open(self._hashes_path, "rb") as f:
+            hashes = f.read()
+        self._keys = [hashes[i:i + KEY_BYTES] for i in range(0, len(hashes), KEY_BYTES)]
+        self._tombstones = bytearray((rows + 7) // 8)
+        if os.path.exists(self._tombstones_path):
+            with open(self._tombstones_path, "rb") as f:
+                stored = f.read(len(self._tombstones))
+            self._tombstones[:len(stored)] = stored
+        # Live rows, and tombstoned rows that can be revived without embedding
+        self._rows: Dict[bytes, int] = {}
+        self._graves: Dict[bytes, int] = {}
+        for row, key in enumerate(self._keys):
+            (self._graves if self._dead(row) else self._rows)[key] = row
+
+        self._vectors_file = open(self._vectors_path, "ab")
+        self._hashes_file = open(self._hashes_path, "ab")
+        self._map: Optional[mmap.mmap] = None
+        self._mapped_rows = 0
+
+    @property
+    def rows(self) -> int:
+        """Rows in the matrix, including tombstoned ones"""
+        return len(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, text: str) -> bool:
+        return content_key(text) in self._rows
+
+    def _dead(self, row: int) -> bool:
+        return bool(self._tombstones[row >> 3] >> (row & 7) & 1)
+
+    def _bury(self, key: bytes):
+        row = self._graves[key] = self._rows.pop(key)
+        self._tombstones[row >> 3] |= 1 << (row & 7)
+
+    def _revive(self, key: bytes):
+        row = self._rows[key] = self._graves.pop(key)
+        self._tombstones[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+
+    def _append(self, key: bytes, vector: Sequence[float]) -> int:
+        if len(vector) != self.dim:
+            raise ValueError(f"Expected a {self.dim}-dimensional embedding, got {len(vector)}")
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        self._vectors_file.write(array("f", (x / norm for x in vector)).tobytes())
+        self._hashes_file.write(key)
+        row = len(self._keys)
+        self._keys.append(key)
+        if row >> 3 >= len(self._tombstones):
+            self._tombstones.append(0)
+        self._rows[key] = row
+        return row
+
+    def ensure(self, texts: Iterable[str], embed: EmbedFn, batch_size: int = 256) -> List[int]:
+        """
+        Rows of the given texts, embedding only those not stored yet
+
+        Args:
+            texts: Idea texts
+            embed: Batch embedding function (texts -> vectors)
+            batch_size: Texts per embed() call
+
+        Returns:
+            Row of each text, in order
+        """
+        keys = [(content_key(text), text) for text in texts]
+        missing: Dict[bytes, str] = {}
+        revived = False
+        for key, text in keys:
+            if key in self._graves:
+                self._revive(key)
+                revived = True
+            elif key not in self._rows:
+                missing.setdefault(key, text)
+        if revived:
+            self._save_tombstones()
+
+        pending = list(missing.items())
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            vectors = embed([text for _, text in chunk])
+            if len(vectors) != len(chunk):
+                raise ValueError(f"embed() returned {len(vectors)} vectors for {len(chunk)} texts")
+            for (key, _), vector in zip(chunk, vectors):
+                self._append(key, vector)
+        if pending:
+            self.flush()
+
+        self.embedded += len(pending)
+        self.reused += len(keys) - len(pending)
+        return [self._rows[key] for key, _ in keys]
+
+    def sync(self, ideas: Mapping[Hashable, str], embed: EmbedFn,
+             batch_size: int = 256) -> Dict[Hashable, int]:
+        """
+        Make the store hold exactly the current ideas
+
+        New or revised texts are embedded; rows no idea uses anymore are
+        tombstoned.
+
+        Args:
+            ideas: {idea_id: text} of every current idea
+            embed: Batch embedding function (texts -> vectors)
+            batch_size: Texts per embed() call
+
+        Returns:
+            {idea_id: row} (valid until the next compact())
+        """
+        embedded, reused = self.embedded, self.reused
+        ids = list(ideas)
+        rows = self.ensure((ideas[i] for i in ids), embed, batch_size)
+        live = set(rows)
+        for key, row in list(self._rows.items()):
+            if row not in live:
+                self._bury(key)
+        self._save_tombstones()
+        logger.info(f"Embedding store sync: {self.embedded - embedded} embedded, "
+                    f"{self.reused - reused} reused, {self.rows - len(self)} tombstoned rows")
+        return dict(zip(ids, rows))
+
+    def discard(self, text: str) -> bool:
+        """Tombstone the row of a text; False if it isn't stored"""
+        key = content_key(text)
+        if key not in self._rows:
+            return False
+        self._bury(key)
+        self._save_tombstones()
+        return True
+
+    def row(self, text: str) -> Optional[int]:
+        """Row of a stored text"""
+        return self._rows.get(content_key(text))
+
+    def _buffer(self) -> memoryview:
+        """The mapped matrix as float32, remapped after appends"""
+        if self._mapped_rows != self.rows:
+            self.flush()
+            # Views into an older map keep it alive until they are dropped
+            self._map = None
+            if self.rows:
+                with open(self._vectors_path, "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), self.rows * self.row_bytes,
+                                          access=mmap.ACCESS_READ)
+            self._mapped_rows = self.rows
+        if self._map is None:
+            return memoryview(b"").cast("f")
+        return memoryview(self._map).cast("f")
+
+    def matrix(self):
+        """
+        rows × dim NumPy view of the mapped file (no copy)
+
+        Tombstoned rows are included; use live_mask() to filter them.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EmbeddingStore.matrix() requires numpy")
+        return np.frombuffer(self._buffer(), dtype=np.float32).reshape(self.rows, self.dim)
+
+    def live_mask(self):
+        """Boolean NumPy array, True for rows that are not tombstoned"""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EmbeddingStore.live_mask() requires numpy")
+        dead = np.unpackbits(np.frombuffer(bytes(self._tombstones), dtype=np.uint8),
+                             bitorder="little")[:self.rows]
+        return dead == 0
+
+    def vector(self, row: int) -> memoryview:
+        """Stored (normalized) vector of a row, as a view into the map"""
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Row {row} out of range")
+        return self._buffer()[row * self.dim:(row + 1) * self.dim]
+
+    def similar(self, query: Sequence[float], k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Live rows most similar to a query vector (cosine)
+
+        Args:
+            query: Query embedding
+            k: Number of results
+
+        Returns:
+            (row, similarity), most similar first
+        """
+        norm = math.sqrt(sum(x * x for x in query)) or 1.0
+        if not self.rows:
+            return []
+        if NUMPY_AVAILABLE:
+            scores = self.matrix() @ (np.asarray(query, dtype=np.float32) / norm)
+            scores[~self.live_mask()] = -np.inf
+            k = min(k, len(self))
+            top = np.argpartition(-scores, k - 1)[:k] if k else []
+            return sorted(((int(r), float(scores[r])) for r in top), key=lambda s: -s[1])
+
+        buffer, dim = self._buffer(), self.dim
+        q = [x / norm for x in query]
+        scores = []
+        for row in self._rows.values():
+            base = row * dim
+            scores.append((row, sum(q[i] * buffer[base + i] for i in range(dim))))
+        scores.sort(key=lambda s: -s[1])
+        return scores[:k]
+
+    def similar_to(self, text: str, k: int = 10) -> List[Tuple[int, float]]:
+        """Rows most similar to a stored text, excluding the text itself"""
+        row = self.row(text)
+        if row is None:
+            raise KeyError("Text is not in the embedding store")
+        return [s for s in self.similar(self.vector(row).tolist(), k + 1) if s[0] != row][:k]
+
+    def compact(self) -> Dict[int, int]:
+        """
+        Rewrite the files without tombstoned rows
+
+        Returns:
+            {old row: new row} of the rows kept
+        """
+        self.flush()
+        self._vectors_file.close()
+        self._hashes_file.close()
+        mapping = {}
+        with open(self._vectors_path, "rb") as src, \
+                open(self._vectors_path + ".tmp", "wb") as vectors, \
+                open(self._hashes_path + ".tmp", "wb") as hashes:
+            for row, key in enumerate(self._keys):
+                if self._dead(row):
+                    continue
+                src.seek(row * self.row_bytes)
+                vectors.write(src.read(self.row_bytes))
+                hashes.write(key)
+                mapping[row] = len(mapping)
+        for path in (self._vectors_path, self._hashes_path):
+            os.replace(path + ".tmp", path)
+        if os.path.exists(self._tombstones_path):
+            os.remove(self._tombstones_path)
+        logger.info(f"Compacted embedding store: {self.rows} -> {len(mapping)} rows")
+        self._load()
+        return mapping
+
+    def _save_tombstones(self):
+        with open(self._tombstones_path + ".tmp", "wb") as f:
+            f.write(self._tombstones)
+        os.replace(self._tombstones_path + ".tmp", self._tombstones_path)
+
+    def flush(self):
+        """Write buffered rows to disk"""
+        self._vectors_file.flush()
+        self._hashes_file.flush()
+
+    def close(self):
+        self.flush()
+        self._vectors_file.close()
+        self._hashes_file.close()
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
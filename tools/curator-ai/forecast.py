@@ -0,0 +1,237 @@
+"""
+Curator AI - Zc Forecasting
+Incremental seasonal exponential smoothing of Zc per team
+
+Samples are averaged into hourly buckets. Each closed hour updates a damped
+Holt model with additive daily (24h) and weekly (168h) seasonal terms in
+error-correction form:
+
+    ŷ  = ℓ + φb + d[h mod 24] + w[h mod 168]
+    e  = y - ŷ
+    ℓ ← ℓ + φb + αe        b ← φb + αβe
+    d[h mod 24] += γ_d e    w[h mod 168] += γ_w e
+
+so a sample costs O(1) and nothing is ever refit from scratch. Projections
+for the next ``max_horizon`` hours are computed once per new sample and
+cached; the open (partial) hour counts as a provisional observation.
+Hours without samples advance the level and trend without a correction.
+
+Seasonal terms start at zero and are learned as data arrives, so forecasts
+pick up daily patterns after a few days and weekly ones after a few weeks.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+HOUR = 3600
+DAY_HOURS = 24
+WEEK_HOURS = 168
+
+
+@dataclass
+class ForecastPoint:
+    """Projected Zc for one future hour"""
+    timestamp: str
+    zc: float
+    zone: str
+
+
+@dataclass
+class ZoneCrossing:
+    """First projected hour in a new zone"""
+    timestamp: str
+    zc: float
+    from_zone: str
+    to_zone: str
+
+
+@dataclass
+class ZcForecast:
+    """Projection for the next ``horizon_hours`` hours"""
+    generated_at: str
+    horizon_hours: int
+    current_zone: str
+    points: List[ForecastPoint] = field(default_factory=list)
+    crossings: List[ZoneCrossing] = field(default_factory=list)
+    level: float = 0.0
+    trend: float = 0.0          # Zc per hour before damping
+    error: float = 0.0          # Smoothed absolute one-step error
+    observations: int = 0       # Hours fitted
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch).isoformat()
+
+
+class ZcForecaster:
+    """
+    Damped trend + daily/weekly seasonal smoothing, updated per sample
+    """
+
+    def __init__(self,
+                 green_threshold: float = 0.7,
+                 yellow_threshold: float = 1.0,
+                 alpha: float = 0.1,
+                 beta: float = 0.1,
+                 phi: float = 0.98,
+                 gamma_day: float = 0.3,
+                 gamma_week: float = 0.05,
+                 max_horizon: int = 72):
+        """
+        Initialize forecaster
+
+        Args:
+            green_threshold: Zc where GREEN ends
+            yellow_threshold: Zc where RED starts
+            alpha: Level smoothing
+            beta: Trend smoothing (relative to alpha)
+            phi: Trend damping per hour
+            gamma_day: Daily seasonal smoothing
+            gamma_week: Weekly seasonal smoothing
+            max_horizon: Hours projected (and cached) ahead
+        """
+        self.green_threshold = green_threshold
+        self.yellow_threshold = yellow_threshold
+        self.alpha = alpha
+        self.beta = beta
+        self.phi = phi
+        self.gamma_day = gamma_day
+        self.gamma_week = gamma_week
+        self.max_horizon = max_horizon
+        self.reset()
+
+    def reset(self):
+        """Forget the fitted state"""
+        self.level: Optional[float] = None
+        self.trend = 0.0
+        self.daily = [0.0] * DAY_HOURS
+        self.weekly = [0.0] * WEEK_HOURS
+        self.error = 0.0
+        self.observations = 0
+        self._hour: Optional[int] = None     # Open bucket (hours since epoch)
+        self._sum = 0.0
+        self._count = 0
+        self._last_zc = 0.0
+        self._cache: Optional[Tuple[int, List[float], float, float]] = None
+        self._version = 0
+
+    def _zone(self, zc: float) -> str:
+        if zc < self.green_threshold:
+            return "GREEN"
+        if zc < self.yellow_threshold:
+            return "YELLOW"
+        return "RED"
+
+    @staticmethod
+    def _step(state, y: Optional[float], hour: int, alpha, beta, phi, gamma_day, gamma_week):
+        """Advance (level, trend, daily, weekly) by one hour; y=None for a gap"""
+        level, trend, daily, weekly = state
+        d, w = hour % DAY_HOURS, hour % WEEK_HOURS
+        if level is None:
+            return (y - daily[d] - weekly[w], 0.0, daily, weekly), 0.0
+        if y is None:
+            return (level + phi * trend, phi * trend, daily, weekly), None
+        e = y - (level + phi * trend + daily[d] + weekly[w])
+        daily[d] += gamma_day * e
+        weekly[w] += gamma_week * e
+        return (level + phi * trend + alpha * e, phi * trend + alpha * beta * e,
+                daily, weekly), e
+
+    def _close(self, y: Optional[float], hour: int):
+        state, e = self._step((self.level, self.trend, self.daily, self.weekly), y, hour,
+                              self.alpha, self.beta, self.phi, self.gamma_day, self.gamma_week)
+        self.level, self.trend = state[0], state[1]
+        if e is not None:
+            self.error = abs(e) if self.observations == 0 else 0.9 * self.error + 0.1 * abs(e)
+            self.observations += 1
+
+    def update(self, timestamp: float, zc: float):
+        """
+        Add a sample
+
+        Args:
+            timestamp: Sample time (epoch seconds); late samples join the open hour
+            zc: Sample Zc
+        """
+        hour = int(timestamp // HOUR)
+        if self._hour is None:
+            self._hour = hour
+        elif hour > self._hour:
+            self._close(self._sum / self._count, self._hour)
+            # Hours without samples (bounded: after a week the seasons are all stale anyway)
+            for gap in range(max(self._hour + 1, hour - WEEK_HOURS), hour):
+                self._close(None, gap)
+            self._hour, self._sum, self._count = hour, 0.0, 0
+        self._sum += zc
+        self._count += 1
+        self._last_zc = zc
+        self._version += 1
+
+    def _projection(self) -> Tuple[List[float], float, float]:
+        """Zc for the next max_horizon hours after the open one (plus level and
+        trend including the open hour), cached per sample"""
+        if self._cache is not None and self._cache[0] == self._version:
+            return self._cache[1:]
+
+        # Fold the open hour in provisionally, on copies of the seasonal terms
+        daily, weekly = list(self.daily), list(self.weekly)
+        (level, trend, daily, weekly), _ = self._step(
+            (self.level, self.trend, daily, weekly), self._sum / self._count, self._hour,
+            self.alpha, self.beta, self.phi, self.gamma_day, self.gamma_week)
+
+        values = []
+        damped = 0.0
+        factor = 1.0
+        for h in range(1, self.max_horizon + 1):
+            factor *= self.phi
+            damped += factor
+            hour = self._hour + h
+            zc = level + damped * trend + daily[hour % DAY_HOURS] + weekly[hour % WEEK_HOURS]
+            values.append(max(0.0, zc))
+        self._cache = (self._version, values, level, trend)
+        return self._cache[1:]
+
+    def forecast(self, hours: int = 24) -> Optional[ZcForecast]:
+        """
+        Project Zc for the next ``hours`` hours
+
+        Args:
+            hours: Horizon (1 to max_horizon)
+
+        Returns:
+            ZcForecast with hourly points and predicted zone crossings,
+            or None before the first sample
+        """
+        if self._hour is None:
+            return None
+        if not 1 <= hours <= self.max_horizon:
+            raise ValueError(f"hours must be between 1 and {self.max_horizon}")
+
+        values, level, trend = self._projection()
+        current_zone = self._zone(self._last_zc)
+        result = ZcForecast(generated_at=datetime.now().isoformat(), horizon_hours=hours,
+                            current_zone=current_zone, level=round(level, 4),
+                            trend=round(trend, 4), error=round(self.error, 4),
+                            observations=self.observations)
+        zone = current_zone
+        for h, zc in enumerate(values[:hours], start=1):
+            timestamp = _iso((self._hour + h) * HOUR)
+            point = ForecastPoint(timestamp=timestamp, zc=round(zc, 2), zone=self._zone(zc))
+            result.points.append(point)
+            if point.zone != zone:
+                result.crossings.append(ZoneCrossing(timestamp=timestamp, zc=point.zc,
+                                                     from_zone=zone, to_zone=point.zone))
+                zone = point.zone
+        return result
+
+    def state(self) -> Dict:
+        """Fitted model state (for diagnostics)"""
+        return {
+            "level": self.level,
+            "trend": self.trend,
+            "error": self.error,
+            "observations": self.observations,
+            "daily": list(self.daily),
+            "weekly": list(self.weekly),
+        }
@@ -0,0 +1,373 @@
+"""
+Curator AI - BHO Fork Registry
+Divergence depth and merge cost of open forks (MATHEMATICAL-APPENDIX.md §4)
+
+A fork duplicates the state of its parent branch (a channel, or another
+fork) at fork time: both sides start from the parent's state vector, the
+sum of the embeddings of its contributions, truncated to its strongest
+features and weighted like ``base_weight`` contributions. Afterwards,
+contributions to the parent feed the fork's parent side and contributions
+to the fork feed its fork side. Divergence depth is
+
+    D(t) = depth_scale · (1 - cos(parent side, fork side))
+
+kept up to date in O(features) per contribution from running dot products
+and norms. Merge cost is the §4.3 quadratic
+
+    Cost(D) = β0 + β1·D + β2·D²        (β = 0.5, 1.2, 0.3)
+
+With D growing at rate s (windowed regression, trend.py), merging later
+costs (β1 + 2·β2·D)·s more per day. A fork is worth keeping open while
+that is below ``value_per_day``, so the optimal merge time is when D reaches
+
+    D* = (value_per_day / s - β1) / (2·β2)
+
+clamped to the empirical 3-7 day fork duration, and immediately once D
+passes ``max_depth``. Forks are kept in a heap by merge time, so
+merge_now() pops due forks instead of rescanning every fork.
+"""
+
+import heapq
+import math
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+import logging
+
+from convergence import HashingEmbedder
+from trend import TrendEstimator
+
+logger = logging.getLogger(__name__)
+
+# MATHEMATICAL-APPENDIX.md §4.3
+MERGE_COST_BETA = (0.5, 1.2, 0.3)
+DAY = 86400.0
+
+Vector = Union[Mapping[int, float], Sequence[float]]
+
+
+def merge_cost(depth: float, beta: Tuple[float, float, float] = MERGE_COST_BETA) -> float:
+    """Cost_merge(D) = β0 + β1·D + β2·D²"""
+    return beta[0] + beta[1] * depth + beta[2] * depth * depth
+
+
+@dataclass
+class Fork:
+    """One BHO fork"""
+    fork_id: str
+    name: str
+    parent: str
+    owner: Optional[str]
+    created_at: float
+    status: str = "open"            # open, merged, abandoned
+    depth: float = 0.0              # D(t)
+    depth_per_day: float = 0.0      # dD/dt from the windowed regression
+    merge_cost: float = MERGE_COST_BETA[0]
+    merge_due: Optional[float] = None
+    contributions: int = 0
+    updated_at: float = 0.0
+
+
+def _sparse(vector: Vector) -> Dict[int, float]:
+    """Unit-length sparse copy of a sparse or dense vector"""
+    items = vector.items() if isinstance(vector, Mapping) else enumerate(vector)
+    sparse = {i: float(x) for i, x in items if x}
+    norm = math.sqrt(sum(x * x for x in sparse.values()))
+    return {i: x / norm for i, x in sparse.items()} if norm else {}
+
+
+def _dot(v: Mapping[int, float], state: Mapping[int, float]) -> float:
+    return sum(x * state.get(i, 0.0) for i, x in v.items())
+
+
+class _Side:
+    """State vector with its squared norm"""
+
+    __slots__ = ("vector", "norm2")
+
+    def __init__(self, base: Dict[int, float]):
+        self.vector = dict(base)
+        self.norm2 = sum(x * x for x in base.values())
+
+    def add(self, v: Mapping[int, float]):
+        vector = self.vector
+        self.norm2 += 2 * _dot(v, vector) + sum(x * x for x in v.values())
+        for i, x in v.items():
+            vector[i] = vector.get(i, 0.0) + x
+
+
+class _ForkState:
+    """Running divergence of one fork"""
+
+    def __init__(self, fork: Fork, base: Dict[int, float], trend_window_hours: float):
+        self.fork = fork
+        self.parent_side = _Side(base)
+        self.fork_side = _Side(base)
+        self.dot = self.parent_side.norm2
+        self.trend = TrendEstimator(window_hours=trend_window_hours, min_samples=3)
+        self.version = 0
+
+    def add(self, v: Mapping[int, float], to_fork: bool):
+        mine, other = (self.fork_side, self.parent_side) if to_fork else \
+            (self.parent_side, self.fork_side)
+        self.dot += _dot(v, other.vector)
+        mine.add(v)
+
+    def similarity(self) -> float:
+        norms = self.parent_side.norm2 * self.fork_side.norm2
+        if norms <= 0:
+            return 1.0
+        return max(-1.0, min(1.0, self.dot / math.sqrt(norms)))
+
+
+class ForkRegistry:
+    """
+    Open forks with incremental divergence depth and merge-time index
+    """
+
+    def __init__(self,
+                 beta: Tuple[float, float, float] = MERGE_COST_BETA,
+                 depth_scale: float = 10.0,
+                 value_per_day: float = 3.0,
+                 min_days: float = 3.0,
+                 max_days: float = 7.0,
+                 max_depth: float = 5.0,
+                 base_weight: float = 5.0,
+                 base_features: int = 256,
+                 trend_window_hours: float = 72.0,
+                 embedder: Optional[HashingEmbedder] = None):
+        """
+        Initialize registry
+
+        Args:
+            beta: Merge cost coefficients (β0, β1, β2)
+            depth_scale: D for orthogonal branches (cosine distance 1)
+            value_per_day: Value of keeping a fork open one more day, in cost units
+            min_days: Earliest suggested merge (unless D exceeds max_depth)
+            max_days: Latest suggested merge
+            max_depth: D at which a fork should merge right away
+            base_weight: Weight of the inherited parent state, in contributions
+            base_features: Strongest parent features copied into a new fork
+            trend_window_hours: Regression window for dD/dt
+            embedder: Embeds contribution texts (default HashingEmbedder())
+        """
+        self.beta = beta
+        self.depth_scale = depth_scale
+        self.value_per_day = value_per_day
+        self.min_days = min_days
+        self.max_days = max_days
+        self.max_depth = max_depth
+        self.base_weight = base_weight
+        self.base_features = base_features
+        self.trend_window_hours = trend_window_hours
+        self.embedder = embedder or HashingEmbedder()
+
+        self._branches: Dict[str, Dict[int, float]] = {}
+        self._forks: Dict[str, _ForkState] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._due: List[Tuple[float, int, str]] = []
+        self._lock = threading.Lock()
+
+    def open_fork(self, name: str, parent: str, owner: Optional[str] = None,
+                  fork_id: Optional[str] = None, timestamp: Optional[float] = None) -> Fork:
+        """
+        Declare a fork of a branch
+
+        Args:
+            name: Fork name
+            parent: Parent branch (channel ID or fork ID)
+            owner: Who declared it
+            fork_id: Branch ID for the fork's contributions (default: generated)
+            timestamp: Fork time (default: now)
+
+        Returns:
+            The new Fork
+
+        Raises:
+            ValueError: If fork_id is already in use
+        """
+        now = time.time() if timestamp is None else timestamp
+        fork_id = fork_id or uuid.uuid4().hex[:8]
+        with self._lock:
+            if fork_id in self._forks or fork_id in self._branches:
+                raise ValueError(f"Fork ID already in use: {fork_id}")
+            fork = Fork(fork_id=fork_id, name=name, parent=parent, owner=owner,
+                        created_at=now, merge_cost=merge_cost(0.0, self.beta), updated_at=now)
+            state = self._forks[fork_id] = _ForkState(fork, self._base(parent),
+                                                      self.trend_window_hours)
+            self._children.setdefault(parent, set()).add(fork_id)
+            self._schedule(state, now)
+        logger.info(f"Fork '{name}' ({fork_id}) opened from {parent}")
+        return fork
+
+    def _base(self, branch: str) -> Dict[int, float]:
+        """Strongest features of a branch's state, scaled to ``base_weight``"""
+        state = self._forks[branch].fork_side.vector if branch in self._forks \
+            else self._branches.get(branch, {})
+        top = heapq.nlargest(self.base_features, state.items(), key=lambda item: abs(item[1]))
+        return {i: x * self.base_weight for i, x in _sparse(dict(top)).items()}
+
+    def contribute(self, branch: str, text: Optional[str] = None,
+                   vector: Optional[Vector] = None,
+                   timestamp: Optional[float] = None) -> List[str]:
+        """
+        Record a contribution to a branch and update the affected forks
+
+        Args:
+            branch: Channel ID or fork ID
+            text: Contribution text (embedded with the registry's embedder)
+            vector: Precomputed embedding, sparse {index: weight} or dense
+            timestamp: Contribution time (default: now)
+
+        Returns:
+            IDs of the open forks whose depth changed
+        """
+        if vector is None:
+            if text is None:
+                raise ValueError("contribute() needs text or vector")
+            vector = self.embedder.embed(text, observe=True)
+        v = _sparse(vector)
+        if not v:
+            return []
+        now = time.time() if timestamp is None else timestamp
+
+        with self._lock:
+            updated = []
+            own = self._forks.get(branch)
+            if own is None:
+                state = self._branches.setdefault(branch, {})
+                for i, x in v.items():
+                    state[i] = state.get(i, 0.0) + x
+            elif own.fork.status == "open":
+                own.add(v, to_fork=True)
+                own.fork.contributions += 1
+                self._update(own, now)
+                updated.append(branch)
+            for child in self._children.get(branch, ()):
+                state = self._forks[child]
+                if state.fork.status == "open":
+                    state.add(v, to_fork=False)
+                    self._update(state, now)
+                    updated.append(child)
+            return updated
+
+    def observe(self, contribution) -> List[str]:
+        """
+        Feed a logged contribution (contribution_log.Contribution)
+
+        The branch is read from ``context["branch"]``; contributions without
+        one are ignored.
+        """
+        branch = (contribution.context or {}).get("branch")
+        if branch is None:
+            return []
+        return self.contribute(str(branch), text=contribution.idea,
+                               timestamp=contribution.timestamp)
+
+    def _update(self, state: _ForkState, now: float):
+        fork = state.fork
+        fork.depth = max(0.0, self.depth_scale * (1.0 - state.similarity()))
+        estimate = state.trend.update(now, fork.depth)
+        fork.depth_per_day = 0.0 if estimate.by_index else estimate.slope * 24
+        fork.merge_cost = merge_cost(fork.depth, self.beta)
+        fork.updated_at = now
+        self._schedule(state, now)
+
+    def optimal_merge_time(self, fork: Fork, now: Optional[float] = None) -> float:
+        """
+        When merging maximizes value kept minus merge cost
+
+        Args:
+            fork: Open fork
+            now: Current time (default: fork.updated_at)
+
+        Returns:
+            Epoch seconds
+        """
+        now = fork.updated_at if now is None else now
+        earliest = fork.created_at + self.min_days * DAY
+        latest = fork.created_at + self.max_days * DAY
+        if fork.depth >= self.max_depth:
+            return now
+        s = fork.depth_per_day
+        if s <= 0:
+            return latest
+        _, beta1, beta2 = self.beta
+        target = (self.value_per_day / s - beta1) / (2 * beta2)
+        due = now + max(0.0, (target - fork.depth) / s) * DAY
+        return min(max(due, earliest), latest)
+
+    def _schedule(self, state: _ForkState, now: float):
+        state.version += 1
+        state.fork.merge_due = self.optimal_merge_time(state.fork, now)
+        heapq.heappush(self._due, (state.fork.merge_due, state.version, state.fork.fork_id))
+        # Superseded entries stay in the heap until they outnumber live ones
+        if len(self._due) > 2 * len(self._forks) + 64:
+            self._due = [(s.fork.merge_due, s.version, s.fork.fork_id)
+                         for s in self._forks.values() if s.fork.status == "open"]
+            heapq.heapify(self._due)
+
+    def merge_now(self, now: Optional[float] = None, limit: Optional[int] = None) -> List[Fork]:
+        """
+        Open forks whose optimal merge time has come, most overdue first
+
+        Args:
+            now: Current time (default: now)
+            limit: Maximum number of forks
+
+        Returns:
+            Forks due for merging
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            due, keep = [], []
+            while self._due and self._due[0][0] <= now and (limit is None or len(due) < limit):
+                entry = heapq.heappop(self._due)
+                state = self._forks.get(entry[2])
+                if state is None or state.version != entry[1] or state.fork.status != "open":
+                    continue
+                due.append(state.fork)
+                keep.append(entry)
+            # Still due until merged
+            for entry in keep:
+                heapq.heappush(self._due, entry)
+            return due
+
+    def close_fork(self, fork_id: str, merged: bool = True,
+                   timestamp: Optional[float] = None) -> Fork:
+        """
+        Mark a fork merged (or abandoned)
+
+        Raises:
+            KeyError: If the fork doesn't exist
+        """
+        with self._lock:
+            state = self._forks[fork_id]
+            state.fork.status = "merged" if merged else "abandoned"
+            state.fork.updated_at = time.time() if timestamp is None else timestamp
+            state.version += 1
+            self._children.get(state.fork.parent, set()).discard(fork_id)
+        logger.info(f"Fork {fork_id} {state.fork.status} at D={state.fork.depth:.2f}")
+        return state.fork
+
+    def get(self, fork_id: str) -> Optional[Fork]:
+        state = self._forks.get(fork_id)
+        return state.fork if state else None
+
+    def forks(self, parent: Optional[str] = None, status: Optional[str] = "open") -> List[Fork]:
+        """Forks (of a parent branch), oldest first"""
+        with self._lock:
+            ids = self._children.get(parent, ()) if parent is not None and status == "open" \
+                else self._forks
+            forks = [self._forks[i].fork for i in ids]
+        return sorted((f for f in forks if (parent is None or f.parent == parent)
+                       and (status is None or f.status == status)),
+                      key=lambda f: f.created_at)
+
+    def __contains__(self, fork_id) -> bool:
+        return fork_id in self._forks
+
+    def __len__(self) -> int:
+        return len(self._forks)
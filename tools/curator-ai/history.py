@@ -0,0 +1,194 @@
+"""
+Curator AI - History Storage
+Pluggable storage backends for ZcResult history
+
+CuratorMonitor keeps its history behind the HistoryStore interface so the
+storage engine can be swapped without touching the Zc logic. The default
+backend is a bounded, retention-aware ring buffer that keeps timestamps as
+epoch seconds and answers windowed queries by binary search.
+"""
+
+from array import array
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from monitor import ZcResult
+
+
+def to_epoch(timestamp: str) -> float:
+    """Convert an ISO timestamp (as stored on ZcResult) to epoch seconds"""
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+class HistoryStore:
+    """
+    Interface for ZcResult history backends
+
+    Results are expected to be appended in chronological order. Backends
+    behave like a read-only sequence (len, indexing, iteration) so callers
+    can keep using ``monitor.history[-1]`` and ``len(monitor.history)``.
+    """
+
+    # True if results outlive the store object (e.g. a database file)
+    persistent = False
+
+    def append(self, result: 'ZcResult'):
+        """Store a new result"""
+        raise NotImplementedError
+
+    def extend(self, results: List['ZcResult']):
+        """Store many results (sorted by timestamp before insertion)"""
+        for result in sorted(results, key=lambda r: to_epoch(r.timestamp)):
+            self.append(result)
+
+    def since(self, cutoff: float) -> List['ZcResult']:
+        """Return results with timestamp >= cutoff (epoch seconds), oldest first"""
+        raise NotImplementedError
+
+    def latest(self) -> Optional['ZcResult']:
+        """Return the most recent result, or None if empty"""
+        return self[-1] if len(self) else None
+
+    def clear(self):
+        """Remove all results"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the backend"""
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __getitem__(self, index):
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator['ZcResult']:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+
+class RingBufferHistory(HistoryStore):
+    """
+    Bounded in-memory history
+
+    Results live in a circular buffer with a parallel array of epoch
+    timestamps. The buffer grows geometrically up to ``max_size``; appends are
+    amortized O(1) and once it is full the oldest result is overwritten.
+    ``since()`` binary-searches the timestamp array, so a windowed query
+    costs O(log N + k) instead of re-parsing every entry.
+
+    If ``retention_hours`` is set, results older than that (relative to the
+    newest stored result) are dropped on append.
+    """
+
+    DEFAULT_MAX_SIZE = 131072  # ~90 days at one sample per minute
+    INITIAL_CAPACITY = 64
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE,
+                 retention_hours: Optional[float] = None):
+        """
+        Initialize ring buffer
+
+        Args:
+            max_size: Maximum number of results kept in memory
+            retention_hours: Optional age limit for stored results
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+
+        self.max_size = max_size
+        self.retention_hours = retention_hours
+        self.clear()
+
+    def _physical(self, index: int) -> int:
+        return (self._head + index) % len(self._items)
+
+    def _stamp(self, index: int) -> float:
+        return self._stamps[(self._head + index) % len(self._items)]
+
+    def _pop_oldest(self):
+        self._items[self._head] = None
+        self._head = (self._head + 1) % len(self._items)
+        self._size -= 1
+
+    def _grow(self):
+        """Double capacity (up to max_size), re-linearizing the buffer"""
+        capacity = min(self.max_size, 2 * len(self._items))
+        order = [self._physical(i) for i in range(self._size)]
+        items = [self._items[i] for i in order]
+        stamps = array('d', (self._stamps[i] for i in order))
+        items.extend([None] * (capacity - self._size))
+        stamps.extend(array('d', [0.0]) * (capacity - self._size))
+        self._items = items
+        self._stamps = stamps
+        self._head = 0
+
+    def append(self, result: 'ZcResult'):
+        """Store a new result, evicting the oldest one when full"""
+        stamp = to_epoch(result.timestamp)
+
+        if self._size and stamp < self._stamp(self._size - 1):
+            # Out-of-order insert (rare): rebuild in sorted order
+            self._rebuild(list(self) + [result])
+            return
+
+        if self._size == len(self._items):
+            if self._size < self.max_size:
+                self._grow()
+            else:
+                self._pop_oldest()
+
+        slot = self._physical(self._size)
+        self._items[slot] = result
+        self._stamps[slot] = stamp
+        self._size += 1
+
+        if self.retention_hours is not None:
+            cutoff = stamp - self.retention_hours * 3600
+            while self._size and self._stamp(0) < cutoff:
+                self._pop_oldest()
+
+    def _rebuild(self, results: List['ZcResult']):
+        results.sort(key=lambda r: to_epoch(r.timestamp))
+        self.clear()
+        for result in results[-self.max_size:]:
+            self.append(result)
+
+    def _bisect_left(self, cutoff: float) -> int:
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._stamp(mid) < cutoff:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def since(self, cutoff: float) -> List['ZcResult']:
+        """Return results with timestamp >= cutoff in O(log N + k)"""
+        start = self._bisect_left(cutoff)
+        return [self._items[self._physical(i)] for i in range(start, self._size)]
+
+    def clear(self):
+        """Remove all results"""
+        capacity = min(self.max_size, self.INITIAL_CAPACITY)
+        self._items: List[Optional['ZcResult']] = [None] * capacity
+        self._stamps = array('d', [0.0]) * capacity
+        self._head = 0  # Physical index of the oldest result
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        return self._items[self._physical(index)]
@@ -0,0 +1,218 @@
+"""
+Curator AI - Mode Hysteresis
+Committed mode switching over a time window (MATHEMATICAL-APPENDIX.md §2.2)
+
+A single Zc sample only sets the instantaneous zone. The committed mode
+changes when the time-weighted share of the last τ hours spent beyond a
+threshold is large enough:
+
+    → JAM (RED)          Zc ≥ 1.0 and ∫ 1[Zc > 0.9] ds > 0.5τ
+    → STUDY_HALL (GREEN) Zc < 0.7 and ∫ 1[Zc < 0.8] ds > 0.7τ
+
+and, by the same pattern, for the transition mode:
+
+    GREEN → GUSH (YELLOW)  Zc ≥ 0.7 and ∫ 1[Zc > 0.8] ds > 0.5τ
+    RED   → GUSH (YELLOW)  Zc < 1.0 and ∫ 1[Zc < 0.9] ds > 0.7τ
+
+Opposite rules share one split level (0.8 around the GREEN boundary, 0.9
+around the RED one), so they can never hold at the same time. Zc hovering
+around a threshold therefore can't flip the committed mode back and forth.
+
+Each sample's Zc covers the interval since the previous sample (metrics are
+measured over the trailing timeframe). The integrals are running sums over
+a deque of those intervals, so each update is amortized O(1).
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+ZONE_MODES = {"GREEN": "STUDY_HALL", "YELLOW": "GUSH", "RED": "JAM"}
+
+
+@dataclass
+class ModeTransition:
+    """A change of the committed zone/mode"""
+    timestamp: float
+    zc: float
+    from_zone: str
+    to_zone: str
+
+    @property
+    def from_mode(self) -> str:
+        return ZONE_MODES[self.from_zone]
+
+    @property
+    def to_mode(self) -> str:
+        return ZONE_MODES[self.to_zone]
+
+
+class ModeStateMachine:
+    """
+    Hysteresis between GREEN/YELLOW/RED based on time-weighted indicators
+    """
+
+    def __init__(self,
+                 green_threshold: float = 0.7,
+                 yellow_threshold: float = 1.0,
+                 window_hours: float = 24,
+                 margin: float = 0.1,
+                 enter_fraction: float = 0.5,
+                 exit_fraction: float = 0.7):
+        """
+        Initialize state machine
+
+        Args:
+            green_threshold: Zc where GREEN ends
+            yellow_threshold: Zc where RED starts
+            window_hours: Hysteresis window τ
+            margin: Split levels are green_threshold + margin and yellow_threshold - margin
+            enter_fraction: Share of τ required to move to a higher-load mode
+            exit_fraction: Share of τ required to move to a lower-load mode
+        """
+        self.green_threshold = green_threshold
+        self.yellow_threshold = yellow_threshold
+        self.window = window_hours * 3600
+        self.enter_fraction = enter_fraction
+        self.exit_fraction = exit_fraction
+
+        # Split levels around the GREEN (0) and RED (1) boundaries
+        self.levels = (green_threshold + margin, yellow_threshold - margin)
+
+        # Segments [start, end, above flags, below flags] inside the window
+        self._segments = deque()
+        self._above = [0.0, 0.0]
+        self._below = [0.0, 0.0]
+        self._last_ts: Optional[float] = None
+
+        self.zone: Optional[str] = None            # Instantaneous
+        self.committed_zone: Optional[str] = None
+        self.committed_since: Optional[float] = None
+        self.last_transition: Optional[ModeTransition] = None
+
+    @property
+    def committed_mode(self) -> Optional[str]:
+        return ZONE_MODES.get(self.committed_zone)
+
+    def _zone(self, zc: float) -> str:
+        if zc < self.green_threshold:
+            return "GREEN"
+        if zc < self.yellow_threshold:
+            return "YELLOW"
+        return "RED"
+
+    def _add_segment(self, start: float, end: float, zc: float):
+        above = tuple(zc > level for level in self.levels)
+        below = tuple(zc < level for level in self.levels)
+        duration = end - start
+        for i in (0, 1):
+            if above[i]:
+                self._above[i] += duration
+            if below[i]:
+                self._below[i] += duration
+        self._segments.append([start, end, above, below])
+
+    def _subtract(self, segment, duration: float):
+        for i in (0, 1):
+            if segment[2][i]:
+                self._above[i] -= duration
+            if segment[3][i]:
+                self._below[i] -= duration
+
+    def _trim(self, now: float):
+        window_start = now - self.window
+        segments = self._segments
+        while segments and segments[0][1] <= window_start:
+            segment = segments.popleft()
+            self._subtract(segment, segment[1] - segment[0])
+        if segments and segments[0][0] < window_start:
+            self._subtract(segments[0], window_start - segments[0][0])
+            segments[0][0] = window_start
+
+    def time_above(self, level: int) -> float:
+        """Seconds in the window with Zc above levels[level]"""
+        return max(0.0, self._above[level])
+
+    def time_below(self, level: int) -> float:
+        """Seconds in the window with Zc below levels[level]"""
+        return max(0.0, self._below[level])
+
+    def _target(self, zc: float) -> Optional[str]:
+        """Zone the rules allow switching to, if any"""
+        enter = self.enter_fraction * self.window
+        exit_ = self.exit_fraction * self.window
+        current = self.committed_zone
+
+        if current != "RED" and zc >= self.yellow_threshold and self.time_above(1) > enter:
+            return "RED"
+        if current != "GREEN" and zc < self.green_threshold and self.time_below(0) > exit_:
+            return "GREEN"
+        if current == "GREEN" and zc >= self.green_threshold and self.time_above(0) > enter:
+            return "YELLOW"
+        if current == "RED" and zc < self.yellow_threshold and self.time_below(1) > exit_:
+            return "YELLOW"
+        return None
+
+    def update(self, timestamp: float, zc: float) -> Optional[ModeTransition]:
+        """
+        Add a sample and re-evaluate the committed zone
+
+        Args:
+            timestamp: Sample time (epoch seconds)
+            zc: Sample Zc
+
+        Returns:
+            ModeTransition if the committed zone changed, else None
+        """
+        self.zone = self._zone(zc)
+
+        if self._last_ts is None or self.committed_zone is None:
+            # Nothing to be hysteretic about yet
+            self.committed_zone = self.zone
+            self.committed_since = timestamp
+            self._last_ts = timestamp
+            return None
+
+        if timestamp > self._last_ts:
+            start = max(self._last_ts, timestamp - self.window)
+            self._add_segment(start, timestamp, zc)
+            self._last_ts = timestamp
+        self._trim(self._last_ts)
+
+        target = self._target(zc)
+        if target is None:
+            return None
+
+        transition = ModeTransition(timestamp=timestamp, zc=zc,
+                                    from_zone=self.committed_zone, to_zone=target)
+        self.committed_zone = target
+        self.committed_since = timestamp
+        self.last_transition = transition
+        logger.info(f"Committed mode change: {transition.from_mode} → {transition.to_mode} (Zc {zc:.2f})")
+        return transition
+
+    def reset(self):
+        """Forget all samples and the committed zone"""
+        self._segments.clear()
+        self._above = [0.0, 0.0]
+        self._below = [0.0, 0.0]
+        self._last_ts = None
+        self.zone = self.committed_zone = self.committed_since = None
+        self.last_transition = None
+
+    def state(self) -> Dict:
+        """Committed and instantaneous state plus the window shares"""
+        window = self.window or 1.0
+        return {
+            "zone": self.zone,
+            "committed_zone": self.committed_zone,
+            "committed_mode": self.committed_mode,
+            "committed_since": self.committed_since,
+            "share_above": {str(round(level, 3)): round(self.time_above(i) / window, 3)
+                            for i, level in enumerate(self.levels)},
+            "share_below": {str(round(level, 3)): round(self.time_below(i) / window, 3)
+                            for i, level in enumerate(self.levels)},
+        }
@@ -0,0 +1,260 @@
+"""
+Curator AI - Event Ingestion
+Aggregates individual activity events into per-team metrics
+
+Sources that can push (GitHub webhooks, chat relays, scripts) send one event
+per activity instead of us polling every platform:
+
+    {"source": "github", "team": "platform", "ts": "2026-03-01T12:00:00Z"}
+    {"source": "slack_messages", "team": "platform", "ts": 1772366400, "count": 12}
+
+Events are counted into time buckets per team and source; feed() turns the
+trailing window into TeamMetrics and runs each active team's monitor.
+Ingestion is open to any client, so the team set is bounded: teams can be
+restricted to an allowlist, at most ``max_teams`` are tracked, and a team
+is forgotten once all its buckets have expired.
+Timestamps are Unix seconds or ISO 8601 (UTC unless an offset is given) and
+default to the time of arrival.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Union
+import logging
+
+from batch import METRIC_FIELDS
+from counters import BucketCounter
+from monitor import TeamMetrics, ZcResult
+from registry import DEFAULT_TEAM_ID, MonitorRegistry
+
+logger = logging.getLogger(__name__)
+
+# Short source names accepted besides the TeamMetrics field names
+SOURCE_ALIASES = {
+    "slack": "slack_messages",
+    "discord": "discord_messages",
+    "notion": "notion_updates",
+    "github": "github_events",
+    "linear": "linear_updates",
+    "ai": "ai_outputs",
+    "email": "emails",
+}
+
+# Rejection details kept per batch
+MAX_ERRORS = 10
+
+
+@dataclass
+class IngestResult:
+    """Outcome of one ingested batch"""
+    accepted: int = 0
+    rejected: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def reject(self, line: int, reason: str):
+        self.rejected += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(f"line {line}: {reason}")
+
+    def merge(self, other: "IngestResult"):
+        self.accepted += other.accepted
+        for error in other.errors:
+            if len(self.errors) < MAX_ERRORS:
+                self.errors.append(error)
+        self.rejected += other.rejected
+
+
+def _event_epoch(ts: Union[str, float, int]) -> float:
+    """Epoch seconds from a Unix timestamp or ISO 8601 string"""
+    if isinstance(ts, bool):
+        raise ValueError(f"invalid timestamp {ts!r}")
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    parsed = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _metric_field(source: str) -> str:
+    name = SOURCE_ALIASES.get(source, source)
+    if name not in METRIC_FIELDS:
+        raise ValueError(f"unknown source {source!r}")
+    return name
+
+
+class EventAggregator:
+    """
+    In-memory, time-bucketed event counts per team and metric
+    """
+
+    def __init__(self, bucket_seconds: int = 60, retention_hours: float = 168,
+                 max_future_seconds: float = 300, max_teams: int = 1024,
+                 allowed_teams: Optional[Iterable[str]] = None):
+        """
+        Initialize aggregator
+
+        Args:
+            bucket_seconds: Width of each count bucket
+            retention_hours: Longest window that can be fed to monitors
+            max_future_seconds: Reject events further in the future than this
+            max_teams: Most teams tracked at once; events for new teams are
+                       rejected while full
+            allowed_teams: Optional allowlist; events for other teams are rejected
+        """
+        self.bucket_seconds = bucket_seconds
+        self.retention_hours = retention_hours
+        self.max_future_seconds = max_future_seconds
+        self.max_teams = max_teams
+        self.allowed_teams = frozenset(allowed_teams) if allowed_teams is not None else None
+        self._teams: Dict[str, BucketCounter] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self.events_total = 0
+
+    def _counter(self, team: str) -> BucketCounter:
+        """Team's counter, created if there is room (call with the lock held)"""
+        counter = self._teams.get(team)
+        if counter is None:
+            if len(self._teams) >= self.max_teams:
+                self._expire(time.time())
+                if len(self._teams) >= self.max_teams:
+                    raise ValueError(f"too many teams (max {self.max_teams})")
+            counter = self._teams[team] = BucketCounter(
+                bucket_seconds=self.bucket_seconds,
+                retention_hours=self.retention_hours
+            )
+        return counter
+
+    def _expire(self, now: float) -> int:
+        """Forget teams with no unexpired events (call with the lock held)"""
+        idle = [team for team, counter in self._teams.items()
+                if team not in self._dirty and counter.empty(now)]
+        for team in idle:
+            del self._teams[team]
+        return len(idle)
+
+    def add(self, source: str, team: str = DEFAULT_TEAM_ID,
+            ts: Union[str, float, None] = None, count: int = 1):
+        """
+        Count one event (or ``count`` identical events)
+
+        Raises:
+            ValueError: On unknown sources, invalid teams, counts or timestamps
+        """
+        name = _metric_field(source)
+        MonitorRegistry.validate_team_id(team)
+        if self.allowed_teams is not None and team not in self.allowed_teams:
+            raise ValueError(f"unknown team {team!r}")
+        if not isinstance(count, int) or isinstance(count, bool) or count <= 0:
+            raise ValueError(f"count must be a positive integer, got {count!r}")
+        epoch = time.time() if ts is None else _event_epoch(ts)
+        if epoch > time.time() + self.max_future_seconds:
+            raise ValueError("timestamp is in the future")
+
+        with self._lock:
+            self._counter(team).add(name, epoch, count)
+            self._dirty.add(team)
+            self.events_total += count
+
+    def ingest(self, events: Iterable[Dict]) -> IngestResult:
+        """
+        Count a batch of event dicts
+
+        Args:
+            events: Dicts with ``source`` and optional ``team``, ``ts``, ``count``
+
+        Returns:
+            IngestResult (invalid events are rejected individually)
+        """
+        result = IngestResult()
+        for line, event in enumerate(events, start=1):
+            self._add_event(event, line, result)
+        return result
+
+    def _add_event(self, event, line: int, result: IngestResult):
+        try:
+            if not isinstance(event, dict):
+                raise ValueError("event must be a JSON object")
+            self.add(event["source"], event.get("team") or DEFAULT_TEAM_ID,
+                     event.get("ts"), event.get("count", 1))
+            result.accepted += 1
+        except (KeyError, TypeError, ValueError) as e:
+            result.reject(line, f"{type(e).__name__}: {e}")
+
+    def ingest_lines(self, lines: Iterable[Union[str, bytes]], first_line: int = 1) -> IngestResult:
+        """
+        Count a batch of NDJSON lines (blank lines are skipped)
+
+        Args:
+            lines: One JSON event per line
+            first_line: Line number of the first line (for error messages)
+
+        Returns:
+            IngestResult
+        """
+        result = IngestResult()
+        for line, raw in enumerate(lines, start=first_line):
+            if not raw.strip():
+                continue
+            try:
+                event = json.loads(raw)
+            except ValueError as e:
+                result.reject(line, f"invalid JSON: {e}")
+                continue
+            self._add_event(event, line, result)
+        return result
+
+    def metrics(self, team: str, hours: float = 24, now: Optional[float] = None) -> TeamMetrics:
+        """TeamMetrics for a team's last ``hours`` of events"""
+        counter = self._teams.get(team)
+        counts = counter.counts(hours, now=now, keys=METRIC_FIELDS) if counter else {}
+        return TeamMetrics(timestamp=datetime.now().isoformat(), **counts)
+
+    def teams(self) -> List[str]:
+        """Teams that have sent events"""
+        with self._lock:
+            return list(self._teams)
+
+    def feed(self, registry: MonitorRegistry, hours: float = 24,
+             now: Optional[float] = None) -> Dict[str, ZcResult]:
+        """
+        Run Zc for every team with events in the window
+
+        Teams that received events since the last feed, or still have events
+        in the window, get one calculation each from their trailing
+        ``hours`` of events. Teams whose events have all expired are then
+        forgotten.
+
+        Args:
+            registry: Registry providing each team's monitor
+            hours: Window (and timeframe_hours) of each calculation
+            now: End of the window (default: current time)
+
+        Returns:
+            ZcResult per team
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            teams = list(self._teams)
+
+        results = {}
+        for team in teams:
+            metrics = self.metrics(team, hours, now=now)
+            if team not in dirty and metrics.total_items() == 0:
+                continue
+            try:
+                results[team] = registry.get(team).calculate_zc(metrics, timeframe_hours=hours)
+            except ValueError as e:
+                logger.error(f"Error calculating Zc for {team}: {e}")
+        if results:
+            logger.info(f"Fed event metrics to {len(results)} team monitors")
+
+        with self._lock:
+            expired = self._expire(time.time() if now is None else now)
+        if expired:
+            logger.info(f"Forgot {expired} teams without recent events")
+        return results
@@ -8,11 +8,21 @@ and calculates cognitive impedance in real-time.
 
 import time
 import json
+import asyncio
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field
 import logging
 
+from aggregates import ZcAggregates
+from batch import METRIC_FIELDS, ZcBatchResult, calculate_zc_batch
+from forecast import ZcForecast, ZcForecaster
+from history import HistoryStore, RingBufferHistory, to_epoch
+from hysteresis import ModeStateMachine, ModeTransition
+from trend import TrendEstimate, TrendEstimator
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -48,6 +58,8 @@ class ZcResult:
     confidence: float
     trend: str  # INCREASING, STABLE, DECREASING
     recommendation: str
+    committed_zone: Optional[str] = None  # Zone after hysteresis (see hysteresis.py)
+    committed_mode: Optional[str] = None
 
 
 class CuratorMonitor:
@@ -64,28 +76,72 @@ class CuratorMonitor:
     # Trend detection window (hours)
     TREND_WINDOW = 24
     
-    def __init__(self, team_size: int, processing_hours_per_person: float = 3.0):
+    # Hysteresis window τ for committed mode changes (hours)
+    MODE_WINDOW = 24
+    
+    # History replayed into the forecaster on startup (hours, two weekly seasons)
+    FORECAST_REPLAY = 336
+    
+    def __init__(self, team_size: int, processing_hours_per_person: float = 3.0,
+                 history_store: Optional[HistoryStore] = None,
+                 mode_window_hours: Optional[float] = None,
+                 trend_window_hours: Optional[float] = None):
         """
         Initialize monitor
         
         Args:
             team_size: Number of team members
             processing_hours_per_person: Effective processing capacity per person per day
+            history_store: Optional history backend (default: in-memory ring buffer)
+            mode_window_hours: Hysteresis window for committed modes (default: MODE_WINDOW)
+            trend_window_hours: Regression window for trends (default: TREND_WINDOW)
         """
         self.team_size = team_size
         self.processing_hours_per_person = processing_hours_per_person
-        self.history: List[ZcResult] = []
+        self.history: HistoryStore = (history_store if history_store is not None
+                                      else RingBufferHistory())
+        
+        # Running totals for summary stats, seeded from any persisted history
+        self.aggregates = ZcAggregates()
+        self._rebuild_aggregates()
+        
+        # Committed mode with hysteresis, replayed from recent history
+        self.modes = ModeStateMachine(
+            green_threshold=self.GREEN_THRESHOLD,
+            yellow_threshold=self.YELLOW_THRESHOLD,
+            window_hours=self.MODE_WINDOW if mode_window_hours is None else mode_window_hours
+        )
+        self.last_transition: Optional[ModeTransition] = None
+        self._rebuild_modes()
+        
+        # Windowed regression trend, replayed from recent history
+        self.trends = TrendEstimator(
+            window_hours=self.TREND_WINDOW if trend_window_hours is None else trend_window_hours
+        )
+        self._rebuild_trend()
+        
+        # Seasonal Zc forecast, fitted incrementally
+        self.forecaster = ZcForecaster(
+            green_threshold=self.GREEN_THRESHOLD,
+            yellow_threshold=self.YELLOW_THRESHOLD
+        )
+        self._rebuild_forecast()
+        
+        # Called with every new ZcResult (e.g. registry-wide statistics)
+        self.listeners: List[Callable[[ZcResult], None]] = []
         
         logger.info(f"Curator Monitor initialized for team of {team_size}")
     
     def calculate_zc(self, metrics: TeamMetrics, 
-                    timeframe_hours: int = 24) -> ZcResult:
+                    timeframe_hours: int = 24,
+                    team_size: Optional[int] = None) -> ZcResult:
         """
         Calculate Zc from team metrics
         
         Args:
             metrics: Team activity metrics
             timeframe_hours: Measurement window in hours
+            team_size: Team size for this calculation only (default: monitor's)
             
         Returns:
             ZcResult with full analysis
@@ -96,7 +152,8 @@ class CuratorMonitor:
         
         # Calculate B_social (processing capacity per hour)
         # B_social = (team_size × processing_hours_per_person × 24) / timeframe_hours
-        b_social = (self.team_size * self.processing_hours_per_person * 24) / timeframe_hours
+        team_size = self.team_size if team_size is None else team_size
+        b_social = (team_size * self.processing_hours_per_person * 24) / timeframe_hours
         
         # Calculate Zc
         if b_social <= 0:
@@ -107,8 +164,9 @@ class CuratorMonitor:
         # Detect zone and mode
         zone, mode = self._detect_zone_and_mode(zc)
         
-        # Analyze trend
-        trend = self._analyze_trend()
+        # Analyze trend (including this sample)
+        timestamp = datetime.now().isoformat()
+        trend = self._analyze_trend(to_epoch(timestamp), zc)
         
         # Calculate confidence
         confidence = self._calculate_confidence(zc, trend)
@@ -116,9 +174,13 @@ class CuratorMonitor:
         # Generate recommendation
         recommendation = self._generate_recommendation(zc, zone, mode, trend)
         
+        # Update committed mode (hysteresis over MODE_WINDOW)
+        self.last_transition = self.modes.update(to_epoch(timestamp), zc)
+        self.forecaster.update(to_epoch(timestamp), zc)
+        
         # Create result
         result = ZcResult(
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
             zc=round(zc, 2),
             v_generation=round(v_generation, 2),
             b_social=round(b_social, 2),
@@ -126,16 +188,61 @@ class CuratorMonitor:
             mode=mode,
             confidence=confidence,
             trend=trend,
-            recommendation=recommendation
+            recommendation=recommendation,
+            committed_zone=self.modes.committed_zone,
+            committed_mode=self.modes.committed_mode
         )
         
         # Store in history
         self.history.append(result)
+        self.aggregates.add(to_epoch(result.timestamp), result.zc, result.zone)
+        for listener in self.listeners:
+            try:
+                listener(result)
+            except Exception as e:
+                logger.error(f"Result listener failed: {e}")
         
         logger.info(f"Zc calculated: {zc:.2f} ({zone}) - {mode}")
         
         return result
     
+    def add_listener(self, callback: Callable[[ZcResult], None]):
+        """Call ``callback(result)`` after every calculate_zc"""
+        self.listeners.append(callback)
+    
+    def calculate_zc_batch(self, metrics: Dict[str, List[int]],
+                           timeframe_hours=24,
+                           team_sizes=None,
+                           team_ids: Optional[List[str]] = None,
+                           timestamps: Optional[List[float]] = None) -> ZcBatchResult:
+        """
+        Calculate Zc for many metric rows in one vectorized pass
+        
+        Uses this monitor's team size, capacity and thresholds unless
+        per-row values are given. Results are not added to history.
+        
+        Args:
+            metrics: Columns keyed by TeamMetrics field names
+            timeframe_hours: Measurement window per row (or one value)
+            team_sizes: Optional team size per row (default: monitor's)
+            team_ids: Optional team ID per row (trend is computed per team)
+            timestamps: Optional sample time per row (epoch seconds)
+            
+        Returns:
+            ZcBatchResult with zc, zone, mode, trend and confidence columns
+        """
+        return calculate_zc_batch(
+            metrics,
+            team_sizes=self.team_size if team_sizes is None else team_sizes,
+            timeframe_hours=timeframe_hours,
+            processing_hours_per_person=self.processing_hours_per_person,
+            team_ids=team_ids,
+            green_threshold=self.GREEN_THRESHOLD,
+            yellow_threshold=self.YELLOW_THRESHOLD,
+            timestamps=timestamps,
+            trend_window_hours=self.trends.window / 3600
+        )
+    
     def _detect_zone_and_mode(self, zc: float) -> Tuple[str, str]:
         """Detect zone and recommend mode"""
         if zc < self.GREEN_THRESHOLD:
@@ -145,22 +252,14 @@ class CuratorMonitor:
         else:
             return "RED", "JAM"
     
-    def _analyze_trend(self) -> str:
-        """Analyze Zc trend from recent history"""
-        if len(self.history) < 3:
-            return "STABLE"
-        
-        # Get recent results (last 3)
-        recent = self.history[-3:]
-        zc_values = [r.zc for r in recent]
-        
-        # Simple trend detection
-        if zc_values[-1] > zc_values[-2] > zc_values[-3]:
-            return "INCREASING"
-        elif zc_values[-1] < zc_values[-2] < zc_values[-3]:
-            return "DECREASING"
-        else:
-            return "STABLE"
+    def _analyze_trend(self, timestamp: float, zc: float) -> str:
+        """Add a sample to the windowed trend regression and return its label"""
+        return self.trends.update(timestamp, round(zc, 2)).label
+    
+    @property
+    def trend_estimate(self) -> TrendEstimate:
+        """Slope, t-statistic and label of the current trend window"""
+        return self.trends.estimate
     
     def _calculate_confidence(self, zc: float, trend: str) -> float:
         """
@@ -224,10 +323,70 @@ class CuratorMonitor:
             List of ZcResult objects
         """
         cutoff = datetime.now() - timedelta(hours=hours)
-        return [
-            r for r in self.history 
-            if datetime.fromisoformat(r.timestamp) >= cutoff
-        ]
+        return self.history.since(cutoff.timestamp())
+    
+    def forecast(self, hours: int = 24) -> Optional[ZcForecast]:
+        """
+        Project Zc for the next hours from the incrementally fitted model
+        
+        Args:
+            hours: Horizon in hours (1-72)
+            
+        Returns:
+            ZcForecast with hourly points and predicted zone crossings,
+            or None without history
+        """
+        return self.forecaster.forecast(hours)
+    
+    def get_summary(self, hours: int = 168) -> Dict:
+        """
+        Get summary statistics without scanning history
+        
+        Args:
+            hours: Window size in hours (default: 7 days)
+            
+        Returns:
+            Dict with count, avg_zc and zone_distribution
+        """
+        return self.aggregates.summary(hours=hours)
+    
+    def _rebuild_aggregates(self):
+        """Recompute running totals from stored history"""
+        self.aggregates.clear()
+        if not self.history:
+            return
+        cutoff = time.time() - self.aggregates.retention_hours * 3600
+        for r in self.history.since(cutoff):
+            self.aggregates.add(to_epoch(r.timestamp), r.zc, r.zone)
+    
+    def _rebuild_modes(self):
+        """Replay the last hysteresis window of history into the mode state machine"""
+        self.modes.reset()
+        if not self.history:
+            return
+        # Two windows, so the committed zone entering the last one is settled
+        cutoff = time.time() - self.modes.window * 2
+        for r in self.history.since(cutoff):
+            self.modes.update(to_epoch(r.timestamp), r.zc)
+    
+    def _rebuild_trend(self):
+        """Replay the last trend window of history into the trend estimator"""
+        self.trends.reset()
+        if not self.history:
+            return
+        recent = self.history.since(time.time() - self.trends.window)
+        if len(recent) < self.trends.min_samples:
+            recent = self.history[-self.trends.min_samples:]
+        for r in recent:
+            self.trends.update(to_epoch(r.timestamp), r.zc)
+    
+    def _rebuild_forecast(self):
+        """Replay recent history into the forecaster"""
+        self.forecaster.reset()
+        if not self.history:
+            return
+        for r in self.history.since(time.time() - self.FORECAST_REPLAY * 3600):
+            self.forecaster.update(to_epoch(r.timestamp), r.zc)
     
     def export_history(self, filepath: str):
         """Export history to JSON file"""
@@ -240,10 +399,40 @@ class CuratorMonitor:
         """Import history from JSON file"""
         with open(filepath, 'r') as f:
             data = json.load(f)
-        self.history = [ZcResult(**item) for item in data]
+        self.history.clear()
+        self.history.extend([ZcResult(**item) for item in data])
+        self._rebuild_aggregates()
+        self._rebuild_modes()
+        self._rebuild_trend()
+        self._rebuild_forecast()
         logger.info(f"History imported from {filepath} ({len(data)} records)")
 
 
+@dataclass
+class SourceStatus:
+    """Outcome of one collector in a collection run"""
+    status: str  # OK, TIMEOUT, ERROR
+    latency_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class CollectionReport:
+    """Metrics from a concurrent collection plus per-source status"""
+    metrics: TeamMetrics
+    sources: Dict[str, SourceStatus] = field(default_factory=dict)
+    
+    @property
+    def complete(self) -> bool:
+        """True if every source answered in time"""
+        return all(s.status == "OK" for s in self.sources.values())
+    
+    @property
+    def failed(self) -> List[str]:
+        """Sources missing from the metrics"""
+        return [name for name, s in self.sources.items() if s.status != "OK"]
+
+
 class MetricsCollector:
     """
     Collects metrics from various sources
@@ -252,16 +441,50 @@ class MetricsCollector:
     - Slack API
     - Discord API
     - Manual input (for other sources)
+    
+    ``collect()`` calls sources one after another; ``collect_concurrent()``
+    and ``collect_async()`` run them in parallel with per-source deadlines
+    and return partial metrics plus a status report when some sources fail.
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 8, default_timeout: Optional[float] = None):
+        """
+        Initialize collector
+        
+        Args:
+            max_workers: Threads used to run sources concurrently
+            default_timeout: Deadline in seconds for sources without their own
+        """
         self.collectors = {}
+        self.timeouts: Dict[str, Optional[float]] = {}
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.last_report: Optional[CollectionReport] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running: Dict[str, Future] = {}
     
-    def register_collector(self, name: str, collector_func):
-        """Register a metrics collector function"""
+    def register_collector(self, name: str, collector_func, timeout: Optional[float] = None):
+        """
+        Register a metrics collector function
+        
+        Args:
+            name: Source name
+            collector_func: Returns a dict of TeamMetrics field counts
+                            (may be a coroutine function for collect_async)
+            timeout: Optional deadline in seconds for this source
+        """
         self.collectors[name] = collector_func
+        self.timeouts[name] = timeout
         logger.info(f"Registered collector: {name}")
     
+    @staticmethod
+    def _merge(totals: Dict[str, int], name: str, data: Dict):
+        for key, value in data.items():
+            if key in METRIC_FIELDS:
+                totals[key] = totals.get(key, 0) + value
+            else:
+                logger.warning(f"Collector {name} returned unknown metric: {key}")
+    
     def collect(self) -> TeamMetrics:
         """
         Collect metrics from all registered sources
@@ -269,19 +492,126 @@ class MetricsCollector:
         Returns:
             TeamMetrics object with aggregated data
         """
-        metrics = TeamMetrics(timestamp=datetime.now().isoformat())
+        totals: Dict[str, int] = {}
         
         for name, collector in self.collectors.items():
             try:
-                data = collector()
-                # Update metrics with collected data
-                for key, value in data.items():
-                    if hasattr(metrics, key):
-                        setattr(metrics, key, getattr(metrics, key) + value)
+                self._merge(totals, name, collector())
             except Exception as e:
                 logger.error(f"Error collecting from {name}: {e}")
         
-        return metrics
+        return TeamMetrics(timestamp=datetime.now().isoformat(), **totals)
+    
+    def _timeout(self, name: str) -> Optional[float]:
+        timeout = self.timeouts.get(name)
+        return self.default_timeout if timeout is None else timeout
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="metrics-collector")
+        return self._executor
+    
+    def _timed(self, collector: Callable) -> Tuple[Dict, float]:
+        start = time.perf_counter()
+        data = collector()
+        return data, (time.perf_counter() - start) * 1000
+    
+    def collect_concurrent(self) -> CollectionReport:
+        """
+        Collect from all sources in parallel threads
+        
+        Each source gets its own deadline (``register_collector(timeout=...)``
+        or ``default_timeout``). Sources that miss it or raise are left out of
+        the metrics and reported; a source whose previous call is still
+        running is not started again.
+        
+        Returns:
+            CollectionReport with partial metrics and per-source status
+        """
+        executor = self._get_executor()
+        start = time.perf_counter()
+        timestamp = datetime.now().isoformat()
+        sources: Dict[str, SourceStatus] = {}
+        totals: Dict[str, int] = {}
+        
+        futures = {}
+        for name, collector in self.collectors.items():
+            previous = self._running.get(name)
+            if previous is not None and not previous.done():
+                sources[name] = SourceStatus("TIMEOUT", 0.0, "previous call still running")
+                continue
+            futures[name] = self._running[name] = executor.submit(self._timed, collector)
+        
+        for name, future in futures.items():
+            timeout = self._timeout(name)
+            remaining = None if timeout is None else max(0.0, timeout - (time.perf_counter() - start))
+            try:
+                data, latency_ms = future.result(timeout=remaining)
+                self._merge(totals, name, data)
+                sources[name] = SourceStatus("OK", latency_ms)
+            except FutureTimeoutError:
+                sources[name] = SourceStatus(
+                    "TIMEOUT", (time.perf_counter() - start) * 1000, f"no answer within {timeout}s"
+                )
+                logger.warning(f"Collector {name} timed out after {timeout}s")
+            except Exception as e:
+                sources[name] = SourceStatus("ERROR", (time.perf_counter() - start) * 1000, str(e))
+                logger.error(f"Error collecting from {name}: {e}")
+        
+        report = CollectionReport(TeamMetrics(timestamp=timestamp, **totals), sources)
+        self.last_report = report
+        return report
+    
+    async def collect_async(self) -> CollectionReport:
+        """
+        Collect from all sources concurrently on the running event loop
+        
+        Coroutine functions are awaited directly; plain functions run in the
+        collector's thread pool. Deadlines and reporting work like
+        collect_concurrent().
+        
+        Returns:
+            CollectionReport with partial metrics and per-source status
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        timestamp = datetime.now().isoformat()
+        sources: Dict[str, SourceStatus] = {}
+        totals: Dict[str, int] = {}
+        
+        async def run(name, collector):
+            start = time.perf_counter()
+            timeout = self._timeout(name)
+            if inspect.iscoroutinefunction(collector):
+                call = collector()
+            else:
+                call = loop.run_in_executor(executor, collector)
+            try:
+                data = await asyncio.wait_for(call, timeout=timeout)
+                latency_ms = (time.perf_counter() - start) * 1000
+                self._merge(totals, name, data)
+                sources[name] = SourceStatus("OK", latency_ms)
+            except asyncio.TimeoutError:
+                sources[name] = SourceStatus(
+                    "TIMEOUT", (time.perf_counter() - start) * 1000, f"no answer within {timeout}s"
+                )
+                logger.warning(f"Collector {name} timed out after {timeout}s")
+            except Exception as e:
+                sources[name] = SourceStatus("ERROR", (time.perf_counter() - start) * 1000, str(e))
+                logger.error(f"Error collecting from {name}: {e}")
+        
+        await asyncio.gather(*(run(name, c) for name, c in self.collectors.items()))
+        
+        report = CollectionReport(TeamMetrics(timestamp=timestamp, **totals), sources)
+        self.last_report = report
+        return report
+    
+    def close(self):
+        """Release the worker threads (running sources are not interrupted)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def collect_manual(self, **kwargs) -> TeamMetrics:
         """
@@ -8,6 +8,7 @@ recommendations using Anthropic's Claude API.
 
 import os
 import json
+import asyncio
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 import logging
@@ -19,7 +20,9 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     logging.warning("Anthropic SDK not installed. Install with: pip install anthropic")
 
+from cache import RecommendationCache, recommendation_key
 from monitor import ZcResult, TeamMetrics
+from singleflight import AsyncSingleFlight, SingleFlight
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,14 +47,25 @@ class CuratorRecommender:
     - Current Zc status
     - Historical trends
     - Team context
+    
+    Concurrent requests with the same normalized inputs share one Claude
+    call (see singleflight.py).
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    MODEL = "claude-sonnet-4-20250514"
+    MAX_TOKENS = 1000
+    
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 cache: Optional[RecommendationCache] = None):
         """
         Initialize recommender
         
         Args:
             api_key: Anthropic API key (or use ANTHROPIC_API_KEY env var)
+            base_url: Optional API endpoint (e.g. a local stub server for tests)
+            cache: Optional cache reused for unchanged inputs
         """
         if not ANTHROPIC_AVAILABLE:
             raise ImportError("Anthropic SDK required. Install: pip install anthropic")
@@ -60,9 +74,40 @@ class CuratorRecommender:
         if not self.api_key:
             raise ValueError("Anthropic API key required (set ANTHROPIC_API_KEY env var)")
         
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.base_url = base_url
+        self.cache = cache
+        self.flights = self._create_flights()
+        self.client = self._create_client()
         logger.info("Curator Recommender initialized")
     
+    def _create_client(self):
+        """Create the Anthropic API client"""
+        return anthropic.Anthropic(api_key=self.api_key, base_url=self.base_url)
+    
+    def _create_flights(self) -> SingleFlight:
+        """Create the group that coalesces concurrent identical calls"""
+        return SingleFlight()
+    
+    def _cache_get(self, key: str) -> Optional[Recommendation]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        logger.info("Recommendation served from cache")
+        return Recommendation(**cached)
+    
+    def _cache_store(self, key: str, recommendation: Recommendation):
+        if self.cache is not None:
+            self.cache.put(key, recommendation.__dict__)
+    
+    def stats(self) -> Dict:
+        """Cache and request-coalescing counters"""
+        return {
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "calls": self.flights.stats(),
+        }
+    
     def generate_recommendation(self, 
                                result: ZcResult,
                                team_context: Optional[str] = None,
@@ -78,14 +123,28 @@ class CuratorRecommender:
         Returns:
             Detailed Recommendation object
         """
+        key = recommendation_key(result, team_context, recent_history)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        return self.flights.do(
+            key, lambda: self._generate(key, result, team_context, recent_history)
+        )
+    
+    def _generate(self,
+                  key: str,
+                  result: ZcResult,
+                  team_context: Optional[str],
+                  recent_history: Optional[List[ZcResult]]) -> Recommendation:
         # Build context for Claude
         prompt = self._build_prompt(result, team_context, recent_history)
         
         # Call Claude API
         try:
             response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1000,
+                model=self.MODEL,
+                max_tokens=self.MAX_TOKENS,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
@@ -96,12 +155,13 @@ class CuratorRecommender:
             recommendation = self._parse_recommendation(content, result)
             
             logger.info("Recommendation generated successfully")
-            return recommendation
-            
         except Exception as e:
             logger.error(f"Error calling Claude API: {e}")
-            # Fallback to basic recommendation
+            # Fallback to basic recommendation (not cached, so the next call retries)
             return self._fallback_recommendation(result)
+        
+        self._cache_store(key, recommendation)
+        return recommendation
     
     def _build_prompt(self, 
                      result: ZcResult,
@@ -292,6 +352,116 @@ Respond with ONLY the JSON, no preamble or markdown.
         return "\n".join(output)
 
 
+class AsyncCuratorRecommender(CuratorRecommender):
+    """
+    Non-blocking Curator AI Recommendation Engine
+    
+    Same prompts, parsing and fallbacks as CuratorRecommender, but calls
+    Claude through the async client so an event loop (e.g. the dashboard API)
+    keeps serving other requests while a recommendation is generated.
+    
+    - At most ``max_concurrency`` Claude calls run at once
+    - Each request (including time waiting for a slot) is bounded by
+      ``timeout_seconds``; on timeout the rule-based fallback is returned
+    - A call that outlives a caller's timeout keeps running for coalesced
+      callers and still fills the cache
+    """
+    
+    def __init__(self, 
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 cache: Optional[RecommendationCache] = None,
+                 max_concurrency: int = 4,
+                 timeout_seconds: float = 30.0):
+        """
+        Initialize async recommender
+        
+        Args:
+            api_key: Anthropic API key (or use ANTHROPIC_API_KEY env var)
+            base_url: Optional API endpoint (e.g. a local stub server for tests)
+            cache: Optional cache reused for unchanged inputs
+            max_concurrency: Maximum concurrent Claude API calls
+            timeout_seconds: Per-request deadline
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+        
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        super().__init__(api_key=api_key, base_url=base_url, cache=cache)
+    
+    def _create_client(self):
+        """Create the async Anthropic API client"""
+        return anthropic.AsyncAnthropic(api_key=self.api_key, base_url=self.base_url,
+                                        timeout=self.timeout_seconds)
+    
+    def _create_flights(self) -> AsyncSingleFlight:
+        """Create the group that coalesces concurrent identical calls"""
+        return AsyncSingleFlight()
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def generate_recommendation(self, 
+                                      result: ZcResult,
+                                      team_context: Optional[str] = None,
+                                      recent_history: Optional[List[ZcResult]] = None) -> Recommendation:
+        """
+        Generate personalized recommendation using Claude without blocking
+        
+        Args:
+            result: Current Zc analysis
+            team_context: Optional context about team (industry, size, etc.)
+            recent_history: Optional recent Zc history
+            
+        Returns:
+            Detailed Recommendation object (fallback on error or timeout)
+        """
+        key = recommendation_key(result, team_context, recent_history)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        prompt = self._build_prompt(result, team_context, recent_history)
+        
+        try:
+            return await asyncio.wait_for(
+                self.flights.do(key, lambda: self._call_claude(key, prompt, result)),
+                timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Claude API call timed out after {self.timeout_seconds}s")
+        except Exception as e:
+            logger.error(f"Error calling Claude API: {e}")
+        
+        return self._fallback_recommendation(result)
+    
+    async def _call_claude(self, key: str, prompt: str, result: ZcResult) -> Recommendation:
+        async with self._get_semaphore():
+            response = await self.client.messages.create(
+                model=self.MODEL,
+                max_tokens=self.MAX_TOKENS,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+        
+        content = response.content[0].text
+        recommendation = self._parse_recommendation(content, result)
+        
+        logger.info("Recommendation generated successfully")
+        self._cache_store(key, recommendation)
+        return recommendation
+    
+    async def close(self):
+        """Close the underlying HTTP connection pool"""
+        await self.client.close()
+
+
 def main():
     """Example usage"""
     # Check if API key is available
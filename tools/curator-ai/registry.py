@@ -0,0 +1,229 @@
+"""
+Curator AI - Monitor Registry
+Hosts many CuratorMonitor instances keyed by team ID
+
+A single process can serve hundreds of teams: monitors are created lazily on
+first use, idle teams are evicted (least recently used first) and spilled to
+disk, and the team map is split into shards with their own locks so requests
+for different teams don't contend on one lock.
+"""
+
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+import logging
+
+from monitor import CuratorMonitor
+from transitions import TransitionEstimator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEAM_ID = "default"
+
+TEAM_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+class _Shard:
+    """One partition of the team map"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.monitors: "OrderedDict[str, CuratorMonitor]" = OrderedDict()
+        # Teams being loaded or spilled; set when their I/O is done
+        self.pending: Dict[str, threading.Event] = {}
+
+
+class MonitorRegistry:
+    """
+    Registry of per-team CuratorMonitor instances
+
+    - ``get(team_id)`` returns the team's monitor, creating it on first use
+    - Each shard holds at most ``max_teams / shards`` monitors; the least
+      recently used one is evicted when a shard is full
+    - Evicted teams are exported to ``spill_dir`` (if set) and re-imported
+      the next time they are requested. Monitors whose history store is
+      persistent (SQLite) are not spilled: they reload from the store. With
+      neither, an evicted team's history is discarded (logged as a warning)
+    - A team is never loaded and spilled at the same time: while one of
+      them is in progress, other requests for the team wait for it
+    """
+
+    def __init__(self,
+                 factory: Optional[Callable[[str], CuratorMonitor]] = None,
+                 default_team_size: int = 10,
+                 max_teams: int = 1024,
+                 shards: int = 16,
+                 spill_dir: Optional[str] = None,
+                 transitions: Optional[TransitionEstimator] = None):
+        """
+        Initialize registry
+
+        Args:
+            factory: Builds a monitor for a team ID (default: in-memory monitor
+                     with ``default_team_size``)
+            default_team_size: Team size used by the default factory
+            max_teams: Maximum number of monitors kept in memory
+            shards: Number of independently locked partitions
+            spill_dir: Directory for history of evicted teams
+            transitions: Optional estimator fed with every team's results
+        """
+        if shards <= 0:
+            raise ValueError("shards must be greater than 0")
+
+        self.default_team_size = default_team_size
+        self.factory = factory or (lambda team_id: CuratorMonitor(team_size=default_team_size))
+        self.shard_capacity = max(1, max_teams // shards)
+        self.spill_dir = spill_dir
+        self.transitions = transitions
+        self._shards = [_Shard() for _ in range(shards)]
+
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+        logger.info(f"Monitor registry initialized ({shards} shards, max {max_teams} teams)")
+
+    @staticmethod
+    def validate_team_id(team_id: str) -> str:
+        """Reject team IDs that aren't safe as keys and file names"""
+        if not TEAM_ID_PATTERN.match(team_id or ""):
+            raise ValueError(f"Invalid team ID: {team_id!r}")
+        return team_id
+
+    def _shard(self, team_id: str) -> _Shard:
+        return self._shards[zlib.crc32(team_id.encode()) % len(self._shards)]
+
+    def _spill_path(self, team_id: str) -> str:
+        return os.path.join(self.spill_dir, f"{team_id}.json")
+
+    def get(self, team_id: str) -> CuratorMonitor:
+        """
+        Get (or lazily create) the monitor for a team
+
+        Args:
+            team_id: Team identifier
+
+        Returns:
+            CuratorMonitor for the team
+        """
+        self.validate_team_id(team_id)
+        shard = self._shard(team_id)
+
+        while True:
+            with shard.lock:
+                monitor = shard.monitors.get(team_id)
+                if monitor is not None:
+                    shard.monitors.move_to_end(team_id)
+                    return monitor
+                waiting = shard.pending.get(team_id)
+                if waiting is None:
+                    loading = shard.pending[team_id] = threading.Event()
+            if waiting is None:
+                break
+            # Another request is loading the team, or its spill is being written
+            waiting.wait()
+
+        # Load outside the lock: reading spilled history may be slow
+        monitor = None
+        try:
+            monitor = self._load(team_id)
+        finally:
+            with shard.lock:
+                del shard.pending[team_id]
+                evicted = []
+                if monitor is not None:
+                    shard.monitors[team_id] = monitor
+                    evicted = self._pop_lru(shard)
+            loading.set()
+        for old_id, old_monitor in evicted:
+            self._spill(shard, old_id, old_monitor)
+
+        return monitor
+
+    def peek(self, team_id: str) -> Optional[CuratorMonitor]:
+        """Return the team's monitor if it is loaded, without creating it"""
+        shard = self._shard(team_id)
+        with shard.lock:
+            return shard.monitors.get(team_id)
+
+    def _load(self, team_id: str) -> CuratorMonitor:
+        monitor = self.factory(team_id)
+        if (self.spill_dir and not monitor.history.persistent
+                and os.path.exists(self._spill_path(team_id))):
+            monitor.import_history(self._spill_path(team_id))
+        if self.transitions is not None:
+            if team_id not in self.transitions:
+                # First sight of the team in this process: count its stored history
+                self.transitions.replay(team_id, monitor.history)
+            monitor.add_listener(lambda result: self.transitions.observe(team_id, result))
+        return monitor
+
+    def _pop_lru(self, shard: _Shard) -> List:
+        """Remove monitors over capacity (call with the shard lock held)"""
+        evicted = []
+        while len(shard.monitors) > self.shard_capacity:
+            team_id, monitor = shard.monitors.popitem(last=False)
+            shard.pending[team_id] = threading.Event()
+            evicted.append((team_id, monitor))
+        return evicted
+
+    def _spill(self, shard: _Shard, team_id: str, monitor: CuratorMonitor):
+        """Export an evicted team's history, then let waiting requests load it"""
+        try:
+            if monitor.history.persistent:
+                logger.info(f"Evicted idle team {team_id}")
+            elif self.spill_dir:
+                # Write aside and rename, so a spill file is never seen half-written
+                path = self._spill_path(team_id)
+                monitor.export_history(path + ".tmp")
+                os.replace(path + ".tmp", path)
+                logger.info(f"Evicted idle team {team_id}")
+            else:
+                logger.warning(f"Evicted idle team {team_id}; its {len(monitor.history)} "
+                               f"results are discarded (no spill_dir or persistent history)")
+            monitor.history.close()
+        finally:
+            with shard.lock:
+                done = shard.pending.pop(team_id)
+            done.set()
+
+    def evict(self, team_id: str) -> bool:
+        """Evict a team now; returns False if it wasn't loaded"""
+        shard = self._shard(team_id)
+        with shard.lock:
+            monitor = shard.monitors.pop(team_id, None)
+            if monitor is not None:
+                shard.pending[team_id] = threading.Event()
+        if monitor is None:
+            return False
+        self._spill(shard, team_id, monitor)
+        return True
+
+    def teams(self) -> List[str]:
+        """IDs of teams currently loaded in memory"""
+        ids = []
+        for shard in self._shards:
+            with shard.lock:
+                ids.extend(shard.monitors.keys())
+        return ids
+
+    def snapshot(self) -> Dict[str, CuratorMonitor]:
+        """Loaded monitors keyed by team ID"""
+        monitors = {}
+        for shard in self._shards:
+            with shard.lock:
+                monitors.update(shard.monitors)
+        return monitors
+
+    def close(self):
+        """Evict every loaded team (spilling history if configured)"""
+        for team_id in self.teams():
+            self.evict(team_id)
+
+    def __len__(self) -> int:
+        return sum(len(shard.monitors) for shard in self._shards)
+
+    def __contains__(self, team_id: str) -> bool:
+        return self.peek(team_id) is not None
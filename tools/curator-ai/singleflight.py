@@ -0,0 +1,137 @@
+"""
+Curator AI - Request Coalescing
+Single-flight execution for duplicate concurrent calls
+
+When several callers ask for the same key at the same time, only the first
+one (the leader) runs the call; the others wait for it and receive the same
+result or exception. Once the call finishes the key is forgotten, so later
+callers start a new call (use RecommendationCache to reuse results over
+time).
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """A call in flight"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group
+
+    - ``do(key, fn)`` runs ``fn()`` unless a call for ``key`` is already in
+      flight, in which case it blocks until that call finishes
+    - ``calls`` counts calls actually executed, ``coalesced`` counts callers
+      that shared another caller's call
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once per concurrent group of callers with the same key
+
+        Args:
+            key: Identifies duplicate requests
+            fn: Zero-argument callable doing the work
+
+        Returns:
+            fn's result (shared by all coalesced callers)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict:
+        """Executed/coalesced counters"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for coroutines
+
+    The shared call runs as its own task and every caller awaits it through
+    ``asyncio.shield``, so a caller that is cancelled (e.g. by its own
+    timeout) doesn't cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, "asyncio.Task"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn() once per concurrent group of callers with the same key
+
+        Args:
+            key: Identifies duplicate requests
+            fn: Zero-argument callable returning an awaitable
+
+        Returns:
+            The awaitable's result (shared by all coalesced callers)
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t, key=key: self._finish(key, t))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task"):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Mark the exception as retrieved when every caller gave up waiting
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        """Executed/coalesced counters"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._tasks),
+        }
@@ -0,0 +1,230 @@
+"""
+Curator AI - Persistent Storage
+SQLite-backed history engine for CuratorMonitor
+
+Stores ZcResult history in SQLite so monitors survive restarts. Writes are
+buffered and flushed in batches by a background thread; windowed reads are
+indexed range scans on (team, ts).
+"""
+
+import atexit
+import sqlite3
+import threading
+from typing import Iterator, List, Optional
+import logging
+
+from history import HistoryStore, to_epoch
+from monitor import ZcResult
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS zc_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    team TEXT NOT NULL,
+    ts REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    zc REAL NOT NULL,
+    v_generation REAL NOT NULL,
+    b_social REAL NOT NULL,
+    zone TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    trend TEXT NOT NULL,
+    recommendation TEXT NOT NULL,
+    committed_zone TEXT,
+    committed_mode TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_zc_history_team_ts ON zc_history (team, ts);
+"""
+
+COLUMNS = ("timestamp, zc, v_generation, b_social, zone, mode, "
+           "confidence, trend, recommendation, committed_zone, committed_mode")
+
+# Columns added after the first release, created on open in older databases
+MIGRATIONS = {
+    "committed_zone": "ALTER TABLE zc_history ADD COLUMN committed_zone TEXT",
+    "committed_mode": "ALTER TABLE zc_history ADD COLUMN committed_mode TEXT",
+}
+
+# Statement text is constant so sqlite3's statement cache reuses the
+# compiled (prepared) statements across calls.
+INSERT_SQL = f"INSERT INTO zc_history (team, ts, {COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+SINCE_SQL = f"SELECT {COLUMNS} FROM zc_history WHERE team = ? AND ts >= ? ORDER BY ts, id"
+ALL_SQL = f"SELECT {COLUMNS} FROM zc_history WHERE team = ? ORDER BY ts, id"
+ASC_SQL = f"SELECT {COLUMNS} FROM zc_history WHERE team = ? ORDER BY ts, id LIMIT ? OFFSET ?"
+DESC_SQL = f"SELECT {COLUMNS} FROM zc_history WHERE team = ? ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?"
+COUNT_SQL = "SELECT COUNT(*) FROM zc_history WHERE team = ?"
+PRUNE_SQL = "DELETE FROM zc_history WHERE team = ? AND ts < ?"
+CLEAR_SQL = "DELETE FROM zc_history WHERE team = ?"
+
+
+class SQLiteHistory(HistoryStore):
+    """
+    SQLite history backend
+
+    - WAL journal so dashboard reads never block the writer
+    - Appends go to an in-memory batch that a background thread flushes
+      every ``flush_interval`` seconds (or as soon as ``batch_size`` is hit)
+    - Reads flush pending writes first, then run indexed range scans
+    - Several teams can share one database file (rows are keyed by team)
+    """
+
+    def __init__(self, path: str = "curator_history.db", team: str = "default",
+                 batch_size: int = 100, flush_interval: float = 1.0,
+                 retention_hours: Optional[float] = None):
+        """
+        Initialize SQLite history
+
+        Args:
+            path: Database file (":memory:" for a throwaway store)
+            team: Team key for rows written by this store
+            batch_size: Pending results that trigger an early flush
+            flush_interval: Seconds between background flushes
+            retention_hours: Optional age limit, applied on flush
+        """
+        self.path = path
+        self.team = team
+        self.persistent = path != ":memory:"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_hours = retention_hours
+
+        self._lock = threading.RLock()
+        self._pending: List[tuple] = []
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+
+        self._count = self._conn.execute(COUNT_SQL, (team,)).fetchone()[0]
+        rows = self._conn.execute(DESC_SQL, (team, 1, 0)).fetchall()
+        self._latest: Optional[ZcResult] = ZcResult(*rows[0]) if rows else None
+
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop,
+                                         name="sqlite-history-flush", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+        logger.info(f"SQLite history opened at {path} (team={team}, {self._count} records)")
+
+    def _migrate(self):
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(zc_history)")}
+        with self._conn:
+            for column, sql in MIGRATIONS.items():
+                if column not in existing:
+                    self._conn.execute(sql)
+                    logger.info(f"Added column {column} to zc_history")
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                logger.error(f"Error flushing history: {e}")
+
+    def flush(self):
+        """
+        Write all pending results in a single transaction
+
+        If the write fails, the results stay pending for the next flush.
+        """
+        with self._lock:
+            if not self._pending or self._conn is None:
+                return
+            batch = self._pending
+            pruned = 0
+            with self._conn:
+                self._conn.executemany(INSERT_SQL, batch)
+                if self.retention_hours is not None:
+                    cutoff = max(row[1] for row in batch) - self.retention_hours * 3600
+                    pruned = self._conn.execute(PRUNE_SQL, (self.team, cutoff)).rowcount
+            self._pending = []
+            self._count -= pruned
+
+    def append(self, result: ZcResult):
+        """Queue a result for the next batched write"""
+        row = (self.team, to_epoch(result.timestamp), result.timestamp, result.zc,
+               result.v_generation, result.b_social, result.zone, result.mode,
+               result.confidence, result.trend, result.recommendation,
+               result.committed_zone, result.committed_mode)
+        with self._lock:
+            self._pending.append(row)
+            self._count += 1
+            if self._latest is None or row[1] >= to_epoch(self._latest.timestamp):
+                self._latest = result
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.set()
+
+    def since(self, cutoff: float) -> List[ZcResult]:
+        """Return results with timestamp >= cutoff via an indexed range scan"""
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(SINCE_SQL, (self.team, cutoff)).fetchall()
+        return [ZcResult(*row) for row in rows]
+
+    def latest(self) -> Optional[ZcResult]:
+        """Return the most recent result without touching the database"""
+        return self._latest
+
+    def _fetch(self, sql: str, limit: int, offset: int) -> List[ZcResult]:
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(sql, (self.team, limit, offset)).fetchall()
+        return [ZcResult(*row) for row in rows]
+
+    def clear(self):
+        """Remove all results for this team"""
+        with self._lock:
+            self._pending = []
+            with self._conn:
+                self._conn.execute(CLEAR_SQL, (self.team,))
+            self._count = 0
+            self._latest = None
+
+    def close(self):
+        """Flush pending writes and close the connection"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._flusher.join(timeout=5)
+        with self._lock:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.close)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[ZcResult]:
+        # One ordered scan instead of the base class's query per index
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(ALL_SQL, (self.team,)).fetchall()
+        return (ZcResult(*row) for row in rows)
+
+    def __getitem__(self, index):
+        size = self._count
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if start >= stop:
+                return []
+            window = self._fetch(ASC_SQL, stop - start, start)
+            return window[::step]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("history index out of range")
+        if index == size - 1 and self._latest is not None:
+            return self._latest
+        if index >= size // 2:
+            return self._fetch(DESC_SQL, 1, size - 1 - index)[0]
+        return self._fetch(ASC_SQL, 1, index)[0]
@@ -0,0 +1,207 @@
+"""
+Curator AI - Mode Transition Estimation
+Markov transition matrices and stationary distributions from real data
+(MATHEMATICAL-APPENDIX.md §2.3)
+
+Every ZcResult is one time step. The mode of consecutive results of a team
+gives one transition i → j (self-transitions included), counted per team
+and fleet-wide. Matrices are smoothed counts:
+
+    fleet:  P[i][j] = (n[i][j] + α) / (n[i] + 3α)               (Laplace)
+    team:   P[i][j] = (n[i][j] + κ·F[i][j]) / (n[i] + κ)         (shrunk to fleet F)
+
+so a team with few samples looks like the fleet until its own data takes
+over. Stationary distributions solve πP = π, Σπ = 1 and are cached until
+the counts change.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Order of rows/columns: [A/B, Transition, C]
+MODES = ("STUDY_HALL", "GUSH", "JAM")
+_INDEX = {mode: i for i, mode in enumerate(MODES)}
+
+# Hard-coded reference of MATHEMATICAL-APPENDIX.md §2.3
+APPENDIX_MATRIX = (
+    (0.85, 0.12, 0.03),
+    (0.15, 0.70, 0.15),
+    (0.05, 0.25, 0.70),
+)
+
+
+def stationary_distribution(matrix: Sequence[Sequence[float]],
+                            iterations: int = 1000, tol: float = 1e-12) -> List[float]:
+    """
+    Stationary distribution of a row-stochastic matrix
+
+    Solves π(P - I) = 0 with Σπ = 1 by Gaussian elimination, falling back to
+    power iteration when the system is singular (reducible chains).
+
+    Args:
+        matrix: Row-stochastic transition matrix
+        iterations: Power iteration limit for the fallback
+        tol: Convergence tolerance of the fallback
+
+    Returns:
+        π as a list summing to 1
+    """
+    n = len(matrix)
+    # Rows of (P - I)^T, with the last equation replaced by Σπ = 1
+    a = [[matrix[j][i] - (1.0 if i == j else 0.0) for j in range(n)] + [0.0] for i in range(n)]
+    a[-1] = [1.0] * n + [1.0]
+
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            break
+        a[col], a[pivot] = a[pivot], a[col]
+        for r in range(n):
+            if r != col and a[r][col]:
+                factor = a[r][col] / a[col][col]
+                a[r] = [x - factor * y for x, y in zip(a[r], a[col])]
+    else:
+        pi = [max(0.0, a[i][n] / a[i][i]) for i in range(n)]
+        total = sum(pi)
+        return [p / total for p in pi]
+
+    pi = [1.0 / n] * n
+    for _ in range(iterations):
+        nxt = [sum(pi[i] * matrix[i][j] for i in range(n)) for j in range(n)]
+        if max(abs(x - y) for x, y in zip(nxt, pi)) < tol:
+            return nxt
+        pi = nxt
+    return pi
+
+
+@dataclass
+class TransitionSummary:
+    """Counts, smoothed matrix and stationary distribution of one chain"""
+    modes: List[str]
+    counts: List[List[int]]
+    matrix: List[List[float]]
+    stationary: List[float]
+    transitions: int
+
+
+class TransitionCounts:
+    """
+    Transition counts of one chain with a cached stationary distribution
+    """
+
+    def __init__(self):
+        self.counts = [[0] * len(MODES) for _ in MODES]
+        self.last_mode: Optional[str] = None
+        self.transitions = 0
+        self.version = 0
+        self._cache_key = None
+        self._cache: Optional[tuple] = None
+
+    def add(self, from_mode: str, to_mode: str):
+        self.counts[_INDEX[from_mode]][_INDEX[to_mode]] += 1
+        self.transitions += 1
+        self.version += 1
+
+    def solve(self, prior: Sequence[Sequence[float]], weight: float, key) -> tuple:
+        """
+        (matrix, stationary) with ``weight`` pseudo-counts per row spread
+        like ``prior``; cached while ``key`` is unchanged
+        """
+        if self._cache_key == key:
+            return self._cache
+        matrix = []
+        for i, row in enumerate(self.counts):
+            total = sum(row) + weight
+            matrix.append([(row[j] + weight * prior[i][j]) / total for j in range(len(MODES))])
+        self._cache = (matrix, stationary_distribution(matrix))
+        self._cache_key = key
+        return self._cache
+
+
+class TransitionEstimator:
+    """
+    Per-team and fleet-wide mode transition estimates
+    """
+
+    def __init__(self, laplace: float = 1.0, team_weight: float = 5.0,
+                 mode_field: str = "mode"):
+        """
+        Initialize estimator
+
+        Args:
+            laplace: Pseudo-count α per cell of the fleet matrix
+            team_weight: Pseudo-observations κ per row pulling teams toward the fleet
+            mode_field: ZcResult field to count ("mode" or "committed_mode")
+        """
+        self.laplace = laplace
+        self.team_weight = team_weight
+        self.mode_field = mode_field
+        self.fleet = TransitionCounts()
+        self._teams: Dict[str, TransitionCounts] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, team_id: str, result) -> bool:
+        """
+        Count the transition from the team's previous result to this one
+
+        Args:
+            team_id: Team identifier
+            result: ZcResult (or anything with the mode field)
+
+        Returns:
+            True if a transition was counted
+        """
+        mode = getattr(result, self.mode_field, None)
+        if mode not in _INDEX:
+            return False
+        with self._lock:
+            team = self._teams.get(team_id)
+            if team is None:
+                team = self._teams[team_id] = TransitionCounts()
+            previous, team.last_mode = team.last_mode, mode
+            if previous is None:
+                return False
+            team.add(previous, mode)
+            self.fleet.add(previous, mode)
+        return True
+
+    def replay(self, team_id: str, results: Iterable) -> int:
+        """Count transitions of stored results (e.g. history loaded at startup)"""
+        return sum(self.observe(team_id, r) for r in results)
+
+    def _fleet_solution(self) -> tuple:
+        uniform = [[1.0 / len(MODES)] * len(MODES) for _ in MODES]
+        return self.fleet.solve(uniform, self.laplace * len(MODES), self.fleet.version)
+
+    def fleet_summary(self) -> TransitionSummary:
+        """Fleet-wide matrix and stationary distribution"""
+        with self._lock:
+            matrix, stationary = self._fleet_solution()
+            return TransitionSummary(modes=list(MODES), counts=[list(r) for r in self.fleet.counts],
+                                     matrix=matrix, stationary=stationary,
+                                     transitions=self.fleet.transitions)
+
+    def team_summary(self, team_id: str) -> Optional[TransitionSummary]:
+        """Team matrix (shrunk toward the fleet) and stationary distribution"""
+        with self._lock:
+            team = self._teams.get(team_id)
+            if team is None:
+                return None
+            fleet_matrix, _ = self._fleet_solution()
+            matrix, stationary = team.solve(fleet_matrix, self.team_weight,
+                                            (team.version, self.fleet.version))
+            return TransitionSummary(modes=list(MODES), counts=[list(r) for r in team.counts],
+                                     matrix=matrix, stationary=stationary,
+                                     transitions=team.transitions)
+
+    def teams(self) -> List[str]:
+        """Teams with at least one observed result"""
+        with self._lock:
+            return list(self._teams)
+
+    def __contains__(self, team_id: str) -> bool:
+        return team_id in self._teams
@@ -0,0 +1,195 @@
+"""
+Curator AI - Trend Estimation
+Windowed online linear regression of Zc over time
+
+The trend of a team is the least-squares slope of Zc over the last τ hours
+(TREND_WINDOW) rather than a comparison of the last three samples, so one
+noisy sample at minute-level cadence can't flip the label. The window keeps
+at least ``min_samples`` samples, so sparse series (one sample per day) still
+get a trend.
+
+Each update adds the sample to running sums (n, Σx, Σz, Σx², Σxz, Σz²) and
+subtracts samples that left the window, so it's amortized O(1). The label is
+
+    INCREASING / DECREASING  |t| ≥ t_threshold and |change| ≥ sensitivity
+    STABLE                   otherwise
+
+where t is the slope's t-statistic and change the fitted Zc change across
+the window. Samples that arrive (almost) at the same instant, e.g. replays
+and rapid manual calculations, are regressed on their sample index instead.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from math import sqrt
+from typing import Optional
+
+
+@dataclass
+class TrendEstimate:
+    """Trend of the samples currently in the window"""
+    slope: float           # Zc per hour (per sample if by_index)
+    change: float          # Fitted Zc change across the window
+    t_stat: float          # Slope / standard error (inf for a perfect fit)
+    samples: int
+    by_index: bool
+    label: str
+
+    @property
+    def significant(self) -> bool:
+        return self.label != "STABLE"
+
+
+class _Sums:
+    """Running regression sums over (x, z) pairs"""
+
+    __slots__ = ("n", "x", "z", "xx", "xz", "zz")
+
+    def __init__(self):
+        self.n = 0
+        self.x = self.z = self.xx = self.xz = self.zz = 0.0
+
+    def add(self, x: float, z: float, sign: int = 1):
+        self.n += sign
+        self.x += sign * x
+        self.z += sign * z
+        self.xx += sign * x * x
+        self.xz += sign * x * z
+        self.zz += sign * z * z
+
+    def fit(self):
+        """(slope, t statistic) of the least-squares line"""
+        n = self.n
+        sxx = self.xx - self.x * self.x / n
+        if sxx <= 1e-12:
+            return 0.0, 0.0
+        sxz = self.xz - self.x * self.z / n
+        szz = self.zz - self.z * self.z / n
+        slope = sxz / sxx
+        sse = max(0.0, szz - slope * sxz)
+        if n <= 2 or sse <= 1e-12 * max(szz, 1e-12):
+            t_stat = 0.0 if abs(slope) < 1e-12 else float("inf")
+        else:
+            t_stat = slope / sqrt(sse / (n - 2) / sxx)
+        return slope, t_stat
+
+
+class TrendEstimator:
+    """
+    Incremental least-squares trend over a sliding time window
+    """
+
+    def __init__(self,
+                 window_hours: float = 24,
+                 min_samples: int = 3,
+                 sensitivity: float = 0.05,
+                 t_threshold: float = 2.0,
+                 min_span_seconds: float = 60):
+        """
+        Initialize estimator
+
+        Args:
+            window_hours: Regression window τ
+            min_samples: Samples needed for a trend (also kept beyond τ)
+            sensitivity: Smallest fitted Zc change across the window that counts
+            t_threshold: Smallest |t| of the slope that counts
+            min_span_seconds: Below this time span, regress on sample index
+        """
+        self.window = window_hours * 3600
+        self.min_samples = max(2, min_samples)
+        self.sensitivity = sensitivity
+        self.t_threshold = t_threshold
+        self.min_span = min_span_seconds
+
+        # (x_time, x_index, z) relative to the origin of the sums
+        self._samples = deque()
+        self._time = _Sums()
+        self._index = _Sums()
+        self._origin = (0.0, 0)
+        self._next_index = 0
+        self._evicted = 0
+        self._last_ts: Optional[float] = None
+        self.estimate = self._estimate()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def update(self, timestamp: float, zc: float) -> TrendEstimate:
+        """
+        Add a sample and re-fit
+
+        Args:
+            timestamp: Sample time (epoch seconds; late samples count as "now")
+            zc: Sample Zc
+
+        Returns:
+            TrendEstimate for the window ending at this sample
+        """
+        if self._last_ts is None:
+            self._origin = (timestamp, 0)
+        elif timestamp < self._last_ts:
+            timestamp = self._last_ts
+        self._last_ts = timestamp
+
+        sample = ((timestamp - self._origin[0]) / 3600, self._next_index - self._origin[1], zc)
+        self._next_index += 1
+        self._samples.append(sample)
+        self._time.add(sample[0], zc)
+        self._index.add(sample[1], zc)
+        self._trim(timestamp)
+
+        self.estimate = self._estimate()
+        return self.estimate
+
+    def _trim(self, now: float):
+        cutoff = (now - self.window - self._origin[0]) / 3600
+        samples = self._samples
+        while len(samples) > self.min_samples and samples[0][0] < cutoff:
+            x, i, z = samples.popleft()
+            self._time.add(x, z, -1)
+            self._index.add(i, z, -1)
+            self._evicted += 1
+
+        # Recompute the sums once the window has turned over, so subtraction
+        # error can't accumulate and x stays small
+        if self._evicted >= max(len(samples), 64):
+            self._rebase()
+
+    def _rebase(self):
+        x0, i0, _ = self._samples[0]
+        self._origin = (self._origin[0] + x0 * 3600, self._origin[1] + i0)
+        self._samples = deque((x - x0, i - i0, z) for x, i, z in self._samples)
+        self._time, self._index = _Sums(), _Sums()
+        for x, i, z in self._samples:
+            self._time.add(x, z)
+            self._index.add(i, z)
+        self._evicted = 0
+
+    def _estimate(self) -> TrendEstimate:
+        n = len(self._samples)
+        if n < 2:
+            return TrendEstimate(0.0, 0.0, 0.0, n, False, "STABLE")
+
+        span = (self._samples[-1][0] - self._samples[0][0]) * 3600
+        by_index = span < self.min_span
+        sums = self._index if by_index else self._time
+        slope, t_stat = sums.fit()
+        axis = 1 if by_index else 0
+        change = slope * (self._samples[-1][axis] - self._samples[0][axis])
+
+        label = "STABLE"
+        if n >= self.min_samples and abs(t_stat) >= self.t_threshold \
+                and abs(change) >= self.sensitivity:
+            label = "INCREASING" if slope > 0 else "DECREASING"
+        return TrendEstimate(slope=slope, change=change, t_stat=t_stat,
+                             samples=n, by_index=by_index, label=label)
+
+    def reset(self):
+        """Forget all samples"""
+        self._samples.clear()
+        self._time, self._index = _Sums(), _Sums()
+        self._origin = (0.0, 0)
+        self._next_index = 0
+        self._evicted = 0
+        self._last_ts = None
+        self.estimate = self._estimate()
@@ -5,19 +5,28 @@ FastAPI server for Curator AI dashboard
 Endpoints:
 - GET /api/zc/current - Current Zc status
 - GET /api/zc/history - Historical Zc data
+- GET /api/zc/forecast - Projected Zc and zone crossings (next 1-72h)
 - POST /api/zc/calculate - Calculate Zc from metrics
 - GET /api/recommendations - Get AI recommendations
+- POST /api/events - Ingest activity events (NDJSON)
+- GET /api/transitions - Fleet and per-team mode transition statistics
 - GET /api/health - Health check
+
+Every /api/zc/*, /api/recommendations and /api/stats/* route also exists
+team-scoped under /api/teams/{team_id}/...; the unscoped routes serve the
+"default" team.
 """
 
 import os
 import json
+import asyncio
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 try:
-    from fastapi import FastAPI, HTTPException, Query
+    from fastapi import FastAPI, HTTPException, Query, Request
     from fastapi.middleware.cors import CORSMiddleware
     import uvicorn
     FASTAPI_AVAILABLE = True
@@ -29,8 +38,13 @@ except ImportError:
 import sys
 sys.path.insert(0, os.path.dirname(__file__) + '/../../curator-ai')
 
+from cache import RecommendationCache
+from ingest import EventAggregator, IngestResult
 from monitor import CuratorMonitor, MetricsCollector, TeamMetrics, ZcResult
-from recommender import CuratorRecommender, Recommendation
+from recommender import AsyncCuratorRecommender, CuratorRecommender, Recommendation
+from registry import DEFAULT_TEAM_ID, MonitorRegistry
+from storage import SQLiteHistory
+from transitions import APPENDIX_MATRIX, TransitionEstimator, stationary_distribution
 
 
 # Pydantic models for API
@@ -43,6 +57,7 @@ class MetricsInput(BaseModel):
     ai_outputs: int = 0
     emails: int = 0
     timeframe_hours: int = 24
+    team_size: Optional[int] = None
 
 
 class ZcResponse(BaseModel):
@@ -55,6 +70,52 @@ class ZcResponse(BaseModel):
     confidence: float
     trend: str
     recommendation: str
+    committed_zone: Optional[str] = None
+    committed_mode: Optional[str] = None
+
+
+class ForecastPointResponse(BaseModel):
+    timestamp: str
+    zc: float
+    zone: str
+
+
+class ZoneCrossingResponse(BaseModel):
+    timestamp: str
+    zc: float
+    from_zone: str
+    to_zone: str
+
+
+class ForecastResponse(BaseModel):
+    generated_at: str
+    horizon_hours: int
+    current_zone: str
+    points: List[ForecastPointResponse]
+    crossings: List[ZoneCrossingResponse]
+    level: float
+    trend: float
+    error: float
+    observations: int
+
+
+class TransitionResponse(BaseModel):
+    modes: List[str]
+    counts: List[List[int]]
+    matrix: List[List[float]]
+    stationary: List[float]
+    transitions: int
+
+
+class TeamStationaryResponse(BaseModel):
+    stationary: List[float]
+    transitions: int
+
+
+class FleetTransitionsResponse(BaseModel):
+    fleet: TransitionResponse
+    teams: Dict[str, TeamStationaryResponse]
+    reference_stationary: List[float]
 
 
 class HistoryResponse(BaseModel):
@@ -71,12 +132,22 @@ class RecommendationResponse(BaseModel):
     context: str
 
 
+class IngestResponse(BaseModel):
+    accepted: int
+    rejected: int
+    errors: List[str]
+
+
 class HealthResponse(BaseModel):
     status: str
     version: str
     team_size: int
     monitor_active: bool
     recommender_active: bool
+    teams_loaded: int = 0
+    recommendation_cache: Optional[dict] = None
+    recommendation_calls: Optional[dict] = None
+    events_ingested: int = 0
 
 
 # Initialize FastAPI app
@@ -97,26 +168,100 @@ if FASTAPI_AVAILABLE:
     )
     
     # Global instances (initialized on startup)
-    monitor: Optional[CuratorMonitor] = None
-    recommender: Optional[CuratorRecommender] = None
+    registry: Optional[MonitorRegistry] = None
+    recommender: Optional[AsyncCuratorRecommender] = None
+    events: Optional[EventAggregator] = None
+    transitions: Optional[TransitionEstimator] = None
+    feed_task: Optional[asyncio.Task] = None
+    
+    
+    def _get_monitor(team_id: str) -> CuratorMonitor:
+        """Resolve a team's monitor, mapping registry errors to HTTP errors"""
+        if registry is None:
+            raise HTTPException(status_code=500, detail="Monitor not initialized")
+        try:
+            return registry.get(team_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    
+    async def _feed_events(interval: float, hours: float):
+        """Periodically turn ingested events into Zc results"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                events.feed(registry, hours=hours)
+            except Exception as e:
+                print(f"⚠ Event feed failed: {e}")
     
     
     @app.on_event("startup")
     async def startup_event():
         """Initialize curator components"""
-        global monitor, recommender
+        global registry, recommender, events, transitions, feed_task
         
         team_size = int(os.environ.get("TEAM_SIZE", "10"))
-        monitor = CuratorMonitor(team_size=team_size)
+        
+        # Persist history in SQLite when a database path is configured
+        db_path = os.environ.get("CURATOR_HISTORY_DB")
+        factory = None
+        if db_path:
+            factory = lambda team_id: CuratorMonitor(
+                team_size=team_size,
+                history_store=SQLiteHistory(db_path, team=team_id)
+            )
+            print(f"✓ History stored in {db_path}")
+        
+        # Mode transitions counted from every team's results
+        transitions = TransitionEstimator()
+        registry = MonitorRegistry(
+            factory=factory,
+            default_team_size=team_size,
+            max_teams=int(os.environ.get("MAX_TEAMS", "1024")),
+            spill_dir=os.environ.get("CURATOR_SPILL_DIR"),
+            transitions=transitions
+        )
         
         try:
-            recommender = CuratorRecommender()
+            cache = RecommendationCache(
+                ttl_seconds=float(os.environ.get("RECOMMENDATION_CACHE_TTL", "900")),
+                disk_dir=os.environ.get("RECOMMENDATION_CACHE_DIR")
+            )
+            recommender = AsyncCuratorRecommender(
+                base_url=os.environ.get("ANTHROPIC_BASE_URL"),
+                cache=cache,
+                max_concurrency=int(os.environ.get("RECOMMENDER_CONCURRENCY", "4")),
+                timeout_seconds=float(os.environ.get("RECOMMENDER_TIMEOUT", "30"))
+            )
             print("✓ Recommender initialized with Claude API")
         except (ImportError, ValueError) as e:
             print(f"⚠ Recommender not available: {e}")
             recommender = None
         
-        print(f"✓ Dashboard API started (team size: {team_size})")
+        # Pushed events are aggregated in memory and fed to monitors on a schedule
+        events_window = float(os.environ.get("EVENTS_WINDOW_HOURS", "24"))
+        allowed_teams = os.environ.get("EVENTS_ALLOWED_TEAMS")
+        events = EventAggregator(
+            retention_hours=max(events_window, 1),
+            max_teams=int(os.environ.get("EVENTS_MAX_TEAMS", "1024")),
+            allowed_teams=allowed_teams.split(",") if allowed_teams else None
+        )
+        feed_task = asyncio.ensure_future(_feed_events(
+            float(os.environ.get("EVENTS_FLUSH_INTERVAL", "300")), events_window
+        ))
+        
+        print(f"✓ Dashboard API started (default team size: {team_size})")
+    
+    
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Flush and close history storage and API clients"""
+        if feed_task:
+            feed_task.cancel()
+        if registry is not None:
+            registry.close()
+        if recommender:
+            await recommender.close()
     
     
     @app.get("/")
@@ -132,34 +277,41 @@ if FASTAPI_AVAILABLE:
     @app.get("/api/health", response_model=HealthResponse)
     async def health_check():
         """Health check endpoint"""
+        default = registry.peek(DEFAULT_TEAM_ID) if registry is not None else None
         return HealthResponse(
             status="healthy",
             version="3.0.0",
-            team_size=monitor.team_size if monitor else 0,
-            monitor_active=monitor is not None,
-            recommender_active=recommender is not None
+            team_size=default.team_size if default else (registry.default_team_size if registry is not None else 0),
+            monitor_active=registry is not None,
+            recommender_active=recommender is not None,
+            teams_loaded=len(registry) if registry is not None else 0,
+            recommendation_cache=recommender.stats()["cache"] if recommender else None,
+            recommendation_calls=recommender.stats()["calls"] if recommender else None,
+            events_ingested=events.events_total if events else 0
         )
     
     
-    @app.get("/api/zc/current", response_model=Optional[ZcResponse])
-    async def get_current_zc():
-        """Get current Zc status"""
-        if not monitor or len(monitor.history) == 0:
+    # Team-scoped endpoints. The unscoped /api/* routes below serve the
+    # "default" team so single-team deployments keep working unchanged.
+    
+    @app.get("/api/teams/{team_id}/zc/current", response_model=Optional[ZcResponse])
+    async def get_team_current_zc(team_id: str):
+        """Get current Zc status for a team"""
+        monitor = _get_monitor(team_id)
+        current = monitor.history.latest()
+        if current is None:
             return None
         
-        current = monitor.history[-1]
         return ZcResponse(**current.__dict__)
     
     
-    @app.get("/api/zc/history", response_model=HistoryResponse)
-    async def get_zc_history(
+    @app.get("/api/teams/{team_id}/zc/history", response_model=HistoryResponse)
+    async def get_team_zc_history(
+        team_id: str,
         hours: int = Query(168, description="Hours of history to retrieve (default: 7 days)")
     ):
-        """Get historical Zc data"""
-        if not monitor:
-            raise HTTPException(status_code=500, detail="Monitor not initialized")
-        
-        history = monitor.get_history(hours=hours)
+        """Get historical Zc data for a team"""
+        history = _get_monitor(team_id).get_history(hours=hours)
         
         return HistoryResponse(
             data=[ZcResponse(**r.__dict__) for r in history],
@@ -167,11 +319,23 @@ if FASTAPI_AVAILABLE:
         )
     
     
-    @app.post("/api/zc/calculate", response_model=ZcResponse)
-    async def calculate_zc(metrics: MetricsInput):
-        """Calculate Zc from provided metrics"""
-        if not monitor:
-            raise HTTPException(status_code=500, detail="Monitor not initialized")
+    @app.get("/api/teams/{team_id}/zc/forecast", response_model=ForecastResponse)
+    async def get_team_zc_forecast(
+        team_id: str,
+        hours: int = Query(24, ge=1, le=72, description="Forecast horizon in hours")
+    ):
+        """Get projected Zc and predicted zone crossings for a team"""
+        forecast = _get_monitor(team_id).forecast(hours=hours)
+        if forecast is None:
+            raise HTTPException(status_code=404, detail="No Zc data available")
+        
+        return ForecastResponse(**asdict(forecast))
+    
+    
+    @app.post("/api/teams/{team_id}/zc/calculate", response_model=ZcResponse)
+    async def calculate_team_zc(team_id: str, metrics: MetricsInput):
+        """Calculate Zc for a team from provided metrics"""
+        monitor = _get_monitor(team_id)
         
         # Create TeamMetrics from input
         team_metrics = TeamMetrics(
@@ -186,25 +350,31 @@ if FASTAPI_AVAILABLE:
         )
         
         # Calculate Zc
-        result = monitor.calculate_zc(team_metrics, timeframe_hours=metrics.timeframe_hours)
+        try:
+            result = monitor.calculate_zc(team_metrics, timeframe_hours=metrics.timeframe_hours,
+                                          team_size=metrics.team_size)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         return ZcResponse(**result.__dict__)
     
     
-    @app.get("/api/recommendations", response_model=RecommendationResponse)
-    async def get_recommendations(
+    @app.get("/api/teams/{team_id}/recommendations", response_model=RecommendationResponse)
+    async def get_team_recommendations(
+        team_id: str,
         team_context: Optional[str] = Query(None, description="Team context for personalized advice")
     ):
-        """Get AI-powered recommendations"""
-        if not monitor or len(monitor.history) == 0:
+        """Get AI-powered recommendations for a team"""
+        monitor = _get_monitor(team_id)
+        current = monitor.history.latest()
+        if current is None:
             raise HTTPException(status_code=404, detail="No Zc data available")
         
-        current = monitor.history[-1]
         recent_history = monitor.get_history(hours=168)
         
         if recommender:
-            # Use Claude API
-            rec = recommender.generate_recommendation(
+            # Use Claude API (awaited so other requests keep being served)
+            rec = await recommender.generate_recommendation(
                 result=current,
                 team_context=team_context,
                 recent_history=recent_history
@@ -216,10 +386,12 @@ if FASTAPI_AVAILABLE:
         return RecommendationResponse(**rec.__dict__)
     
     
-    @app.get("/api/stats/summary")
-    async def get_summary_stats():
-        """Get summary statistics"""
-        if not monitor or len(monitor.history) == 0:
+    @app.get("/api/teams/{team_id}/stats/summary")
+    async def get_team_summary_stats(team_id: str):
+        """Get summary statistics for a team"""
+        monitor = _get_monitor(team_id)
+        current = monitor.history.latest()
+        if current is None:
             return {
                 "avg_zc": 0,
                 "current_zc": 0,
@@ -227,25 +399,122 @@ if FASTAPI_AVAILABLE:
                 "trend": "STABLE"
             }
         
-        history = monitor.get_history(hours=168)
-        
-        # Calculate stats
-        avg_zc = sum(r.zc for r in history) / len(history)
-        current = history[-1]
-        
-        # Zone distribution
-        zone_counts = {"GREEN": 0, "YELLOW": 0, "RED": 0}
-        for r in history:
-            zone_counts[r.zone] += 1
+        # Running totals maintained by the monitor (no history scan)
+        summary = monitor.get_summary(hours=168)
         
         return {
-            "avg_zc": round(avg_zc, 2),
+            "avg_zc": round(summary["avg_zc"], 2),
             "current_zc": current.zc,
             "current_zone": current.zone,
             "trend": current.trend,
-            "zone_distribution": zone_counts,
-            "data_points": len(history)
+            "zone_distribution": summary["zone_distribution"],
+            "data_points": summary["count"]
         }
+    
+    
+    @app.get("/api/teams/{team_id}/transitions", response_model=TransitionResponse)
+    async def get_team_transitions(team_id: str):
+        """Get a team's mode transition matrix and stationary distribution"""
+        if transitions is None:
+            raise HTTPException(status_code=500, detail="Monitor not initialized")
+        try:
+            MonitorRegistry.validate_team_id(team_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        summary = transitions.team_summary(team_id)
+        if summary is None:
+            raise HTTPException(status_code=404, detail="No Zc data available")
+        
+        return TransitionResponse(**summary.__dict__)
+    
+    
+    @app.get("/api/transitions", response_model=FleetTransitionsResponse)
+    async def get_fleet_transitions():
+        """Get the fleet-wide transition matrix and every team's stationary distribution"""
+        if transitions is None:
+            raise HTTPException(status_code=500, detail="Monitor not initialized")
+        
+        teams = {}
+        for team_id in sorted(transitions.teams()):
+            summary = transitions.team_summary(team_id)
+            teams[team_id] = TeamStationaryResponse(stationary=summary.stationary,
+                                                    transitions=summary.transitions)
+        
+        return FleetTransitionsResponse(
+            fleet=TransitionResponse(**transitions.fleet_summary().__dict__),
+            teams=teams,
+            reference_stationary=stationary_distribution(APPENDIX_MATRIX)
+        )
+    
+    
+    @app.post("/api/events", response_model=IngestResponse)
+    async def ingest_events(request: Request):
+        """
+        Ingest newline-delimited JSON activity events
+        
+        Each line is one event: {"source": "github", "team": "platform",
+        "ts": "2026-03-01T12:00:00Z", "count": 1} (team, ts and count are
+        optional). The body is counted as it streams in; invalid lines are
+        rejected individually. Counts reach the monitors on the next scheduled
+        feed (EVENTS_FLUSH_INTERVAL).
+        """
+        if not events:
+            raise HTTPException(status_code=500, detail="Event ingestion not initialized")
+        
+        result = IngestResult()
+        buffer = b""
+        line_no = 1
+        async for chunk in request.stream():
+            lines = (buffer + chunk).split(b"\n")
+            buffer = lines.pop()  # Incomplete last line waits for the next chunk
+            result.merge(events.ingest_lines(lines, first_line=line_no))
+            line_no += len(lines)
+        result.merge(events.ingest_lines([buffer], first_line=line_no))
+        
+        return IngestResponse(**result.__dict__)
+    
+    
+    @app.get("/api/zc/current", response_model=Optional[ZcResponse])
+    async def get_current_zc():
+        """Get current Zc status"""
+        return await get_team_current_zc(DEFAULT_TEAM_ID)
+    
+    
+    @app.get("/api/zc/history", response_model=HistoryResponse)
+    async def get_zc_history(
+        hours: int = Query(168, description="Hours of history to retrieve (default: 7 days)")
+    ):
+        """Get historical Zc data"""
+        return await get_team_zc_history(DEFAULT_TEAM_ID, hours=hours)
+    
+    
+    @app.get("/api/zc/forecast", response_model=ForecastResponse)
+    async def get_zc_forecast(
+        hours: int = Query(24, ge=1, le=72, description="Forecast horizon in hours")
+    ):
+        """Get projected Zc and predicted zone crossings"""
+        return await get_team_zc_forecast(DEFAULT_TEAM_ID, hours=hours)
+    
+    
+    @app.post("/api/zc/calculate", response_model=ZcResponse)
+    async def calculate_zc(metrics: MetricsInput):
+        """Calculate Zc from provided metrics"""
+        return await calculate_team_zc(DEFAULT_TEAM_ID, metrics)
+    
+    
+    @app.get("/api/recommendations", response_model=RecommendationResponse)
+    async def get_recommendations(
+        team_context: Optional[str] = Query(None, description="Team context for personalized advice")
+    ):
+        """Get AI-powered recommendations"""
+        return await get_team_recommendations(DEFAULT_TEAM_ID, team_context=team_context)
+    
+    
+    @app.get("/api/stats/summary")
+    async def get_summary_stats():
+        """Get summary statistics"""
+        return await get_team_summary_stats(DEFAULT_TEAM_ID)
 
 
 def main():
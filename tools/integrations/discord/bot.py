@@ -13,7 +13,7 @@ Also sends automated notifications when zones change.
 import os
 import asyncio
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 import logging
 
 try:
@@ -27,7 +27,10 @@ except ImportError:
 # Import curator modules
 import sys
 sys.path.insert(0, os.path.dirname(__file__) + '/../../curator-ai')
+sys.path.insert(0, os.path.dirname(__file__))
 
+from counter import DiscordMessageCounter
+from forks import ForkRegistry
 from monitor import CuratorMonitor, MetricsCollector, TeamMetrics, ZcResult
 from recommender import CuratorRecommender
 
@@ -40,17 +43,25 @@ class CuratorBot(commands.Bot):
     Discord Bot for CIM Pattern Curator AI
     
     Provides real-time Zc monitoring and team commands.
+    
+    Message counts come from live on_message events (see counter.py);
+    channel history is only read once per channel to backfill the window
+    and after reconnects to fill the gap.
     """
     
     def __init__(self, 
                  monitor: CuratorMonitor,
-                 recommender: Optional[CuratorRecommender] = None):
+                 recommender: Optional[CuratorRecommender] = None,
+                 channel_ids: Optional[List[int]] = None,
+                 forks: Optional[ForkRegistry] = None):
         """
         Initialize Discord bot
         
         Args:
             monitor: CuratorMonitor instance
             recommender: Optional CuratorRecommender for AI advice
+            channel_ids: Channels to backfill on startup (others on first use)
+            forks: Fork registry fed by !fork and channel messages (default: new one)
         """
         if not DISCORD_PY_AVAILABLE:
             raise ImportError("discord.py required. Install: pip install discord.py")
@@ -63,8 +74,11 @@ class CuratorBot(commands.Bot):
         
         self.curator_monitor = monitor
         self.curator_recommender = recommender
-        self.last_zone = None
+        self.last_zone = None  # Last committed zone (alerts fire on changes)
         self.monitoring_channel = None
+        self.channel_ids = list(channel_ids or [])
+        self.message_counter = DiscordMessageCounter()
+        self.curator_forks = forks if forks is not None else ForkRegistry()
         
         # Register commands
         self._register_commands()
@@ -91,17 +105,49 @@ class CuratorBot(commands.Bot):
             await self._handle_status(ctx)
     
     async def on_ready(self):
-        """Called when bot is ready"""
+        """Called when bot is ready (again after a full reconnect)"""
         logger.info(f'Bot logged in as {self.user}')
         
+        self.message_counter.mark_connected()
+        await self.message_counter.repair(self.get_channel)
+        
+        # Backfill configured channels once so the first !zc is instant
+        for channel_id in self.channel_ids + ([self.monitoring_channel] if self.monitoring_channel else []):
+            channel = self.get_channel(channel_id)
+            if channel:
+                try:
+                    await self.message_counter.backfill(channel)
+                except Exception as e:
+                    logger.error(f"Error backfilling channel {channel_id}: {e}")
+        
         # Start monitoring loop
         if not self.monitor_loop.is_running():
             self.monitor_loop.start()
     
+    async def on_message(self, message):
+        """Count every message, feed fork divergence, then dispatch commands"""
+        self.message_counter.record(message)
+        if message.content and not message.author.bot and not message.content.startswith(self.command_prefix):
+            # Fork threads are branches of their own; other channels are parents
+            self.curator_forks.contribute(str(message.channel.id), text=message.content,
+                                          timestamp=message.created_at.timestamp())
+        await self.process_commands(message)
+    
+    async def on_disconnect(self):
+        """Remember where live counting stopped"""
+        self.message_counter.mark_disconnected()
+    
+    async def on_resumed(self):
+        """Read the messages missed while disconnected"""
+        await self.message_counter.repair(self.get_channel)
+    
     async def get_channel_metrics(self, channel_id: int, hours: int = 24) -> TeamMetrics:
         """
         Collect metrics from Discord channel
         
+        Counts come from in-memory minute buckets; history is read only the
+        first time a channel's window isn't covered yet.
+        
         Args:
             channel_id: Channel ID to monitor
             hours: Timeframe in hours
@@ -113,16 +159,12 @@ class CuratorBot(commands.Bot):
         if not channel:
             return TeamMetrics(timestamp=datetime.now().isoformat())
         
-        # Count messages in timeframe
-        after = datetime.now() - timedelta(hours=hours)
-        message_count = 0
-        
-        async for message in channel.history(after=after, limit=None):
-            message_count += 1
+        if not self.message_counter.covers(channel_id, hours):
+            await self.message_counter.backfill(channel, hours)
         
         return TeamMetrics(
             timestamp=datetime.now().isoformat(),
-            discord_messages=message_count
+            discord_messages=self.message_counter.count(channel_id, hours)
         )
     
     async def send_zc_status(self, channel, result: ZcResult):
@@ -145,6 +187,7 @@ class CuratorBot(commands.Bot):
         embed.add_field(name="Zone", value=result.zone, inline=True)
         embed.add_field(name="Mode", value=result.mode, inline=True)
         embed.add_field(name="Trend", value=result.trend, inline=True)
+        embed.add_field(name="Committed Mode", value=result.committed_mode or result.mode, inline=True)
         
         embed.add_field(
             name="Recommendation",
@@ -223,11 +266,11 @@ class CuratorBot(commands.Bot):
         # Send status
         await self.send_zc_status(ctx.channel, result)
         
-        # Check for zone change
-        if self.last_zone and self.last_zone != result.zone:
-            await self.send_zone_change_alert(ctx.channel, self.last_zone, result.zone, result)
+        # Alert on committed mode changes only (hysteresis), not single-sample flips
+        if self.last_zone and self.last_zone != result.committed_zone:
+            await self.send_zone_change_alert(ctx.channel, self.last_zone, result.committed_zone, result)
         
-        self.last_zone = result.zone
+        self.last_zone = result.committed_zone
     
     async def _handle_gush(self, ctx, time: str):
         """Handle !gush command"""
@@ -236,6 +279,15 @@ class CuratorBot(commands.Bot):
     
     async def _handle_fork(self, ctx, name: str):
         """Handle !fork command"""
+        # Messages in the fork's thread become the fork's contributions
+        thread = None
+        try:
+            thread = await ctx.message.create_thread(name=name[:100])
+        except (discord.HTTPException, AttributeError, ValueError) as e:
+            logger.warning(f"Could not create a thread for fork '{name}': {e}")
+        
+        fork = self.curator_forks.open_fork(name, parent=str(ctx.channel.id), owner=str(ctx.author),
+                                            fork_id=str(thread.id) if thread else None)
         
         embed = discord.Embed(
             title="🌿 BHO Fork Declared",
@@ -245,6 +297,9 @@ class CuratorBot(commands.Bot):
         
         embed.add_field(name="Fork Name", value=name, inline=True)
         embed.add_field(name="Owner", value=ctx.author.mention, inline=True)
+        embed.add_field(name="Fork ID", value=thread.mention if thread else fork.fork_id, inline=True)
+        embed.add_field(name="Suggested Merge",
+                        value=f"<t:{int(fork.merge_due)}:D> at the latest", inline=True)
         
         embed.add_field(
             name="Template",
@@ -256,21 +311,16 @@ class CuratorBot(commands.Bot):
     
     async def _handle_status(self, ctx):
         """Handle !status command"""
-        # Get recent history
-        history = self.curator_monitor.get_history(hours=168)  # Last 7 days
+        # Get recent stats from the monitor's running totals
+        summary = self.curator_monitor.get_summary(hours=168)  # Last 7 days
         
-        if not history:
+        if not summary["count"]:
             await ctx.send("No history available yet. Run `!zc` to calculate Zc.")
             return
         
-        # Calculate stats
-        avg_zc = sum(r.zc for r in history) / len(history)
-        current = history[-1]
-        
-        # Zone distribution
-        zone_counts = {"GREEN": 0, "YELLOW": 0, "RED": 0}
-        for r in history:
-            zone_counts[r.zone] += 1
+        avg_zc = summary["avg_zc"]
+        current = self.curator_monitor.history.latest()
+        zone_counts = summary["zone_distribution"]
         
         embed = discord.Embed(
             title="📊 Team Status (Last 7 Days)",
@@ -289,6 +339,15 @@ class CuratorBot(commands.Bot):
             inline=False
         )
         
+        due = self.curator_forks.merge_now(limit=5)
+        if due:
+            embed.add_field(
+                name="🔀 Forks Ready to Merge",
+                value="\n".join(f"• {f.name} (`{f.fork_id}`): D={f.depth:.1f}, merge cost {f.merge_cost:.1f}"
+                                for f in due),
+                inline=False
+            )
+        
         await ctx.send(embed=embed)
     
     @tasks.loop(minutes=60)
@@ -310,11 +369,11 @@ class CuratorBot(commands.Bot):
                 # Calculate Zc
                 result = self.curator_monitor.calculate_zc(metrics)
                 
-                # Check for zone change
-                if self.last_zone and self.last_zone != result.zone:
-                    await self.send_zone_change_alert(channel, self.last_zone, result.zone, result)
+                # Alert on committed mode changes only (hysteresis)
+                if self.last_zone and self.last_zone != result.committed_zone:
+                    await self.send_zone_change_alert(channel, self.last_zone, result.committed_zone, result)
                 
-                self.last_zone = result.zone
+                self.last_zone = result.committed_zone
                 
         except Exception as e:
             logger.error(f"Error in monitoring loop: {e}")
@@ -325,6 +384,7 @@ def main():
     # Configuration
     BOT_TOKEN = os.environ.get("DISCORD_BOT_TOKEN")
     TEAM_SIZE = int(os.environ.get("TEAM_SIZE", "10"))
+    CHANNEL_IDS = [int(c) for c in os.environ.get("DISCORD_CHANNEL_IDS", "").split(",") if c.strip()]
     
     if not BOT_TOKEN:
         print("Error: DISCORD_BOT_TOKEN environment variable required")
@@ -340,7 +400,7 @@ def main():
         logger.warning("Recommender not available (no API key)")
     
     # Initialize and run bot
-    bot = CuratorBot(monitor, recommender)
+    bot = CuratorBot(monitor, recommender, channel_ids=CHANNEL_IDS)
     
     print("Starting Discord bot...")
     print("Commands: !zc, !gush, !fork, !status")
@@ -349,6 +409,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # Need to add import for timedelta
-    from datetime import timedelta
     main()
@@ -0,0 +1,203 @@
+"""
+Discord Message Counter
+
+Live per-channel message counts for the Discord bot:
+- ``record(message)`` counts messages as they arrive (from on_message)
+- ``sync(channel, since)`` reads channel history once to fill what live
+  events can't see: the window before the bot started (backfill) and
+  messages sent while it was disconnected (gap repair)
+- ``count(channel_id, hours)`` answers from minute buckets, no API calls
+
+Messages seen by both paths are counted once (recent message IDs are
+remembered per channel). Works with discord.py channel/message objects or
+anything exposing ``id``, ``created_at`` and ``history(after=..., limit=None)``.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Set
+import logging
+
+sys.path.insert(0, os.path.dirname(__file__) + '/../../curator-ai')
+
+from counters import BucketCounter
+
+logger = logging.getLogger(__name__)
+
+
+class _RecentIds:
+    """Bounded set of the most recently counted message IDs"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.order = deque()
+        self.ids: Set[int] = set()
+
+    def add(self, message_id: int) -> bool:
+        """Remember message_id; False if it was already remembered"""
+        if message_id in self.ids:
+            return False
+        self.ids.add(message_id)
+        self.order.append(message_id)
+        if len(self.order) > self.size:
+            self.ids.discard(self.order.popleft())
+        return True
+
+
+class DiscordMessageCounter:
+    """
+    Minute-bucketed Discord message counts fed by live events
+    """
+
+    def __init__(self,
+                 bucket_seconds: int = 60,
+                 retention_hours: float = 168,
+                 dedupe_window: int = 2048):
+        """
+        Initialize counter
+
+        Args:
+            bucket_seconds: Width of each count bucket
+            retention_hours: Longest window that can be answered
+            dedupe_window: Recent message IDs remembered per channel
+        """
+        self.counter = BucketCounter(bucket_seconds=bucket_seconds,
+                                     retention_hours=retention_hours)
+        self.dedupe_window = dedupe_window
+        self._recent: Dict[int, _RecentIds] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._gap_marks: Dict[int, float] = {}
+        self.live_since: Optional[float] = None
+
+    def mark_connected(self):
+        """Start live counting (call from on_ready)"""
+        if self.live_since is None:
+            self.live_since = time.time()
+
+    def _count(self, channel_id: int, message_id: int, created_at: datetime) -> bool:
+        recent = self._recent.get(channel_id)
+        if recent is None:
+            recent = self._recent[channel_id] = _RecentIds(self.dedupe_window)
+        if not recent.add(message_id):
+            return False
+        self.counter.add(str(channel_id), created_at.timestamp())
+        return True
+
+    def record(self, message) -> bool:
+        """
+        Count a live message
+
+        Args:
+            message: discord.Message (or compatible)
+
+        Returns:
+            False if the message was already counted
+        """
+        key = str(message.channel.id)
+        if self.live_since is not None and self.counter.covered_since(key) is None:
+            # Every message since the bot connected reaches on_message
+            self.counter.mark_covered(key, self.live_since)
+        return self._count(message.channel.id, message.id, message.created_at)
+
+    def _lock(self, channel_id: int) -> asyncio.Lock:
+        lock = self._locks.get(channel_id)
+        if lock is None:
+            lock = self._locks[channel_id] = asyncio.Lock()
+        return lock
+
+    async def sync(self, channel, since: float, until: Optional[float] = None) -> int:
+        """
+        Count history messages after ``since`` that live events missed
+
+        Args:
+            channel: discord.TextChannel (or compatible)
+            since: Unix timestamp to read history from
+            until: Optional Unix timestamp to stop at (default: now)
+
+        Returns:
+            Number of newly counted messages
+        """
+        after = datetime.fromtimestamp(since, tz=timezone.utc)
+        before = datetime.fromtimestamp(until, tz=timezone.utc) if until is not None else None
+        added = 0
+        async for message in channel.history(after=after, before=before, limit=None):
+            if self._count(channel.id, message.id, message.created_at):
+                added += 1
+        return added
+
+    async def backfill(self, channel, hours: float = 24) -> int:
+        """
+        Make sure the channel's counts cover the last ``hours``
+
+        Only the part of the window not yet covered is read from history
+        (nothing at all once the channel is covered).
+
+        Args:
+            channel: discord.TextChannel (or compatible)
+            hours: Window that must be covered
+
+        Returns:
+            Number of messages read from history
+        """
+        key = str(channel.id)
+        async with self._lock(channel.id):
+            window_start = time.time() - hours * 3600
+            if self.counter.covers(key, window_start):
+                return 0
+            # Live events already cover everything after a previous backfill
+            added = await self.sync(channel, window_start, until=self.counter.covered_since(key))
+            self.counter.mark_covered(key, window_start)
+            logger.info(f"Backfilled {added} messages for channel {channel.id}")
+            return added
+
+    def mark_disconnected(self, channel_ids: Optional[Iterable[int]] = None):
+        """
+        Remember where live counting stopped (call from on_disconnect)
+
+        Args:
+            channel_ids: Channels to repair later (default: all counted channels)
+        """
+        if channel_ids is None:
+            channel_ids = set(self._recent) | {int(key) for key in self.counter.keys()}
+        now = time.time()
+        for channel_id in channel_ids:
+            if channel_id in self._gap_marks:
+                continue  # Keep the earliest mark across repeated disconnects
+            key = str(channel_id)
+            self._gap_marks[channel_id] = self.counter.latest(key) or \
+                self.counter.covered_since(key) or now
+
+    async def repair(self, get_channel) -> int:
+        """
+        Read history for every channel with a pending gap (after reconnects)
+
+        Args:
+            get_channel: Callable returning a channel for an ID (e.g. bot.get_channel)
+
+        Returns:
+            Number of messages recovered
+        """
+        recovered = 0
+        for channel_id, mark in list(self._gap_marks.items()):
+            channel = get_channel(channel_id)
+            if channel is None:
+                self._gap_marks.pop(channel_id, None)
+                continue
+            async with self._lock(channel_id):
+                recovered += await self.sync(channel, mark)
+            self._gap_marks.pop(channel_id, None)
+        if recovered:
+            logger.info(f"Recovered {recovered} messages sent while disconnected")
+        return recovered
+
+    def count(self, channel_id: int, hours: float = 24) -> int:
+        """Messages in the channel during the last ``hours`` (minute precision)"""
+        return self.counter.total(hours, keys=[str(channel_id)])
+
+    def covers(self, channel_id: int, hours: float = 24) -> bool:
+        """True if counts for the last ``hours`` are complete"""
+        return self.counter.covers(str(channel_id), time.time() - hours * 3600)
@@ -7,19 +7,24 @@ Provides slash commands and automated monitoring:
 - /fork - Declare BHO fork
 - /status - Team status dashboard
 
-Also sends automated notifications when zones change.
+Also sends automated notifications when zones change. With an app-level
+token the bot listens over Socket Mode, and channel messages feed fork
+divergence.
 """
 
 import os
 import json
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 try:
     from slack_sdk import WebClient
     from slack_sdk.errors import SlackApiError
+    from slack_sdk.socket_mode import SocketModeClient
+    from slack_sdk.socket_mode.response import SocketModeResponse
     SLACK_SDK_AVAILABLE = True
 except ImportError:
     SLACK_SDK_AVAILABLE = False
@@ -27,8 +32,11 @@ except ImportError:
 
 # Import curator modules (handle if not in path)
 import sys
-sys.path.insert(0, os.path.dirname(__file__) + '/../curator-ai')
+sys.path.insert(0, os.path.dirname(__file__) + '/../../curator-ai')
+sys.path.insert(0, os.path.dirname(__file__))
 
+from collector import IncrementalSlackCollector
+from forks import ForkRegistry
 from monitor import CuratorMonitor, MetricsCollector, TeamMetrics, ZcResult
 from recommender import CuratorRecommender
 
@@ -46,7 +54,10 @@ class SlackBot:
     def __init__(self, 
                  bot_token: str,
                  monitor: CuratorMonitor,
-                 recommender: Optional[CuratorRecommender] = None):
+                 recommender: Optional[CuratorRecommender] = None,
+                 max_workers: int = 8,
+                 state_path: Optional[str] = None,
+                 forks: Optional[ForkRegistry] = None):
         """
         Initialize Slack bot
         
@@ -54,14 +65,23 @@ class SlackBot:
             bot_token: Slack Bot User OAuth Token
             monitor: CuratorMonitor instance
             recommender: Optional CuratorRecommender for AI advice
+            max_workers: Maximum channels fetched concurrently
+            state_path: Optional JSON file persisting per-channel message counts
+            forks: Fork registry tracking /fork declarations (default: new one)
         """
         if not SLACK_SDK_AVAILABLE:
             raise ImportError("Slack SDK required. Install: pip install slack-sdk")
         
         self.client = WebClient(token=bot_token)
+        self.collector = IncrementalSlackCollector(self.client,
+                                                   state_path=state_path,
+                                                   max_workers=max_workers)
         self.monitor = monitor
         self.recommender = recommender
-        self.last_zone = None  # Track zone changes
+        self.forks = forks if forks is not None else ForkRegistry()
+        # (channel, thread ts) of each fork's announcement -> fork ID
+        self.fork_threads: Dict[Tuple[str, str], str] = {}
+        self.last_zone = None  # Last committed zone (alerts fire on changes)
         
         logger.info("Slack Bot initialized")
     
@@ -71,6 +91,9 @@ class SlackBot:
         """
         Collect metrics from Slack channels
         
+        Only messages newer than each channel's last seen message are
+        fetched; window totals come from the collector's bucketed counts.
+        
         Args:
             channel_ids: List of channel IDs to monitor
             hours: Timeframe in hours
@@ -78,36 +101,83 @@ class SlackBot:
         Returns:
             TeamMetrics with Slack message counts
         """
-        total_messages = 0
-        oldest_timestamp = time.time() - (hours * 3600)
-        
-        for channel_id in channel_ids:
-            try:
-                response = self.client.conversations_history(
-                    channel=channel_id,
-                    oldest=oldest_timestamp
-                )
-                total_messages += len(response['messages'])
-                
-            except SlackApiError as e:
-                logger.error(f"Error fetching messages from {channel_id}: {e}")
+        counts = self.collector.collect(channel_ids, hours=hours)
         
         return TeamMetrics(
             timestamp=datetime.now().isoformat(),
-            slack_messages=total_messages
+            slack_messages=sum(counts.values())
         )
     
     def send_message(self, channel: str, text: str, blocks: Optional[List] = None):
-        """Send message to Slack channel"""
+        """Send message to Slack channel; returns the API response (None on error)"""
         try:
-            self.client.chat_postMessage(
+            response = self.client.chat_postMessage(
                 channel=channel,
                 text=text,
                 blocks=blocks
             )
             logger.info(f"Message sent to {channel}")
+            return response
         except SlackApiError as e:
             logger.error(f"Error sending message: {e}")
+            return None
+    
+    def connect(self, app_token: str) -> 'SocketModeClient':
+        """
+        Open a Socket Mode connection that delivers events to handle_event()
+        
+        The Slack app needs Socket Mode enabled and a subscription to the
+        ``message.channels`` bot event.
+        
+        Args:
+            app_token: App-level token (xapp-...) with ``connections:write``
+            
+        Returns:
+            The connected SocketModeClient (events arrive on its threads)
+        """
+        socket_client = SocketModeClient(app_token=app_token, web_client=self.client)
+        socket_client.socket_mode_request_listeners.append(self._on_socket_request)
+        socket_client.connect()
+        logger.info("Listening for Slack events over Socket Mode")
+        return socket_client
+    
+    def _on_socket_request(self, socket_client, request):
+        """Acknowledge a Socket Mode envelope, then dispatch its event"""
+        socket_client.send_socket_mode_response(
+            SocketModeResponse(envelope_id=request.envelope_id))
+        if request.type == "events_api":
+            try:
+                self.handle_event(request.payload)
+            except Exception as e:
+                logger.error(f"Error handling Slack event: {e}")
+    
+    def handle_event(self, payload: Dict):
+        """
+        Dispatch an Events API payload (``event_callback`` body)
+        
+        Args:
+            payload: Payload as delivered by Socket Mode or the Events API
+        """
+        event = payload.get('event', {})
+        if event.get('type') == 'message':
+            self.handle_message_event(event)
+    
+    def handle_message_event(self, event: Dict):
+        """
+        Feed a Slack message event (Events API) into fork divergence
+        
+        Replies in a fork's thread are the fork's contributions; other
+        messages are contributions to their channel, the forks' parent.
+        
+        Args:
+            event: ``message`` event payload (channel, text, ts, thread_ts)
+        """
+        # Skip edits, joins and other subtypes, and bot messages
+        if event.get('subtype') or event.get('bot_id') or not event.get('text'):
+            return
+        channel = event['channel']
+        branch = self.fork_threads.get((channel, event.get('thread_ts')), channel)
+        self.forks.contribute(branch, text=event['text'], timestamp=float(event['ts']))
     
     def send_zc_status(self, channel: str, result: ZcResult):
         """Send formatted Zc status to channel"""
@@ -145,6 +215,10 @@ class SlackBot:
                     {
                         "type": "mrkdwn",
                         "text": f"*Trend:*\n{result.trend}"
+                    },
+                    {
+                        "type": "mrkdwn",
+                        "text": f"*Committed Mode:*\n{result.committed_mode or result.mode}"
                     }
                 ]
             },
@@ -281,11 +355,11 @@ class SlackBot:
         # Send status
         self.send_zc_status(channel, result)
         
-        # Check for zone change
-        if self.last_zone and self.last_zone != result.zone:
-            self.send_zone_change_alert(channel, self.last_zone, result.zone, result)
+        # Alert on committed mode changes only (hysteresis), not single-sample flips
+        if self.last_zone and self.last_zone != result.committed_zone:
+            self.send_zone_change_alert(channel, self.last_zone, result.committed_zone, result)
         
-        self.last_zone = result.zone
+        self.last_zone = result.committed_zone
         
         return "Zc calculated successfully"
     
@@ -300,37 +374,37 @@ class SlackBot:
     def _handle_fork_command(self, channel: str, user: str, **kwargs) -> str:
         """Handle /fork command"""
         fork_name = kwargs.get('name', 'New Fork')
+        fork = self.forks.open_fork(fork_name, parent=channel, owner=user)
+        merge_by = datetime.fromtimestamp(fork.merge_due).strftime('%a %d %b')
         
         blocks = [
             {
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"🌿 *BHO Fork Declared*\n\nFork: {fork_name}\nOwner: <@{user}>\n\nUse the BHO template to structure your fork:\nhttps://github.com/pyragogy/protocols/blob/main/tools/templates/BHO-FORK-TEMPLATE.md"
+                    "text": f"🌿 *BHO Fork Declared*\n\nFork: {fork_name} (`{fork.fork_id}`)\nOwner: <@{user}>\nSuggested merge: {merge_by} at the latest\nReply in this thread to work on the fork.\n\nUse the BHO template to structure your fork:\nhttps://github.com/pyragogy/protocols/blob/main/tools/templates/BHO-FORK-TEMPLATE.md"
                 }
             }
         ]
         
-        self.send_message(channel, f"BHO Fork: {fork_name}", blocks)
+        # Replies to the announcement become the fork's contributions
+        response = self.send_message(channel, f"BHO Fork: {fork_name}", blocks)
+        if response is not None:
+            self.fork_threads[(response["channel"], response["ts"])] = fork.fork_id
         
-        return f"Fork '{fork_name}' declared"
+        return f"Fork '{fork_name}' declared ({fork.fork_id})"
     
     def _handle_status_command(self, channel: str, **kwargs) -> str:
         """Handle /status command"""
-        # Get recent history
-        history = self.monitor.get_history(hours=168)  # Last 7 days
+        # Get recent stats from the monitor's running totals
+        summary = self.monitor.get_summary(hours=168)  # Last 7 days
         
-        if not history:
+        if not summary["count"]:
             return "No history available yet. Run /zc to calculate Zc."
         
-        # Calculate stats
-        avg_zc = sum(r.zc for r in history) / len(history)
-        current = history[-1]
-        
-        # Zone distribution
-        zone_counts = {"GREEN": 0, "YELLOW": 0, "RED": 0}
-        for r in history:
-            zone_counts[r.zone] += 1
+        avg_zc = summary["avg_zc"]
+        current = self.monitor.history.latest()
+        zone_counts = summary["zone_distribution"]
         
         blocks = [
             {
@@ -370,6 +444,18 @@ class SlackBot:
             }
         ]
         
+        due = self.forks.merge_now(limit=5)
+        if due:
+            lines = "\n".join(f"• {f.name} (`{f.fork_id}`): D={f.depth:.1f}, merge cost {f.merge_cost:.1f}"
+                              for f in due)
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*🔀 Forks ready to merge:*\n{lines}"
+                }
+            })
+        
         self.send_message(channel, "Team Status", blocks)
         
         return "Status sent"
@@ -408,6 +494,8 @@ def main():
     BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
     CHANNEL = os.environ.get("SLACK_CHANNEL", "#team")
     TEAM_SIZE = int(os.environ.get("TEAM_SIZE", "10"))
+    STATE_PATH = os.environ.get("SLACK_COUNTER_STATE")
+    APP_TOKEN = os.environ.get("SLACK_APP_TOKEN")  # Socket Mode (optional)
     
     if not BOT_TOKEN:
         print("Error: SLACK_BOT_TOKEN environment variable required")
@@ -423,12 +511,20 @@ def main():
         logger.warning("Recommender not available (no API key)")
     
     # Initialize bot
-    bot = SlackBot(BOT_TOKEN, monitor, recommender)
+    bot = SlackBot(BOT_TOKEN, monitor, recommender, state_path=STATE_PATH)
     
     # Example: Calculate and send Zc
     print(f"Calculating Zc for {CHANNEL}...")
     bot._handle_zc_command(CHANNEL)
     
+    # Channel messages and fork thread replies feed fork divergence
+    if APP_TOKEN:
+        bot.connect(APP_TOKEN)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            logger.info("Stopped by user")
+    
     # To run continuous monitoring:
     # bot.monitor_loop(CHANNEL, interval_minutes=60)
 
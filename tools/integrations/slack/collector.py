@@ -0,0 +1,294 @@
+"""
+Slack Channel Metrics Collector
+
+Counts messages across many Slack channels:
+- Follows conversations.history cursor pagination (no first-page undercount)
+- Asks for the largest page Slack allows and skips message metadata
+- Fetches channels concurrently on a bounded worker pool
+- Honors Slack rate limiting (HTTP 429 + Retry-After) with retries
+
+IncrementalSlackCollector additionally keeps a per-channel high-water mark
+and time-bucketed counts, so each poll only fetches messages newer than the
+last one seen.
+
+Works with a slack_sdk WebClient or any object exposing the same
+``conversations_history`` method (e.g. a fake client in tests).
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
+import logging
+
+sys.path.insert(0, os.path.dirname(__file__) + '/../../curator-ai')
+
+from counters import BucketCounter
+
+try:
+    from slack_sdk.errors import SlackApiError
+except ImportError:
+    class SlackApiError(Exception):
+        """Stand-in for slack_sdk.errors.SlackApiError"""
+
+        def __init__(self, message, response):
+            super().__init__(message)
+            self.response = response
+
+logger = logging.getLogger(__name__)
+
+# conversations.history returns at most 999 messages per page
+PAGE_LIMIT = 999
+
+
+def _retry_after(error: SlackApiError) -> Optional[float]:
+    """Seconds to wait if error is a rate limit, else None"""
+    response = getattr(error, "response", None)
+    if response is None or getattr(response, "status_code", None) != 429:
+        return None
+
+    headers = getattr(response, "headers", None) or {}
+    for name, value in headers.items():
+        if name.lower() == "retry-after":
+            if isinstance(value, (list, tuple)):
+                value = value[0]
+            try:
+                return max(0.0, float(value))
+            except (TypeError, ValueError):
+                break
+    return 1.0
+
+
+class SlackChannelCollector:
+    """
+    Concurrent, paginated message counter for Slack channels
+    """
+
+    def __init__(self,
+                 client,
+                 max_workers: int = 8,
+                 page_limit: int = PAGE_LIMIT,
+                 max_retries: int = 5,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize collector
+
+        Args:
+            client: slack_sdk WebClient (or compatible)
+            max_workers: Maximum channels fetched concurrently
+            page_limit: Messages requested per page
+            max_retries: Rate-limit retries per request before giving up
+            sleep: Sleep function (injectable for tests)
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.client = client
+        self.max_workers = max_workers
+        self.page_limit = page_limit
+        self.max_retries = max_retries
+        self.sleep = sleep
+
+    def _history_page(self, **kwargs) -> Dict:
+        """One conversations.history call, retried on rate limits"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.client.conversations_history(**kwargs)
+            except SlackApiError as e:
+                wait = _retry_after(e)
+                if wait is None or attempt == self.max_retries:
+                    raise
+                logger.warning(f"Rate limited on {kwargs.get('channel')}, retrying in {wait}s")
+                self.sleep(wait)
+
+    def iter_timestamps(self,
+                        channel_id: str,
+                        oldest: float,
+                        latest: Optional[float] = None) -> Iterator[float]:
+        """
+        Yield the timestamp of every message between oldest and latest
+
+        Args:
+            channel_id: Channel ID
+            oldest: Only include messages after this Unix timestamp
+            latest: Only include messages before this Unix timestamp
+
+        Yields:
+            Message timestamps (newest first, as Slack returns them)
+        """
+        request = {
+            "channel": channel_id,
+            "oldest": str(oldest),
+            "limit": self.page_limit,
+            "include_all_metadata": False,
+        }
+        if latest is not None:
+            request["latest"] = str(latest)
+
+        cursor = None
+        while True:
+            if cursor:
+                request["cursor"] = cursor
+            response = self._history_page(**request)
+            for message in response.get("messages", []):
+                yield float(message["ts"])
+
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                return
+
+    def count_messages(self,
+                       channel_id: str,
+                       oldest: float,
+                       latest: Optional[float] = None) -> int:
+        """
+        Count all messages in a channel between oldest and latest
+
+        Args:
+            channel_id: Channel ID
+            oldest: Only count messages after this Unix timestamp
+            latest: Only count messages before this Unix timestamp
+
+        Returns:
+            Number of messages
+        """
+        return sum(1 for _ in self.iter_timestamps(channel_id, oldest, latest))
+
+    def collect(self, channel_ids: List[str], hours: float = 24) -> Dict[str, int]:
+        """
+        Count messages of the last ``hours`` in every channel concurrently
+
+        Channels that fail (after rate-limit retries) are logged and left out.
+
+        Args:
+            channel_ids: Channel IDs
+            hours: Timeframe in hours
+
+        Returns:
+            Message count per channel ID
+        """
+        oldest = time.time() - hours * 3600
+        counts = {}
+
+        def count(channel_id):
+            try:
+                return channel_id, self.count_messages(channel_id, oldest)
+            except SlackApiError as e:
+                logger.error(f"Error fetching messages from {channel_id}: {e}")
+                return channel_id, None
+
+        workers = min(self.max_workers, len(channel_ids)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for channel_id, value in pool.map(count, channel_ids):
+                if value is not None:
+                    counts[channel_id] = value
+
+        return counts
+
+
+class IncrementalSlackCollector(SlackChannelCollector):
+    """
+    Slack collector that fetches each message once
+
+    Message timestamps go into a BucketCounter; each channel's high-water
+    mark (newest ``ts`` seen) is where the next fetch starts, so a poll costs
+    O(new messages) instead of O(messages in the window). A channel is
+    (re)fetched in full only the first time it is seen or when a larger window
+    than it covers is requested. With ``state_path`` the counter is saved
+    after every collection and reloaded on startup.
+    """
+
+    def __init__(self,
+                 client,
+                 state_path: Optional[str] = None,
+                 bucket_seconds: int = 300,
+                 retention_hours: float = 168,
+                 **kwargs):
+        """
+        Initialize collector
+
+        Args:
+            client: slack_sdk WebClient (or compatible)
+            state_path: Optional JSON file persisting counts and high-water marks
+            bucket_seconds: Width of each count bucket
+            retention_hours: Longest window that can be served from buckets
+            **kwargs: SlackChannelCollector options
+        """
+        super().__init__(client, **kwargs)
+        self.state_path = state_path
+        if state_path:
+            self.counter = BucketCounter.load(state_path, bucket_seconds=bucket_seconds,
+                                              retention_hours=retention_hours)
+        else:
+            self.counter = BucketCounter(bucket_seconds=bucket_seconds,
+                                         retention_hours=retention_hours)
+        self._save_lock = threading.Lock()
+
+    def refresh_channel(self, channel_id: str, window_start: float) -> int:
+        """
+        Fetch a channel's new messages into the counter
+
+        Args:
+            channel_id: Channel ID
+            window_start: Counts must be complete from this Unix timestamp
+
+        Returns:
+            Number of messages fetched
+        """
+        if self.counter.covers(channel_id, window_start):
+            oldest = self.counter.latest(channel_id) or self.counter.covered_since(channel_id)
+            fresh = False
+        else:
+            oldest = window_start
+            fresh = True
+
+        # Collect first so a failed fetch leaves the previous state intact
+        timestamps = list(self.iter_timestamps(channel_id, oldest))
+        if fresh:
+            self.counter.reset(channel_id, window_start)
+        for ts in timestamps:
+            self.counter.add(channel_id, ts)
+        return len(timestamps)
+
+    def collect(self, channel_ids: List[str], hours: float = 24) -> Dict[str, int]:
+        """
+        Refresh every channel concurrently and count the last ``hours``
+
+        Channels that fail to refresh are logged and left out.
+
+        Args:
+            channel_ids: Channel IDs
+            hours: Timeframe in hours
+
+        Returns:
+            Message count per channel ID
+        """
+        now = time.time()
+        window_start = now - hours * 3600
+
+        def refresh(channel_id):
+            try:
+                self.refresh_channel(channel_id, window_start)
+                return channel_id, True
+            except SlackApiError as e:
+                logger.error(f"Error fetching messages from {channel_id}: {e}")
+                return channel_id, False
+
+        workers = min(self.max_workers, len(channel_ids)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            refreshed = [cid for cid, ok in pool.map(refresh, channel_ids) if ok]
+
+        self.save()
+        return self.counter.counts(hours, now=now, keys=refreshed)
+
+    def save(self):
+        """Persist counts and high-water marks (if state_path is set)"""
+        if not self.state_path:
+            return
+        with self._save_lock:
+            try:
+                self.counter.save(self.state_path)
+            except OSError as e:
+                logger.warning(f"Failed to save Slack counter state: {e}")